@@ -0,0 +1,79 @@
+import argparse
+import random
+import sys
+import timeit
+from datetime import datetime, timedelta
+from typing import Any, List
+
+from src.application.dto import ProcessingRequestDTO, Columns
+from src.application.interactors.process_excel_interactor import ProcessExcelInteractor
+from src.application.predicates import compile_filter
+from src.application.vectorized import compile_vectorized_filter
+
+POSITIONS = ["Инженер", "Менеджер", "Бухгалтер", "Аналитик", "Юрист", "Техник"]
+
+CASES = [
+    (Columns.POSITION, "  инженер "),
+    (Columns.SALARY, "50000"),
+    (Columns.HIRE_DATE, "19.10.2025"),
+    (Columns.SALARY, "50000..70000"),
+    (Columns.HIRE_DATE, ">=15.10.2025"),
+]
+
+
+def make_cells(column: Columns, n: int, rnd: random.Random) -> List[Any]:
+    if column == Columns.SALARY:
+        return [rnd.choice([50000.0, 60000, "50000", None, 70000.5]) for _ in range(n)]
+    if column == Columns.HIRE_DATE:
+        base = datetime(2025, 10, 1)
+        return [rnd.choice([base + timedelta(days=rnd.randint(0, 30)), None, "19.10.2025"]) for _ in range(n)]
+    return [rnd.choice(POSITIONS + [p.upper() for p in POSITIONS] + [None, 42]) for _ in range(n)]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Per-row cost of the compiled filter vs _compare_values")
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    rnd = random.Random(42)
+    interactor = ProcessExcelInteractor(fs=None, reader=None, writer=None)
+
+    print(f"{'column':<12} {'_compare_values':>18} {'compiled':>12} {'speedup':>9} {'numpy':>12} {'speedup':>9}")
+    for column, raw in CASES:
+        value = interactor._parse_filter_value(column, raw)
+        request = ProcessingRequestDTO("", "", column, raw, filter_value=value)
+        cells = make_cells(column, args.rows, rnd)
+
+        def baseline():
+            compare = interactor._compare_values
+            return sum(1 for c in cells if compare(c, value, column))
+
+        def compiled():
+            matches = compile_filter(request)
+            return sum(1 for c in cells if matches(c))
+
+        def vectorized():
+            return len(compile_vectorized_filter(request).positions(cells))
+
+        expected = baseline()
+        if expected != compiled():
+            print(f"{column.value}: results differ", file=sys.stderr)
+            return 1
+
+        base_ns = min(timeit.repeat(baseline, number=1, repeat=args.repeat)) / args.rows * 1e9
+        comp_ns = min(timeit.repeat(compiled, number=1, repeat=args.repeat)) / args.rows * 1e9
+        line = f"{column.value:<12} {base_ns:>15.1f} ns {comp_ns:>9.1f} ns {base_ns / comp_ns:>8.2f}x"
+        if compile_vectorized_filter(request) is not None:
+            if expected != vectorized():
+                print(f"{column.value}: numpy results differ", file=sys.stderr)
+                return 1
+            vec_ns = min(timeit.repeat(vectorized, number=1, repeat=args.repeat)) / args.rows * 1e9
+            line += f" {vec_ns:>9.1f} ns {base_ns / vec_ns:>8.2f}x"
+        print(line)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
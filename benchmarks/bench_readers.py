@@ -0,0 +1,63 @@
+import argparse
+import sys
+import time
+from itertools import zip_longest
+from typing import Any, Sequence
+
+from src.infrastructure.native_xlsx_reader import NativeXlsxReader
+from src.infrastructure.openpyxl_reader import OpenPyxlExcelReader
+
+
+def _normalize(row: Sequence[Any]) -> tuple:
+    values = list(row)
+    while values and values[-1] is None:
+        values.pop()
+    return tuple(values)
+
+
+def check_equivalent(path: str) -> int:
+    mismatches = 0
+    pairs = zip_longest(OpenPyxlExcelReader().iter_rows(path), NativeXlsxReader().iter_rows(path))
+    for row_no, (expected, actual) in enumerate(pairs, start=1):
+        expected = _normalize(expected or ())
+        actual = _normalize(actual or ())
+        if expected != actual:
+            mismatches += 1
+            if mismatches <= 10:
+                print(f"row {row_no}: openpyxl={expected!r} native={actual!r}", file=sys.stderr)
+    return mismatches
+
+
+def time_reader(reader, path: str, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _row in reader.iter_rows(path):
+            pass
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Compare NativeXlsxReader with OpenPyxlExcelReader")
+    parser.add_argument("paths", nargs="+", help="*.xlsx files to compare")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    failed = False
+    for path in args.paths:
+        mismatches = check_equivalent(path)
+        if mismatches:
+            failed = True
+            print(f"{path}: {mismatches} rows differ")
+            continue
+
+        openpyxl_s = time_reader(OpenPyxlExcelReader(), path, args.repeat)
+        native_s = time_reader(NativeXlsxReader(), path, args.repeat)
+        print(f"{path}: openpyxl {openpyxl_s:.3f}s, native {native_s:.3f}s, {openpyxl_s / native_s:.1f}x")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
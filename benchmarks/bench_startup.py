@@ -0,0 +1,135 @@
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+DEFAULT_MODULE = "src.presentation.main_window"
+DEFAULT_FORBIDDEN = ["openpyxl", "pydantic", "numpy", "multiprocessing", "concurrent.futures"]
+
+_IMPORTTIME_RE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+
+def import_times(module: str) -> List[Dict]:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else f"exit {proc.returncode}")
+
+    entries = []
+    for line in proc.stderr.splitlines():
+        m = _IMPORTTIME_RE.match(line)
+        if m:
+            entries.append({
+                "module": m.group(4),
+                "self_us": int(m.group(1)),
+                "cumulative_us": int(m.group(2)),
+                "depth": (len(m.group(3)) - 1) // 2,
+            })
+    return entries
+
+
+def forbidden_imports(entries: List[Dict], forbidden: List[str]) -> List[str]:
+    found = set()
+    for e in entries:
+        name = e["module"]
+        for f in forbidden:
+            if name == f or name.startswith(f + "."):
+                found.add(f)
+    return sorted(found)
+
+
+def gui_probe(module: str, runs: int) -> Optional[Dict[str, float]]:
+    best: Optional[Dict[str, float]] = None
+    for _ in range(runs):
+        with tempfile.TemporaryDirectory() as home:
+            env = dict(os.environ, HOME=home, USERPROFILE=home)
+            env.setdefault("QT_QPA_PLATFORM", "offscreen")
+            start = time.perf_counter()
+            proc = subprocess.run(
+                [sys.executable, "-m", module, "--startup-probe"],
+                capture_output=True,
+                text=True,
+                env=env,
+                timeout=120,
+            )
+            wall_ms = (time.perf_counter() - start) * 1000
+            record = _startup_record(os.path.join(home, ".cache", "excel_filter", "metrics.log"))
+        if proc.returncode != 0 or record is None:
+            raise RuntimeError(proc.stderr.strip() or "startup probe logged no timings")
+        run = {
+            "window_shown_ms": record["window_shown_ms"],
+            "ready_ms": record["ready_ms"],
+            "process_wall_ms": round(wall_ms, 1),
+        }
+        if best is None or run["process_wall_ms"] < best["process_wall_ms"]:
+            best = run
+    return best
+
+
+def _startup_record(path: str) -> Optional[Dict]:
+    try:
+        with open(path, encoding="utf-8") as f:
+            records = [json.loads(line) for line in f if line.strip()]
+    except OSError:
+        return None
+    return next((r for r in reversed(records) if r.get("event") == "startup"), None)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Startup import-time regression check based on -X importtime")
+    parser.add_argument("--module", default=DEFAULT_MODULE)
+    parser.add_argument("--max-ms", type=float, default=None, help="Fail if importing the module takes longer")
+    parser.add_argument("--forbid", nargs="*", default=DEFAULT_FORBIDDEN, help="Modules that must not load at startup")
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--gui", action="store_true", help="Also launch the window offscreen and time it")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args(argv)
+
+    entries = import_times(args.module)
+    target = next((e for e in entries if e["module"] == args.module), None)
+    total_ms = target["cumulative_us"] / 1000 if target else sum(e["self_us"] for e in entries) / 1000
+    leaked = forbidden_imports(entries, args.forbid)
+
+    report = {
+        "module": args.module,
+        "import_ms": round(total_ms, 1),
+        "forbidden_loaded": leaked,
+        "slowest": sorted(entries, key=lambda e: e["cumulative_us"], reverse=True)[:args.top],
+    }
+    if args.gui:
+        report["gui"] = gui_probe(args.module, args.runs)
+
+    failures = []
+    if leaked:
+        failures.append(f"loaded at startup: {', '.join(leaked)}")
+    if args.max_ms is not None and total_ms > args.max_ms:
+        failures.append(f"import took {total_ms:.1f} ms (limit {args.max_ms:.1f} ms)")
+    report["ok"] = not failures
+
+    if args.json:
+        json.dump(report, sys.stdout, ensure_ascii=False, indent=2)
+        sys.stdout.write("\n")
+    else:
+        print(f"{args.module}: {total_ms:.1f} ms")
+        for e in report["slowest"]:
+            print(f"{e['cumulative_us'] / 1000:>9.1f} ms  {'  ' * e['depth']}{e['module']}")
+        if args.gui:
+            gui = report["gui"]
+            print(f"window shown {gui['window_shown_ms']:.0f} ms, ready {gui['ready_ms']:.0f} ms, process {gui['process_wall_ms']:.0f} ms")
+        for f in failures:
+            print(f"FAIL: {f}", file=sys.stderr)
+
+    return 0 if not failures else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,187 @@
+import argparse
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import replace
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from benchmarks.synthetic import generate_workbook
+from src.application.dto import ProcessingRequestDTO, ProcessingResultDTO, Columns
+from src.application.interactors.process_excel_interactor import ProcessExcelInteractor
+from src.infrastructure.filesystem import LocalFileSystem
+from src.infrastructure.openpyxl_reader import OpenPyxlExcelReader
+from src.infrastructure.openpyxl_writer import OpenPyxlExcelWriter
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+STAGES = ["read", "find_header", "filter", "write", "end_to_end", "end_to_end_pipelined"]
+
+
+def measure(fn: Callable[[], Any], repeat: int, memory: bool) -> Tuple[float, Optional[int], Any]:
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+
+    peak = None
+    if memory:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            fn()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    return best, peak, result
+
+
+def run_size(
+    rows: int,
+    workdir: str,
+    *,
+    repeat: int,
+    memory: bool,
+    filter_column: Columns,
+    filter_value: str,
+) -> List[Dict[str, Any]]:
+    source = os.path.join(workdir, f"synthetic_{rows}.xlsx")
+    if not os.path.exists(source):
+        generate_workbook(source, rows)
+    target = os.path.join(workdir, f"result_{rows}.xlsx")
+
+    reader = OpenPyxlExcelReader()
+    writer = OpenPyxlExcelWriter()
+    interactor = ProcessExcelInteractor(fs=None, reader=reader, writer=writer)
+    headers = interactor._required_headers()
+    request = ProcessingRequestDTO(
+        source_path=source,
+        target_path=target,
+        filter_column=filter_column,
+        filter_value_raw=filter_value,
+    )
+    request = replace(request, filter_value=interactor._parse_filter_value(filter_column, filter_value))
+
+    timings: Dict[str, Tuple[float, Optional[int]]] = {}
+
+    seconds, peak, all_rows = measure(lambda: list(reader.iter_rows(source)), repeat, memory)
+    timings["read"] = (seconds, peak)
+
+    seconds, peak, header = measure(lambda: interactor._find_header_row(all_rows, headers), repeat, memory)
+    timings["find_header"] = (seconds, peak)
+    if header is None:
+        raise RuntimeError(f"{source}: header row not found")
+    col_index, header_idx = header
+    data_rows = all_rows[header_idx + 1:]
+
+    def run_filter() -> List[List[Any]]:
+        out = interactor._filter_rows(rows=data_rows, col_index=col_index, request=request, required_headers=headers)
+        return [] if isinstance(out, ProcessingResultDTO) else list(out)
+
+    seconds, peak, matched = measure(run_filter, repeat, memory)
+    timings["filter"] = (seconds, peak)
+
+    def run_write() -> None:
+        writer.write_table(target, headers, matched, generated_at_iso=datetime.now().isoformat(timespec="minutes"))
+
+    seconds, peak, _ = measure(run_write, repeat, memory)
+    timings["write"] = (seconds, peak)
+
+    for stage, pipelined in (("end_to_end", False), ("end_to_end_pipelined", True)):
+        full = ProcessExcelInteractor(fs=LocalFileSystem(), reader=reader, writer=writer, pipelined=pipelined)
+        seconds, peak, result = measure(lambda: full(replace(request, filter_value=None)), repeat, memory)
+        if not result.success and result.error_code != "no_matches":
+            raise RuntimeError(f"{source}: {result.message}")
+        timings[stage] = (seconds, peak)
+
+    results = []
+    for stage in STAGES:
+        seconds, peak = timings[stage]
+        stage_rows = len(matched) if stage == "write" else rows
+        results.append({
+            "rows": rows,
+            "stage": stage,
+            "seconds": round(seconds, 6),
+            "rows_per_second": round(stage_rows / seconds) if seconds > 0 else None,
+            "peak_bytes": peak,
+            "matched_rows": len(matched),
+        })
+    return results
+
+
+def git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True)
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(report: Dict[str, Any], baseline: Dict[str, Any], out=sys.stderr) -> None:
+    base = {(r["rows"], r["stage"]): r for r in baseline.get("results", [])}
+    print(f"{'rows':>9} {'stage':<12} {'baseline s':>11} {'current s':>10} {'change':>8}", file=out)
+    for r in report["results"]:
+        b = base.get((r["rows"], r["stage"]))
+        if b is None or not b["seconds"]:
+            continue
+        change = (r["seconds"] - b["seconds"]) / b["seconds"] * 100
+        print(f"{r['rows']:>9} {r['stage']:<12} {b['seconds']:>11.4f} {r['seconds']:>10.4f} {change:>+7.1f}%", file=out)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Time reading, header search, filtering and writing on synthetic workbooks")
+    parser.add_argument("--rows", type=int, nargs="+", default=DEFAULT_SIZES, help="Workbook sizes, e.g. 1000 100000 1000000")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--no-memory", action="store_true", help="Skip the tracemalloc pass used for peak memory")
+    parser.add_argument("--column", default=Columns.POSITION.name, choices=[c.name for c in Columns])
+    parser.add_argument("--value", default="Инженер")
+    parser.add_argument("--workdir", default=None, help="Where to keep generated workbooks between runs")
+    parser.add_argument("--output", default=None, help="Write the JSON report to this file")
+    parser.add_argument("--compare", default=None, help="Baseline JSON report to compare against")
+    args = parser.parse_args(argv)
+
+    workdir = args.workdir or os.path.join(tempfile.gettempdir(), "excel_filter_bench")
+    os.makedirs(workdir, exist_ok=True)
+
+    report: Dict[str, Any] = {
+        "commit": git_commit(),
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "filter": {"column": args.column, "value": args.value},
+        "results": [],
+    }
+    for rows in args.rows:
+        report["results"].extend(run_size(
+            rows,
+            workdir,
+            repeat=args.repeat,
+            memory=not args.no_memory,
+            filter_column=Columns[args.column],
+            filter_value=args.value,
+        ))
+
+    payload = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(payload + "\n")
+    else:
+        print(payload)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            compare(report, json.load(f))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
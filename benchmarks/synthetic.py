@@ -0,0 +1,85 @@
+import argparse
+import random
+import sys
+from datetime import datetime, timedelta
+from typing import Any, List
+
+import openpyxl
+
+from src.application.dto import Columns
+
+POSITIONS = ["Инженер", "Менеджер", "Бухгалтер", "Аналитик", "Юрист", "Техник"]
+DEPARTMENTS = ["Отдел продаж", "Бухгалтерия", "ИТ", "Юридический отдел", "Склад"]
+LAST_NAMES = ["Иванов", "Петров", "Сидоров", "Смирнов", "Кузнецов", "Попов", "Волков"]
+FIRST_NAMES = ["Иван", "Пётр", "Алексей", "Мария", "Анна", "Ольга", "Сергей"]
+
+
+def header_row(noise_columns: int) -> List[str]:
+    headers = [c.value for c in Columns]
+    noise = [f"Доп. поле {i}" for i in range(1, noise_columns + 1)]
+    half = len(noise) // 2
+    return noise[:half] + headers + noise[half:]
+
+
+def data_row(headers: List[str], rnd: random.Random, hire_base: datetime) -> List[Any]:
+    row = []
+    for h in headers:
+        if h == Columns.FIO.value:
+            row.append(f"{rnd.choice(LAST_NAMES)} {rnd.choice(FIRST_NAMES)}")
+        elif h == Columns.POSITION.value:
+            row.append(rnd.choice(POSITIONS))
+        elif h == Columns.DEPARTMENT.value:
+            row.append(rnd.choice(DEPARTMENTS))
+        elif h == Columns.HIRE_DATE.value:
+            row.append(hire_base + timedelta(days=rnd.randint(0, 3650)))
+        elif h == Columns.SALARY.value:
+            row.append(rnd.choice([40000, 50000, 60000, 75000.5, 90000]))
+        else:
+            row.append(rnd.choice([None, rnd.randint(0, 10**6), f"x{rnd.randint(0, 999)}"]))
+    return row
+
+
+def generate_workbook(
+    path: str,
+    rows: int,
+    *,
+    noise_columns: int = 6,
+    header_offset: int = 3,
+    seed: int = 42,
+) -> None:
+    rnd = random.Random(seed)
+    hire_base = datetime(2015, 1, 1)
+    headers = header_row(noise_columns)
+
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet("Сотрудники")
+    ws.append(["Выгрузка сотрудников"])
+    for _ in range(header_offset - 1):
+        ws.append([])
+    ws.append(headers)
+    for _ in range(rows):
+        ws.append(data_row(headers, rnd, hire_base))
+    wb.save(path)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Generate a synthetic employee workbook")
+    parser.add_argument("path")
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--noise-columns", type=int, default=6)
+    parser.add_argument("--header-offset", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    generate_workbook(
+        args.path,
+        args.rows,
+        noise_columns=args.noise_columns,
+        header_offset=args.header_offset,
+        seed=args.seed,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from src.application.dto import Columns
+
+SUMMARY_SHEET_TITLE = "Сводка"
+SUMMARY_HEADERS = (
+    Columns.DEPARTMENT.value,
+    Columns.POSITION.value,
+    "Численность",
+    "Сумма зарплат",
+    "Средняя зарплата",
+    "Мин. зарплата",
+    "Макс. зарплата",
+)
+TOTAL_LABEL = "Итого"
+
+
+@dataclass
+class SummarySheet:
+    title: str
+    headers: Sequence[str]
+    rows: Iterable[Sequence[Any]]
+
+
+class _Group:
+    __slots__ = ("count", "paid", "total", "low", "high")
+
+    def __init__(self):
+        self.count = 0
+        self.paid = 0
+        self.total = 0.0
+        self.low: Optional[float] = None
+        self.high: Optional[float] = None
+
+    def add(self, salary: Optional[float]) -> None:
+        self.count += 1
+        if salary is None:
+            return
+        self.paid += 1
+        self.total += salary
+        if self.low is None or salary < self.low:
+            self.low = salary
+        if self.high is None or salary > self.high:
+            self.high = salary
+
+    def merge(self, other: "_Group") -> None:
+        self.count += other.count
+        self.paid += other.paid
+        self.total += other.total
+        if other.low is not None and (self.low is None or other.low < self.low):
+            self.low = other.low
+        if other.high is not None and (self.high is None or other.high > self.high):
+            self.high = other.high
+
+    def values(self) -> List[Any]:
+        if not self.paid:
+            return [self.count, None, None, None, None]
+        return [self.count, self.total, round(self.total / self.paid, 2), self.low, self.high]
+
+
+class SalaryAggregator:
+    def __init__(self, headers: Sequence[str]):
+        headers = list(headers)
+        self._department_i = headers.index(Columns.DEPARTMENT.value)
+        self._position_i = headers.index(Columns.POSITION.value)
+        self._salary_i = headers.index(Columns.SALARY.value)
+        self._groups: Dict[Tuple[Any, Any], _Group] = {}
+
+    def track(self, rows: Iterable[Sequence[Any]]) -> Iterator[Sequence[Any]]:
+        add = self.add
+        for row in rows:
+            add(row)
+            yield row
+
+    def add(self, row: Sequence[Any]) -> None:
+        key = (row[self._department_i], row[self._position_i])
+        group = self._groups.get(key)
+        if group is None:
+            group = self._groups[key] = _Group()
+        group.add(_salary(row[self._salary_i]))
+
+    def sheet(self) -> SummarySheet:
+        return SummarySheet(SUMMARY_SHEET_TITLE, SUMMARY_HEADERS, self._iter_rows())
+
+    def _iter_rows(self) -> Iterator[List[Any]]:
+        total = _Group()
+        for (department, position), group in sorted(self._groups.items(), key=_group_order):
+            total.merge(group)
+            yield [department, position, *group.values()]
+        yield [TOTAL_LABEL, None, *total.values()]
+
+
+def _group_order(item: Tuple[Tuple[Any, Any], _Group]) -> Tuple[str, str]:
+    (department, position), _ = item
+    return _label(department), _label(position)
+
+
+def _label(value: Any) -> str:
+    return "" if value is None else str(value).strip().casefold()
+
+
+def _salary(value: Any) -> Optional[float]:
+    if value is None or isinstance(value, bool):
+        return None
+    try:
+        salary = float(value)
+    except (ValueError, TypeError):
+        return None
+    return None if salary != salary else salary
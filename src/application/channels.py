@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import queue
+from typing import Any, Iterator, List, Optional
+
+_DONE = object()
+
+
+class _Abort:
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+class RowChannel:
+    def __init__(self, max_chunks: int = 64, chunk_rows: int = 512):
+        self._queue: "queue.Queue[Any]" = queue.Queue(max_chunks)
+        self._chunk_rows = chunk_rows
+        self._chunk: List[Any] = []
+        self._failed = False
+
+    def put(self, row: Any) -> None:
+        self._chunk.append(row)
+        if len(self._chunk) >= self._chunk_rows:
+            self._flush()
+
+    def close(self) -> None:
+        self._flush()
+        self._send(_DONE)
+
+    def abort(self, error: BaseException) -> None:
+        self._chunk = []
+        self._send(_Abort(error))
+
+    def mark_failed(self) -> None:
+        self._failed = True
+        self._drain()
+
+    @property
+    def failed(self) -> bool:
+        return self._failed
+
+    def _drain(self) -> None:
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if item is _DONE or isinstance(item, _Abort):
+                return
+
+    def __iter__(self) -> Iterator[Any]:
+        for chunk in self.chunks():
+            yield from chunk
+
+    def chunks(self) -> Iterator[List[Any]]:
+        while True:
+            try:
+                item = self._queue.get(timeout=0.1)
+            except queue.Empty:
+                if self._failed:
+                    return
+                continue
+            if item is _DONE:
+                return
+            if isinstance(item, _Abort):
+                raise item.error
+            yield item
+
+    def _flush(self) -> None:
+        if self._chunk:
+            chunk, self._chunk = self._chunk, []
+            self._send(chunk)
+
+    def _send(self, item: Any, timeout: Optional[float] = 0.1) -> None:
+        while not self._failed:
+            try:
+                self._queue.put(item, timeout=timeout)
+                return
+            except queue.Full:
+                continue
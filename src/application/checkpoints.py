@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, Optional, Sequence
+
+from src.application.dto import ProcessingRequestDTO
+
+
+@dataclass(frozen=True)
+class Checkpoint:
+    rows_processed: int
+    prefix_hash: str
+    col_index: Dict[str, int] = field(default_factory=dict)
+    rows_matched: int = 0
+    output_size: Optional[int] = None
+    output_mtime_ns: Optional[int] = None
+
+
+def checkpoint_key(request: ProcessingRequestDTO) -> str:
+    key = hashlib.blake2b(digest_size=16)
+    for part in (
+        request.source_path,
+        request.filter_column.value,
+        request.filter_value_raw.strip(),
+        request.target_path,
+    ):
+        key.update(part.encode("utf-8", "surrogatepass") + b"\0")
+    return key.hexdigest()
+
+
+class PrefixHasher:
+    def __init__(self):
+        self._hash = hashlib.blake2b(digest_size=16)
+        self.rows = 0
+
+    def track(self, rows: Iterable[Sequence[Any]]) -> Iterator[Sequence[Any]]:
+        update = self._hash.update
+        for row in rows:
+            update(repr(tuple(row)).encode("utf-8", "surrogatepass") + b"\n")
+            self.rows += 1
+            yield row
+
+    def hexdigest(self) -> str:
+        return self._hash.hexdigest()
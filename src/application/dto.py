@@ -1,6 +1,6 @@
-from dataclasses import dataclass, replace
+from dataclasses import dataclass, field, replace
 from enum import Enum
-from typing import Optional, Any
+from typing import Optional, Any, Tuple
 
 
 class Columns(Enum):
@@ -11,6 +11,13 @@ class Columns(Enum):
     SALARY = "Зарплата"
 
 
+class ProcessingStage(Enum):
+    PREPARE = "Проверка параметров"
+    HEADER = "Поиск заголовка"
+    FILTER = "Чтение и фильтрация"
+    SAVE = "Сохранение результата"
+
+
 @dataclass(frozen=True)
 class ProcessingRequestDTO:
     source_path: str
@@ -20,13 +27,75 @@ class ProcessingRequestDTO:
 
     filter_value: Optional[Any] = None
 
+    all_sheets: bool = False
+    sheet_names: Tuple[str, ...] = ()
+    split_sheets: bool = False
+
+    source_paths: Tuple[str, ...] = ()
+    add_source_column: bool = False
+
+    incremental: bool = False
+
+    order_by: Optional[Columns] = None
+    order_descending: bool = False
+
+    summary: bool = False
+
     def with_parsed_filter_value(self, value: Any) -> "ProcessingRequestDTO":
         return replace(self, filter_value=value)
 
 
+@dataclass(frozen=True)
+class PartitionRequestDTO:
+    source_path: str
+    target_dir: str
+    partition_column: Columns
+
+
+@dataclass(frozen=True)
+class SheetCountDTO:
+    sheet_name: str
+    rows_read: int
+    rows_matched: int
+    header_found: bool = True
+
+
+@dataclass(frozen=True)
+class ProcessingMetricsDTO:
+    stage_seconds: Tuple[Tuple[str, float], ...] = ()
+    total_seconds: float = 0.0
+    rows_read: int = 0
+    rows_matched: int = 0
+    rows_per_second: float = 0.0
+    input_bytes: Optional[int] = None
+    output_bytes: Optional[int] = None
+    peak_rss_bytes: Optional[int] = None
+    peak_child_rss_bytes: Optional[int] = None
+
+
 @dataclass(frozen=True)
 class ProcessingResultDTO:
     success: bool
     message: str
     output_path: Optional[str] = None
-    error_code: Optional[str] = None
\ No newline at end of file
+    error_code: Optional[str] = None
+    output_paths: Tuple[str, ...] = ()
+    sheet_counts: Tuple[SheetCountDTO, ...] = ()
+    metrics: Optional[ProcessingMetricsDTO] = field(default=None, compare=False)
+
+
+@dataclass(frozen=True)
+class MatchPreviewDTO:
+    success: bool
+    message: str
+    match_count: int = 0
+    headers: Tuple[str, ...] = ()
+    rows: Tuple[Tuple[Any, ...], ...] = ()
+    error_code: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class ProcessingProgressDTO:
+    stage: ProcessingStage
+    rows_read: int = 0
+    rows_matched: int = 0
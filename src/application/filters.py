@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Hashable, Optional, Tuple
+
+from src.application.dto import Columns
+
+RANGE_COLUMNS = (Columns.SALARY, Columns.HIRE_DATE)
+
+
+@dataclass(frozen=True)
+class RangeFilter:
+    low: Optional[Any] = None
+    high: Optional[Any] = None
+    include_low: bool = True
+    include_high: bool = True
+
+    def contains(self, key: Any) -> bool:
+        if self.low is not None:
+            if key < self.low or (key == self.low and not self.include_low):
+                return False
+        if self.high is not None:
+            if key > self.high or (key == self.high and not self.include_high):
+                return False
+        return True
+
+
+@dataclass(frozen=True)
+class InFilter:
+    values: Tuple[Any, ...]
+
+
+@dataclass(frozen=True)
+class FilterExpression:
+    operator: str
+    operands: Tuple[str, ...]
+
+
+def split_filter_expression(raw: str) -> Optional[FilterExpression]:
+    raw = raw.strip()
+    for op in (">=", "<=", ">", "<"):
+        if raw.startswith(op):
+            return FilterExpression(op, (raw[len(op):].strip(),))
+    if ".." in raw:
+        low, high = raw.split("..", 1)
+        return FilterExpression("..", (low.strip(), high.strip()))
+    if ";" in raw:
+        return FilterExpression("in", tuple(p.strip() for p in raw.split(";") if p.strip()))
+    return None
+
+
+def range_key(column: Columns, value: Any) -> Optional[Hashable]:
+    if value is None:
+        return None
+    if column == Columns.SALARY:
+        try:
+            key = float(value)
+        except (ValueError, TypeError):
+            return None
+        return None if key != key else key
+    if column == Columns.HIRE_DATE and isinstance(value, datetime):
+        return value.date()
+    return None
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from heapq import merge
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+from src.application.dto import Columns
+from src.application.filters import RangeFilter, range_key
+
+IndexKey = Tuple[str, Hashable]
+
+
+class EqualityIndex:
+    def __init__(self, column: Columns):
+        self.column = column
+        self._positions: Dict[IndexKey, array] = {}
+
+    @classmethod
+    def build(cls, column: Columns, values: Iterable[Any]) -> "EqualityIndex":
+        index = cls(column)
+        if column == Columns.SALARY:
+            keys_of = _salary_keys
+        elif column == Columns.HIRE_DATE:
+            keys_of = _hire_date_keys
+        else:
+            keys_of = _text_keys
+
+        positions = index._positions
+        for pos, value in enumerate(values):
+            for key in keys_of(value):
+                bucket = positions.get(key)
+                if bucket is None:
+                    bucket = positions[key] = array("I")
+                bucket.append(pos)
+        return index
+
+    def lookup(self, filter_value: Any) -> Optional[List[int]]:
+        if filter_value is None:
+            return self._collect([("none", None)])
+
+        if self.column == Columns.SALARY:
+            try:
+                return self._collect([("num", float(filter_value))])
+            except (ValueError, TypeError):
+                return []
+
+        if self.column == Columns.HIRE_DATE:
+            text = ("text", str(filter_value).strip())
+            if isinstance(filter_value, datetime):
+                return self._collect([("date", filter_value.date()), text])
+            return self._collect([("dtext", text[1]), text])
+
+        if not isinstance(filter_value, str):
+            return None
+
+        folded = filter_value.strip().casefold()
+        try:
+            number = float(filter_value)
+        except ValueError:
+            return self._collect([("str", folded), ("numstr", folded), ("other", folded)])
+        return self._collect([("str", folded), ("num", number), ("other", folded)])
+
+    def lookup_many(self, filter_values: Sequence[Any]) -> Optional[List[int]]:
+        parts = []
+        for value in filter_values:
+            positions = self.lookup(value)
+            if positions is None:
+                return None
+            if positions:
+                parts.append(positions)
+        if len(parts) == 1:
+            return parts[0]
+        out: List[int] = []
+        for pos in merge(*parts):
+            if not out or out[-1] != pos:
+                out.append(pos)
+        return out
+
+    def _collect(self, keys: List[IndexKey]) -> List[int]:
+        buckets = [b for b in (self._positions.get(k) for k in keys) if b]
+        if not buckets:
+            return []
+        if len(buckets) == 1:
+            return buckets[0].tolist()
+        return list(merge(*buckets))
+
+
+class SortedIndex:
+    def __init__(self, column: Columns, keys: List[Any], positions: array):
+        self.column = column
+        self._keys = keys
+        self._positions = positions
+
+    @classmethod
+    def build(cls, column: Columns, values: Iterable[Any]) -> "SortedIndex":
+        pairs = []
+        for pos, value in enumerate(values):
+            key = range_key(column, value)
+            if key is not None:
+                pairs.append((key, pos))
+        pairs.sort()
+        return cls(column, [k for k, _ in pairs], array("I", (p for _, p in pairs)))
+
+    def lookup_range(self, range_filter: RangeFilter) -> List[int]:
+        keys = self._keys
+        lo = 0
+        hi = len(keys)
+        if range_filter.low is not None:
+            bisect = bisect_left if range_filter.include_low else bisect_right
+            lo = bisect(keys, range_filter.low)
+        if range_filter.high is not None:
+            bisect = bisect_right if range_filter.include_high else bisect_left
+            hi = bisect(keys, range_filter.high)
+        if lo >= hi:
+            return []
+        return sorted(self._positions[lo:hi])
+
+
+def _salary_keys(value: Any) -> List[IndexKey]:
+    if value is None:
+        return [("none", None)]
+    try:
+        return [("num", float(value))]
+    except (ValueError, TypeError):
+        return []
+
+
+def _hire_date_keys(value: Any) -> List[IndexKey]:
+    if value is None:
+        return [("none", None)]
+    text = str(value).strip()
+    if isinstance(value, datetime):
+        return [("date", value.date()), ("dtext", text)]
+    return [("text", text)]
+
+
+def _text_keys(value: Any) -> List[IndexKey]:
+    if value is None:
+        return [("none", None)]
+    if isinstance(value, str):
+        return [("str", value.strip().casefold())]
+
+    folded = str(value).strip().casefold()
+    try:
+        number = float(value)
+    except (ValueError, TypeError):
+        return [("other", folded)]
+    return [("num", number), ("numstr", folded)]
+
+
+def partition_key(column: Columns, value: Any) -> Optional[Hashable]:
+    if value is None:
+        return None
+    if column == Columns.SALARY:
+        keys = _salary_keys(value)
+    elif column == Columns.HIRE_DATE:
+        keys = _hire_date_keys(value)
+    elif isinstance(value, bool):
+        keys = [("other", str(value).casefold())]
+    else:
+        keys = _text_keys(value)
+    if not keys:
+        return None
+    key = keys[0][1]
+    if key == "" or key != key:
+        return None
+    return keys[0]
@@ -0,0 +1,324 @@
+from __future__ import annotations
+
+import os
+import pickle
+import re
+import tempfile
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Hashable, IO, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from src.application.dto import PartitionRequestDTO, ProcessingResultDTO, ProcessingStage, Columns
+from src.application.indexes import partition_key
+from src.application.interactors.process_excel_interactor import ProcessExcelInteractor, _ExcelReadError
+from src.application.interface import ExcelWriterPort, ProgressCallback, CancelCheck, ColumnProjection
+from src.application.metrics import STAGE_PREPARE, STAGE_READ, STAGE_HEADER, STAGE_WRITE
+from src.application.progress import ProgressTracker, ProcessingCancelled
+
+_UNSAFE_CHARS_RE = re.compile(r'[<>:"/\\|?*\x00-\x1f]')
+PARTITION_MEMORY_ROWS = 200_000
+PARTITION_WRITE_WORKERS = 4
+
+
+class _TooManyPartitions(Exception):
+    pass
+
+
+@dataclass
+class PartitionExcelInteractor(ProcessExcelInteractor):
+    max_partitions: int = 1000
+    file_extension: str = ".xlsx"
+    partition_memory_rows: int = PARTITION_MEMORY_ROWS
+
+    def __call__(
+        self,
+        request: PartitionRequestDTO,
+        *,
+        on_progress: Optional[ProgressCallback] = None,
+        is_cancelled: Optional[CancelCheck] = None,
+    ) -> ProcessingResultDTO:
+        progress = ProgressTracker(on_progress, is_cancelled)
+        try:
+            result = self._partition(request, progress)
+        except ProcessingCancelled:
+            result = self._cancelled()
+        return self._with_metrics(result, progress, request.source_path)
+
+    def _partition(self, request: PartitionRequestDTO, progress: ProgressTracker) -> ProcessingResultDTO:
+        progress.set_stage(ProcessingStage.PREPARE)
+        if not request.source_path.strip():
+            return ProcessingResultDTO(False, "Не указан путь к исходному файлу", error_code="source_missing")
+        if not request.target_dir.strip():
+            return ProcessingResultDTO(False, "Не указана папка для сохранения результатов", error_code="target_missing")
+
+        with progress.timer.stage(STAGE_PREPARE):
+            source = self.fs.normalize_path(request.source_path)
+            target_dir = self.fs.normalize_path(request.target_dir)
+
+            source_error = self._check_source(source)
+            if source_error is not None:
+                return source_error
+            sample_target = os.path.join(target_dir, "partition" + self.file_extension)
+            target_error = self._check_target(sample_target)
+            if target_error is not None:
+                return target_error
+
+        progress.set_stage(ProcessingStage.HEADER)
+        projection = ColumnProjection()
+        with progress.timer.stage(STAGE_READ):
+            rows_or_error = self._read_rows(source, projection)
+        if isinstance(rows_or_error, ProcessingResultDTO):
+            return rows_or_error
+        rows = rows_or_error
+
+        required_headers = self._required_headers()
+        writers = _PartitionWriters(
+            writer=self._writer_for(sample_target),
+            target_dir=target_dir,
+            file_extension=self.file_extension,
+            headers=required_headers,
+            generated_at_iso=datetime.now().isoformat(timespec="minutes"),
+            max_partitions=self.max_partitions,
+            memory_rows=self.partition_memory_rows,
+            spill_dir=self.sort_spill_dir,
+        )
+        try:
+            tracked_rows = progress.track_read(rows)
+
+            with progress.timer.stage(STAGE_HEADER):
+                header_or_error = self._locate_header(tracked_rows, required_headers)
+            if isinstance(header_or_error, ProcessingResultDTO):
+                return header_or_error
+            col_index, _ = header_or_error
+            col_index = self._project_columns(projection, col_index)
+
+            partition_header = request.partition_column.value
+            if partition_header not in col_index:
+                return self._filter_column_not_found(partition_header)
+
+            progress.set_stage(ProcessingStage.FILTER)
+            routed = self._iter_routed(tracked_rows, col_index, request.partition_column, required_headers)
+            with progress.timer.stage(STAGE_WRITE):
+                for key, value, out_row in progress.track_matched(routed):
+                    writers.put(key, value, out_row)
+        except _ExcelReadError as e:
+            writers.abort()
+            return ProcessingResultDTO(False, f"Ошибка при чтении Excel: {e}", error_code="excel_read_failed")
+        except _TooManyPartitions:
+            writers.abort()
+            return ProcessingResultDTO(
+                False,
+                f"Слишком много различных значений в колонке '{request.partition_column.value}' (максимум {self.max_partitions})",
+                error_code="too_many_partitions",
+            )
+        except BaseException:
+            writers.abort()
+            raise
+        finally:
+            rows.close()
+
+        with progress.timer.stage(STAGE_WRITE):
+            errors = writers.finish(progress)
+        if errors:
+            path, error = errors[0]
+            return ProcessingResultDTO(False, f"Ошибка при сохранении Excel ({path}): {error}", error_code="excel_write_failed")
+        if not writers.paths:
+            return ProcessingResultDTO(
+                False,
+                f"Нет значений для разбиения в колонке '{request.partition_column.value}'",
+                error_code="no_matches",
+            )
+
+        return ProcessingResultDTO(
+            True,
+            f"Документ разбит на файлов: {len(writers.paths)}",
+            output_path=target_dir,
+            output_paths=tuple(writers.paths),
+        )
+
+    def _iter_routed(
+        self,
+        rows: Iterable[Sequence[Any]],
+        col_index: Dict[str, int],
+        column: Columns,
+        required_headers: Sequence[str],
+    ) -> Iterator[Tuple[Hashable, Any, List[Any]]]:
+        key_i = col_index[column.value]
+        out_idx = [col_index[h] for h in required_headers]
+
+        for row in rows:
+            value = row[key_i] if key_i < len(row) else None
+            key = partition_key(column, value)
+            if key is None:
+                continue
+            yield key, value, [row[idx] if idx < len(row) else None for idx in out_idx]
+
+
+@dataclass
+class _Partition:
+    path: str
+    rows: List[List[Any]] = field(default_factory=list)
+    offsets: List[int] = field(default_factory=list)
+
+
+class _PartitionWriters:
+    def __init__(
+        self,
+        *,
+        writer: ExcelWriterPort,
+        target_dir: str,
+        file_extension: str,
+        headers: Sequence[str],
+        generated_at_iso: str,
+        max_partitions: int,
+        memory_rows: int = PARTITION_MEMORY_ROWS,
+        spill_dir: Optional[str] = None,
+    ):
+        self.writer = writer
+        self.target_dir = target_dir
+        self.file_extension = file_extension
+        self.headers = headers
+        self.generated_at_iso = generated_at_iso
+        self.max_partitions = max_partitions
+        self.memory_rows = max(1, memory_rows)
+        self.spill_dir = spill_dir
+
+        self.paths: List[str] = []
+        self._partitions: Dict[Hashable, _Partition] = {}
+        self._buffered = 0
+        self._spill: Optional[IO[bytes]] = None
+        self._spill_path: Optional[str] = None
+        self._stop = threading.Event()
+        self._errors: List[Tuple[str, BaseException]] = []
+        self._written: List[str] = []
+        self._used_names: set = set()
+
+    def put(self, key: Hashable, value: Any, row: List[Any]) -> None:
+        partition = self._partitions.get(key)
+        if partition is None:
+            partition = self._partitions[key] = self._open(value)
+        partition.rows.append(row)
+        self._buffered += 1
+        if self._buffered >= self.memory_rows:
+            self._flush()
+
+    def finish(self, progress: ProgressTracker) -> List[Tuple[str, BaseException]]:
+        from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+        try:
+            if self._spill is not None:
+                self._spill.flush()
+            workers = max(1, min(PARTITION_WRITE_WORKERS, len(self._partitions)))
+            pool = ThreadPoolExecutor(max_workers=workers)
+            try:
+                pending = {pool.submit(self._write, p) for p in self._partitions.values()}
+                while pending:
+                    _, pending = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+                    progress.check_cancelled()
+            except BaseException:
+                self._stop.set()
+                raise
+            finally:
+                pool.shutdown(wait=True, cancel_futures=True)
+        except BaseException:
+            self._remove_written()
+            raise
+        finally:
+            self._discard()
+        if self._errors:
+            self._remove_written()
+        return self._errors
+
+    def abort(self) -> None:
+        self._stop.set()
+        self._discard()
+        self._remove_written()
+
+    def _open(self, value: Any) -> _Partition:
+        if len(self._partitions) >= self.max_partitions:
+            raise _TooManyPartitions()
+
+        path = os.path.join(self.target_dir, self._file_name(value))
+        self.paths.append(path)
+        return _Partition(path)
+
+    def _flush(self) -> None:
+        if self._spill is None:
+            fd, self._spill_path = tempfile.mkstemp(prefix="partition-", suffix=".tmp", dir=self.spill_dir)
+            self._spill = open(fd, "w+b")
+        for partition in self._partitions.values():
+            if partition.rows:
+                partition.offsets.append(self._spill.tell())
+                pickle.dump(partition.rows, self._spill, protocol=pickle.HIGHEST_PROTOCOL)
+                partition.rows = []
+        self._buffered = 0
+
+    def _write(self, partition: _Partition) -> None:
+        try:
+            self.writer.write_table(
+                target_path=partition.path,
+                headers=self.headers,
+                rows=self._iter_rows(partition),
+                generated_at_iso=self.generated_at_iso,
+            )
+            self._written.append(partition.path)
+        except ProcessingCancelled:
+            pass
+        except BaseException as e:
+            self._errors.append((partition.path, e))
+
+    def _iter_rows(self, partition: _Partition) -> Iterator[List[Any]]:
+        if self._stop.is_set():
+            raise ProcessingCancelled()
+        if partition.offsets:
+            with open(self._spill_path, "rb") as f:
+                for offset in partition.offsets:
+                    f.seek(offset)
+                    yield from self._checked(pickle.load(f))
+        yield from self._checked(partition.rows)
+
+    def _checked(self, rows: List[List[Any]]) -> Iterator[List[Any]]:
+        stopped = self._stop.is_set
+        for row in rows:
+            if stopped():
+                raise ProcessingCancelled()
+            yield row
+
+    def _remove_written(self) -> None:
+        for path in self._written:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        self._written = []
+        self.paths = []
+
+    def _discard(self) -> None:
+        if self._spill is not None:
+            self._spill.close()
+            self._spill = None
+            try:
+                os.remove(self._spill_path)
+            except OSError:
+                pass
+        for partition in self._partitions.values():
+            partition.rows = []
+        self._buffered = 0
+
+    def _file_name(self, value: Any) -> str:
+        if isinstance(value, datetime):
+            text = value.strftime("%d.%m.%Y")
+        elif isinstance(value, float) and value.is_integer():
+            text = str(int(value))
+        else:
+            text = str(value).strip()
+        base = _UNSAFE_CHARS_RE.sub("_", text).strip(" .")[:100] or "без названия"
+
+        name = base
+        n = 2
+        while name.casefold() in self._used_names:
+            name = f"{base} ({n})"
+            n += 1
+        self._used_names.add(name.casefold())
+        return name + self.file_extension
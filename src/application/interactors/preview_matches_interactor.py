@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional
+
+from src.application.dto import ProcessingRequestDTO, ProcessingResultDTO, MatchPreviewDTO
+from src.application.filters import RANGE_COLUMNS
+from src.application.interactors.process_excel_interactor import ProcessExcelInteractor
+from src.application.interface import CancelCheck
+from src.application.loaded_sheet import LoadedSheetCache
+from src.application.progress import ProgressTracker, ProcessingCancelled
+
+
+@dataclass
+class PreviewMatchesInteractor(ProcessExcelInteractor):
+    preview_rows: int = 20
+
+    def __post_init__(self):
+        if self.loaded_sheets is None:
+            self.loaded_sheets = LoadedSheetCache()
+
+    def __call__(
+        self,
+        request: ProcessingRequestDTO,
+        *,
+        is_cancelled: Optional[CancelCheck] = None,
+    ) -> MatchPreviewDTO:
+        if not request.source_path.strip():
+            return MatchPreviewDTO(False, "Не указан путь к исходному файлу", error_code="source_missing")
+
+        source = self.fs.normalize_path(request.source_path)
+        source_error = self._check_source(source)
+        if source_error is not None:
+            return self._to_preview(source_error)
+
+        required_headers = self._required_headers()
+        try:
+            sheet_or_error = self._load_sheet(source, ProgressTracker(is_cancelled=is_cancelled), required_headers)
+        except ProcessingCancelled:
+            return self._to_preview(self._cancelled())
+        if isinstance(sheet_or_error, ProcessingResultDTO):
+            return self._to_preview(sheet_or_error)
+        sheet = sheet_or_error
+
+        filter_header = request.filter_column.value
+        if filter_header not in sheet.col_index:
+            return self._to_preview(self._filter_column_not_found(filter_header))
+
+        if not request.filter_value_raw.strip():
+            sheet.equality_index(filter_header)
+            if request.filter_column in RANGE_COLUMNS:
+                sheet.sorted_index(filter_header)
+            return MatchPreviewDTO(False, "", error_code="filter_value_missing")
+
+        parsed_or_error = self._parse_filter_value(request.filter_column, request.filter_value_raw)
+        if isinstance(parsed_or_error, ProcessingResultDTO):
+            return self._to_preview(parsed_or_error)
+
+        if is_cancelled is not None and is_cancelled():
+            return self._to_preview(self._cancelled())
+
+        req = ProcessingRequestDTO(
+            source_path=source,
+            target_path=request.target_path,
+            filter_column=request.filter_column,
+            filter_value_raw=request.filter_value_raw,
+            filter_value=parsed_or_error,
+        )
+        positions = sheet.match_positions(req)
+        rows = tuple(tuple(r) for r in sheet.project(positions[:self.preview_rows], required_headers))
+        return MatchPreviewDTO(
+            True,
+            f"Найдено строк: {len(positions)}",
+            match_count=len(positions),
+            headers=tuple(required_headers),
+            rows=rows,
+        )
+
+    def _to_preview(self, result: ProcessingResultDTO) -> MatchPreviewDTO:
+        return MatchPreviewDTO(False, result.message, error_code=result.error_code)
@@ -1,11 +1,53 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import os
+from dataclasses import dataclass, field, replace
 from datetime import datetime
-from typing import Any, Sequence, Dict, Optional, List, Tuple
+from itertools import chain, islice
+from operator import itemgetter
+from typing import Any, Sequence, Dict, Optional, List, Tuple, Iterable, Iterator
 
-from src.application.dto import ProcessingRequestDTO, ProcessingResultDTO, Columns
-from src.application.interface import FileSystemPort, ExcelReaderPort, ExcelWriterPort
+from src.application.aggregates import SalaryAggregator, SummarySheet
+from src.application.checkpoints import Checkpoint, PrefixHasher, checkpoint_key
+from src.application.dto import (
+    ProcessingRequestDTO, ProcessingResultDTO, ProcessingMetricsDTO, Columns, ProcessingStage, SheetCountDTO
+)
+from src.application.interface import (
+    FileSystemPort, ExcelReaderPort, ExcelWriterPort, ProgressCallback, CancelCheck, ColumnProjection, MetricsSink,
+    CheckpointStorePort,
+)
+from src.application.filters import (
+    RANGE_COLUMNS, FilterExpression, InFilter, RangeFilter, range_key, split_filter_expression
+)
+from src.application.loaded_sheet import LoadedSheet, LoadedSheetCache
+from src.application.metrics import (
+    peak_rss_bytes, STAGE_PREPARE, STAGE_READ, STAGE_HEADER, STAGE_FILTER, STAGE_SORT, STAGE_WRITE, STAGE_WAIT
+)
+from src.application.pipeline import ProcessStage, Send, StageCrashed, StagePipeline
+from src.application.predicates import compile_filter
+from src.application.progress import ProgressTracker, ProcessingCancelled
+from src.application.row_store import CompactTable
+from src.application.sorting import SORT_MEMORY_ROWS, ExternalSorter, row_sort_key
+from src.application.vectorized import VECTOR_BATCH_ROWS, VectorizedFilter, compile_vectorized_filter
+
+
+SOURCE_COLUMN_HEADER = "Источник"
+
+_GLOB_CHARS = "*?["
+
+
+class _ExcelReadError(Exception):
+    pass
+
+
+@dataclass
+class _SheetOutcome:
+    sheet_name: Optional[str]
+    source_path: str = ""
+    rows_read: int = 0
+    rows: CompactTable = field(default_factory=CompactTable)
+    error: Optional[ProcessingResultDTO] = None
+    peak_rss_bytes: Optional[int] = None
 
 
 @dataclass
@@ -13,54 +55,747 @@ class ProcessExcelInteractor:
     fs: FileSystemPort
     reader: ExcelReaderPort
     writer: ExcelWriterPort
-    max_size_bytes: int = 50 * 1024 * 1024
+    max_size_bytes: Optional[int] = None
+    loaded_sheets: Optional[LoadedSheetCache] = None
+    sheet_workers: Optional[int] = None
+    writers_by_extension: Dict[str, ExcelWriterPort] = field(default_factory=dict)
+    metrics_sink: Optional[MetricsSink] = None
+    vectorized: bool = True
+    pipelined: bool = False
+    checkpoints: Optional[CheckpointStorePort] = None
+    sort_memory_rows: int = SORT_MEMORY_ROWS
+    sort_spill_dir: Optional[str] = None
 
-    def __call__(self, request: ProcessingRequestDTO) -> ProcessingResultDTO:
-        prepared_or_error = self._prepare_request(request)
+    def __call__(
+        self,
+        request: ProcessingRequestDTO,
+        *,
+        on_progress: Optional[ProgressCallback] = None,
+        is_cancelled: Optional[CancelCheck] = None,
+    ) -> ProcessingResultDTO:
+        progress = ProgressTracker(on_progress, is_cancelled)
+        try:
+            result = self._process(request, progress)
+        except ProcessingCancelled:
+            result = self._cancelled()
+        return self._with_metrics(result, progress, *(request.source_paths or (request.source_path,)))
+
+    def _process(self, request: ProcessingRequestDTO, progress: ProgressTracker) -> ProcessingResultDTO:
+        progress.set_stage(ProcessingStage.PREPARE)
+        with progress.timer.stage(STAGE_PREPARE):
+            prepared_or_error = self._prepare_request(request)
         if isinstance(prepared_or_error, ProcessingResultDTO):
             return prepared_or_error
         req = prepared_or_error
 
-        rows_or_error = self._read_rows(req.source_path)
+        required_headers = self._required_headers()
+        if req.incremental:
+            return self._process_incremental(req, progress, required_headers)
+        if len(req.source_paths) > 1 or req.add_source_column:
+            return self._process_sources(req, progress, required_headers)
+        if req.all_sheets or req.sheet_names:
+            return self._process_sheets(req, progress, required_headers)
+        if self.loaded_sheets is not None:
+            return self._process_loaded(req, progress, required_headers)
+        if self.pipelined:
+            return self._process_pipelined(req, progress, required_headers)
+        return self._process_streaming(req, progress, required_headers)
+
+    def _process_streaming(
+        self,
+        req: ProcessingRequestDTO,
+        progress: ProgressTracker,
+        required_headers: Sequence[str],
+    ) -> ProcessingResultDTO:
+        progress.set_stage(ProcessingStage.HEADER)
+        projection = ColumnProjection()
+        with progress.timer.stage(STAGE_READ):
+            rows_or_error = self._read_rows(req.source_path, projection)
         if isinstance(rows_or_error, ProcessingResultDTO):
             return rows_or_error
         rows = rows_or_error
 
-        required_headers = self._required_headers()
-        header_or_error = self._locate_header(rows, required_headers)
-        if isinstance(header_or_error, ProcessingResultDTO):
-            return header_or_error
-        col_index, header_row_idx = header_or_error
-
-        filtered_or_error = self._filter_rows(
-            rows=rows,
-            header_row_idx=header_row_idx,
-            col_index=col_index,
-            request=req,
-            required_headers=required_headers,
+        try:
+            tracked_rows = progress.track_read(rows)
+
+            with progress.timer.stage(STAGE_HEADER):
+                header_or_error = self._locate_header(tracked_rows, required_headers)
+            if isinstance(header_or_error, ProcessingResultDTO):
+                return header_or_error
+            col_index, _ = header_or_error
+            col_index = self._project_columns(projection, col_index)
+
+            progress.set_stage(ProcessingStage.FILTER)
+            with progress.timer.stage(STAGE_FILTER):
+                filtered_or_error = self._filter_rows(
+                    rows=tracked_rows,
+                    col_index=col_index,
+                    request=req,
+                    required_headers=required_headers,
+                )
+            if isinstance(filtered_or_error, ProcessingResultDTO):
+                return filtered_or_error
+            filtered_rows, summary = self._output_rows(
+                req, required_headers, progress.track_matched(filtered_or_error), progress
+            )
+
+            with progress.timer.stage(STAGE_WRITE):
+                write_error = self._write_output(req.target_path, required_headers, filtered_rows, summary)
+            if write_error is not None:
+                return write_error
+        except _ExcelReadError as e:
+            return ProcessingResultDTO(False, f"Ошибка при чтении Excel: {e}", error_code="excel_read_failed")
+        finally:
+            rows.close()
+
+        return ProcessingResultDTO(True, "Документ обработан", output_path=req.target_path)
+
+    def _process_incremental(
+        self,
+        req: ProcessingRequestDTO,
+        progress: ProgressTracker,
+        required_headers: Sequence[str],
+    ) -> ProcessingResultDTO:
+        if self.checkpoints is None:
+            return ProcessingResultDTO(
+                False,
+                "Инкрементальная обработка недоступна: не настроено хранилище контрольных точек",
+                error_code="incremental_unavailable",
+            )
+        if (
+            len(req.source_paths) > 1 or req.add_source_column or req.all_sheets or req.sheet_names
+            or req.order_by or req.summary
+        ):
+            return ProcessingResultDTO(
+                False,
+                "Инкрементальная обработка доступна только для одного листа одного файла без сортировки и сводки",
+                error_code="incremental_unsupported",
+            )
+
+        key = checkpoint_key(req)
+        checkpoint = self.checkpoints.load(key)
+        if checkpoint is not None and not self._output_unchanged(req.target_path, checkpoint):
+            checkpoint = None
+
+        result = self._process_appended(req, progress, required_headers, key, checkpoint)
+        if result is None:
+            progress.rows_read = 0
+            progress.rows_matched = 0
+            result = self._process_appended(req, progress, required_headers, key, None)
+        return result
+
+    def _output_unchanged(self, target_path: str, checkpoint: Checkpoint) -> bool:
+        try:
+            return (
+                self.fs.exists(target_path)
+                and self.fs.get_size_bytes(target_path) == checkpoint.output_size
+                and self.fs.get_mtime_ns(target_path) == checkpoint.output_mtime_ns
+            )
+        except Exception:
+            return False
+
+    def _process_appended(
+        self,
+        req: ProcessingRequestDTO,
+        progress: ProgressTracker,
+        required_headers: Sequence[str],
+        key: str,
+        checkpoint: Optional[Checkpoint],
+    ) -> Optional[ProcessingResultDTO]:
+        if checkpoint is None:
+            self.checkpoints.discard(key)
+        progress.set_stage(ProcessingStage.HEADER)
+        projection = ColumnProjection()
+        with progress.timer.stage(STAGE_READ):
+            rows_or_error = self._read_rows(req.source_path, projection)
+        if isinstance(rows_or_error, ProcessingResultDTO):
+            return rows_or_error
+        rows = rows_or_error
+
+        try:
+            tracked_rows = progress.track_read(rows)
+
+            with progress.timer.stage(STAGE_HEADER):
+                header_or_error = self._locate_header(tracked_rows, required_headers)
+            if isinstance(header_or_error, ProcessingResultDTO):
+                return header_or_error
+            header_index, _ = header_or_error
+            if checkpoint is not None and checkpoint.col_index != header_index:
+                return None
+            col_index = self._project_columns(projection, header_index)
+
+            hasher = PrefixHasher()
+            data_rows = hasher.track(tracked_rows)
+            if checkpoint is not None:
+                skipped = sum(1 for _ in islice(data_rows, checkpoint.rows_processed))
+                if skipped < checkpoint.rows_processed or hasher.hexdigest() != checkpoint.prefix_hash:
+                    return None
+
+            progress.set_stage(ProcessingStage.FILTER)
+            with progress.timer.stage(STAGE_FILTER):
+                filtered_or_error = self._filter_rows(
+                    rows=data_rows,
+                    col_index=col_index,
+                    request=req,
+                    required_headers=required_headers,
+                )
+            if isinstance(filtered_or_error, ProcessingResultDTO):
+                if checkpoint is None or filtered_or_error.error_code != "no_matches":
+                    return filtered_or_error
+                self._save_checkpoint(req, key, hasher, header_index, checkpoint.rows_matched)
+                return ProcessingResultDTO(True, "Новых совпадений нет", output_path=req.target_path)
+            filtered_rows = progress.track_matched(filtered_or_error)
+
+            with progress.timer.stage(STAGE_WRITE):
+                if checkpoint is None:
+                    write_error = self._write_output(req.target_path, required_headers, filtered_rows)
+                else:
+                    write_error = self._append_output(req.target_path, required_headers, filtered_rows)
+            if write_error is not None:
+                return write_error
+        except _ExcelReadError as e:
+            return ProcessingResultDTO(False, f"Ошибка при чтении Excel: {e}", error_code="excel_read_failed")
+        finally:
+            rows.close()
+
+        previous = checkpoint.rows_matched if checkpoint is not None else 0
+        self._save_checkpoint(req, key, hasher, header_index, previous + progress.rows_matched)
+        if checkpoint is None:
+            return ProcessingResultDTO(True, "Документ обработан", output_path=req.target_path)
+        return ProcessingResultDTO(True, f"Добавлено строк: {progress.rows_matched}", output_path=req.target_path)
+
+    def _save_checkpoint(
+        self,
+        req: ProcessingRequestDTO,
+        key: str,
+        hasher: PrefixHasher,
+        col_index: Dict[str, int],
+        rows_matched: int,
+    ) -> None:
+        try:
+            self.checkpoints.save(key, Checkpoint(
+                rows_processed=hasher.rows,
+                prefix_hash=hasher.hexdigest(),
+                col_index=col_index,
+                rows_matched=rows_matched,
+                output_size=self.fs.get_size_bytes(req.target_path),
+                output_mtime_ns=self.fs.get_mtime_ns(req.target_path),
+            ))
+        except Exception:
+            self.checkpoints.discard(key)
+
+    def _process_pipelined(
+        self,
+        req: ProcessingRequestDTO,
+        progress: ProgressTracker,
+        required_headers: Sequence[str],
+    ) -> ProcessingResultDTO:
+        progress.set_stage(ProcessingStage.HEADER)
+        pipeline = StagePipeline()
+        read_stage = ProcessStage(
+            _read_stage_worker,
+            (self.reader, req.source_path, tuple(required_headers), pipeline.chunk_rows),
+            pipeline.max_chunks,
         )
-        if isinstance(filtered_or_error, ProcessingResultDTO):
-            return filtered_or_error
-        filtered_rows = filtered_or_error
+        try:
+            messages = read_stage.messages(progress.check_cancelled)
+            with progress.timer.stage(STAGE_WAIT):
+                first_message = next(messages)
+            kind, payload = first_message
+            if kind == "error":
+                return payload
+            if kind == "read_error":
+                raise _ExcelReadError(payload)
+            col_index, header_rows = payload
+            progress.add_read(header_rows)
+            if req.filter_column.value not in col_index:
+                return self._filter_column_not_found(req.filter_column.value)
+
+            progress.set_stage(ProcessingStage.FILTER)
+            match_channel = pipeline.stage(
+                lambda: progress.timed(
+                    self._iter_matches(
+                        chain.from_iterable(self._read_chunks(messages, progress)),
+                        col_index,
+                        req,
+                        required_headers,
+                        pipeline.chunk_rows,
+                    ),
+                    STAGE_FILTER,
+                )
+            )
+
+            matches = progress.track_matched(match_channel, STAGE_WAIT)
+            first = next(matches, None)
+            if first is None:
+                return self._no_matches(req)
+
+            filtered_rows, summary = self._output_rows(req, required_headers, chain([first], matches), progress)
+            with progress.timer.stage(STAGE_WRITE):
+                write_error = self._write_output(req.target_path, required_headers, filtered_rows, summary)
+            if write_error is not None:
+                return write_error
+        except (_ExcelReadError, StageCrashed) as e:
+            return ProcessingResultDTO(False, f"Ошибка при чтении Excel: {e}", error_code="excel_read_failed")
+        finally:
+            read_stage.stop()
+            pipeline.stop()
+
+        return ProcessingResultDTO(True, "Документ обработан", output_path=req.target_path)
+
+    def _read_chunks(self, messages: Iterator[Tuple[str, Any]], progress: ProgressTracker) -> Iterator[List[Any]]:
+        for kind, payload in progress.timed(messages, STAGE_WAIT):
+            if kind == "rows":
+                progress.add_read(len(payload))
+                yield payload
+            elif kind == "done":
+                stage_seconds, peak_rss = payload
+                for name, seconds in stage_seconds.items():
+                    progress.timer.add(name, seconds)
+                progress.note_child_rss(peak_rss)
+                return
+            else:
+                raise _ExcelReadError(payload)
+
+    def _process_sheets(
+        self,
+        req: ProcessingRequestDTO,
+        progress: ProgressTracker,
+        required_headers: Sequence[str],
+    ) -> ProcessingResultDTO:
+        progress.set_stage(ProcessingStage.HEADER)
+        sheet_names_or_error = self._select_sheets(req, req.source_path)
+        if isinstance(sheet_names_or_error, ProcessingResultDTO):
+            return sheet_names_or_error
+
+        units = [(req.source_path, name) for name in sheet_names_or_error]
+        return self._process_units(req, units, progress, required_headers)
+
+    def _process_sources(
+        self,
+        req: ProcessingRequestDTO,
+        progress: ProgressTracker,
+        required_headers: Sequence[str],
+    ) -> ProcessingResultDTO:
+        progress.set_stage(ProcessingStage.HEADER)
+        units: List[Tuple[str, Optional[str]]] = []
+        for path in req.source_paths:
+            if not (req.all_sheets or req.sheet_names):
+                units.append((path, None))
+                continue
+            sheet_names_or_error = self._select_sheets(req, path)
+            if isinstance(sheet_names_or_error, ProcessingResultDTO):
+                return sheet_names_or_error
+            units.extend((path, name) for name in sheet_names_or_error)
+
+        return self._process_units(req, units, progress, required_headers)
+
+    def _select_sheets(self, req: ProcessingRequestDTO, source_path: str) -> List[str] | ProcessingResultDTO:
+        try:
+            available = self.reader.sheet_names(source_path)
+        except Exception as e:
+            return ProcessingResultDTO(False, f"Ошибка при чтении Excel: {e}", error_code="excel_read_failed")
+
+        if req.sheet_names:
+            missing = [name for name in req.sheet_names if name not in available]
+            if missing:
+                where = f" {os.path.basename(source_path)}" if len(req.source_paths) > 1 else ""
+                return ProcessingResultDTO(
+                    False,
+                    f"Листы не найдены в файле{where}: {', '.join(missing)}",
+                    error_code="sheet_not_found",
+                )
+            sheet_names = list(dict.fromkeys(req.sheet_names))
+        else:
+            sheet_names = available
+        if not sheet_names:
+            return ProcessingResultDTO(False, "Файл пустой", error_code="empty_file")
+        return sheet_names
+
+    def _process_units(
+        self,
+        req: ProcessingRequestDTO,
+        units: Sequence[Tuple[str, Optional[str]]],
+        progress: ProgressTracker,
+        required_headers: Sequence[str],
+    ) -> ProcessingResultDTO:
+        progress.set_stage(ProcessingStage.FILTER)
+        with progress.timer.stage(STAGE_FILTER):
+            outcomes = self._filter_units(req, units, required_headers, progress)
+
+        for outcome in outcomes:
+            if outcome.error is not None and outcome.error.error_code == "excel_read_failed":
+                return outcome.error
+
+        multi_source = len(req.source_paths) > 1
+        counts = tuple(
+            SheetCountDTO(self._outcome_label(o, multi_source), o.rows_read, len(o.rows), header_found=o.error is None)
+            for o in outcomes
+        )
+        if all(o.error is not None for o in outcomes):
+            return replace(outcomes[0].error, sheet_counts=counts)
+        if not any(o.rows for o in outcomes):
+            return replace(self._no_matches(req), sheet_counts=counts)
+
+        progress.set_stage(ProcessingStage.SAVE)
+        generated_at_iso = datetime.now().isoformat(timespec="minutes")
+        try:
+            with progress.timer.stage(STAGE_WRITE):
+                self._write_sheets(req, required_headers, outcomes, generated_at_iso, progress)
+        except Exception as e:
+            return ProcessingResultDTO(False, f"Ошибка при сохранении Excel: {e}", error_code="excel_write_failed")
+
+        return ProcessingResultDTO(True, "Документ обработан", output_path=req.target_path, sheet_counts=counts)
+
+    def _outcome_label(self, outcome: _SheetOutcome, multi_source: bool) -> str:
+        if outcome.sheet_name is None:
+            return os.path.basename(outcome.source_path)
+        if multi_source:
+            return f"{os.path.basename(outcome.source_path)} ({outcome.sheet_name})"
+        return outcome.sheet_name
+
+    def _write_sheets(
+        self,
+        req: ProcessingRequestDTO,
+        required_headers: Sequence[str],
+        outcomes: List[_SheetOutcome],
+        generated_at_iso: str,
+        progress: ProgressTracker,
+    ) -> None:
+        headers = list(required_headers)
+        if req.add_source_column:
+            headers.append(SOURCE_COLUMN_HEADER)
+
+        def rows_of(outcome: _SheetOutcome) -> Iterator[List[Any]]:
+            if not req.add_source_column:
+                return outcome.rows.lists()
+            source_name = os.path.basename(outcome.source_path)
+            return ([*row, source_name] for row in outcome.rows.lists())
+
+        aggregator = SalaryAggregator(required_headers) if req.summary else None
+        summary_kwargs = {"summary": aggregator.sheet()} if aggregator is not None else {}
+
+        def output_rows(rows: Iterable[Sequence[Any]]) -> Iterable[Sequence[Any]]:
+            if aggregator is not None:
+                rows = aggregator.track(rows)
+            return self._ordered(req, required_headers, rows, progress)
+
+        multi_source = len(req.source_paths) > 1
+        if req.split_sheets:
+            self._writer_for(req.target_path).write_tables(
+                req.target_path,
+                headers,
+                [(self._outcome_label(o, multi_source), output_rows(rows_of(o))) for o in outcomes if o.rows],
+                generated_at_iso=generated_at_iso,
+                **summary_kwargs,
+            )
+        else:
+            self._writer_for(req.target_path).write_table(
+                target_path=req.target_path,
+                headers=headers,
+                rows=output_rows(chain.from_iterable(rows_of(o) for o in outcomes)),
+                generated_at_iso=generated_at_iso,
+                **summary_kwargs,
+            )
+
+    def _filter_units(
+        self,
+        req: ProcessingRequestDTO,
+        units: Sequence[Tuple[str, Optional[str]]],
+        required_headers: Sequence[str],
+        progress: ProgressTracker,
+    ) -> List[_SheetOutcome]:
+        unit_requests = [(replace(req, source_path=path), name) for path, name in units]
+        workers = min(len(units), self.sheet_workers or os.cpu_count() or 1)
+        if workers <= 1:
+            outcomes = []
+            for unit_req, name in unit_requests:
+                outcomes.append(self._filter_sheet(unit_req, name, required_headers, progress.is_cancelled))
+                self._report_sheet(progress, outcomes[-1])
+            return outcomes
+
+        from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+        pool = ProcessPoolExecutor(max_workers=workers)
+        try:
+            futures = [
+                pool.submit(_filter_sheet_worker, self.reader, unit_req, name, required_headers)
+                for unit_req, name in unit_requests
+            ]
+            pending = set(futures)
+            while pending:
+                done, pending = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    self._report_sheet(progress, fut.result())
+                progress.check_cancelled()
+        except BaseException:
+            pool.shutdown(wait=False, cancel_futures=True)
+            raise
+        pool.shutdown(wait=True)
+        return [fut.result() for fut in futures]
+
+    def _report_sheet(self, progress: ProgressTracker, outcome: _SheetOutcome) -> None:
+        progress.rows_read += outcome.rows_read
+        progress.rows_matched += len(outcome.rows)
+        progress.note_child_rss(outcome.peak_rss_bytes)
+        progress.set_stage(ProcessingStage.FILTER)
+
+    def _filter_sheet(
+        self,
+        req: ProcessingRequestDTO,
+        sheet_name: Optional[str],
+        required_headers: Sequence[str],
+        is_cancelled: Optional[CancelCheck] = None,
+    ) -> _SheetOutcome:
+        outcome = _SheetOutcome(sheet_name, req.source_path)
+        projection = ColumnProjection()
+        rows_or_error = self._read_rows(req.source_path, projection, sheet_name)
+        if isinstance(rows_or_error, ProcessingResultDTO):
+            outcome.error = rows_or_error
+            return outcome
+        rows = rows_or_error
+
+        counter = ProgressTracker(is_cancelled=is_cancelled)
+        try:
+            tracked_rows = counter.track_read(rows)
 
-        write_error = self._write_output(req.target_path, required_headers, filtered_rows)
+            header_or_error = self._locate_header(tracked_rows, required_headers)
+            if isinstance(header_or_error, ProcessingResultDTO):
+                outcome.error = header_or_error
+                return outcome
+            col_index, _ = header_or_error
+            col_index = self._project_columns(projection, col_index)
+
+            filtered_or_error = self._filter_rows(
+                rows=tracked_rows,
+                col_index=col_index,
+                request=req,
+                required_headers=required_headers,
+            )
+            if isinstance(filtered_or_error, ProcessingResultDTO):
+                if filtered_or_error.error_code != "no_matches":
+                    outcome.error = filtered_or_error
+            else:
+                outcome.rows = CompactTable.build(filtered_or_error, len(required_headers))
+        except _ExcelReadError as e:
+            where = f"лист '{sheet_name}'" if sheet_name is not None else os.path.basename(req.source_path)
+            outcome.error = ProcessingResultDTO(
+                False,
+                f"Ошибка при чтении Excel ({where}): {e}",
+                error_code="excel_read_failed",
+            )
+        finally:
+            rows.close()
+            outcome.rows_read = counter.rows_read
+
+        return outcome
+
+    def _process_loaded(
+        self,
+        req: ProcessingRequestDTO,
+        progress: ProgressTracker,
+        required_headers: Sequence[str],
+    ) -> ProcessingResultDTO:
+        sheet_or_error = self._load_sheet(req.source_path, progress, required_headers)
+        if isinstance(sheet_or_error, ProcessingResultDTO):
+            return sheet_or_error
+        sheet = sheet_or_error
+
+        progress.set_stage(ProcessingStage.FILTER)
+        filter_header = req.filter_column.value
+        if filter_header not in sheet.col_index:
+            return self._filter_column_not_found(filter_header)
+
+        with progress.timer.stage(STAGE_FILTER):
+            positions = sheet.match_positions(req)
+        if not positions:
+            return self._no_matches(req)
+        filtered_rows, summary = self._output_rows(
+            req, required_headers, progress.track_matched(sheet.project(positions, required_headers)), progress
+        )
+
+        with progress.timer.stage(STAGE_WRITE):
+            write_error = self._write_output(req.target_path, required_headers, filtered_rows, summary)
         if write_error is not None:
             return write_error
 
         return ProcessingResultDTO(True, "Документ обработан", output_path=req.target_path)
 
+    def _load_sheet(
+        self,
+        source_path: str,
+        progress: ProgressTracker,
+        required_headers: Sequence[str],
+    ) -> LoadedSheet | ProcessingResultDTO:
+        stamp = (self.fs.get_size_bytes(source_path), self.fs.get_mtime_ns(source_path))
+        sheet = self.loaded_sheets.get(source_path, stamp)
+        if sheet is not None:
+            return sheet
+
+        progress.set_stage(ProcessingStage.HEADER)
+        lock = self.loaded_sheets.load_lock(source_path, stamp)
+        while not lock.acquire(timeout=0.1):
+            progress.check_cancelled()
+        try:
+            sheet = self.loaded_sheets.get(source_path, stamp)
+            if sheet is not None:
+                return sheet
+            return self._read_sheet(source_path, stamp, progress, required_headers)
+        finally:
+            lock.release()
+
+    def _read_sheet(
+        self,
+        source_path: str,
+        stamp: Tuple[int, int],
+        progress: ProgressTracker,
+        required_headers: Sequence[str],
+    ) -> LoadedSheet | ProcessingResultDTO:
+        projection = ColumnProjection()
+        with progress.timer.stage(STAGE_READ):
+            rows_or_error = self._read_rows(source_path, projection)
+        if isinstance(rows_or_error, ProcessingResultDTO):
+            return rows_or_error
+        rows = rows_or_error
+
+        try:
+            tracked_rows = progress.track_read(rows)
+
+            with progress.timer.stage(STAGE_HEADER):
+                header_or_error = self._locate_header(tracked_rows, required_headers)
+            if isinstance(header_or_error, ProcessingResultDTO):
+                return header_or_error
+            col_index, _ = header_or_error
+            col_index = self._project_columns(projection, col_index)
+
+            sheet = LoadedSheet(col_index=col_index, rows=CompactTable.build(tracked_rows, len(projection.indexes)))
+        except _ExcelReadError as e:
+            return ProcessingResultDTO(False, f"Ошибка при чтении Excel: {e}", error_code="excel_read_failed")
+        finally:
+            rows.close()
+
+        self.loaded_sheets.put(source_path, stamp, sheet)
+        return sheet
+
+
+    def preload(self, source_path: str, *, is_cancelled: Optional[CancelCheck] = None) -> ProcessingResultDTO:
+        if self.loaded_sheets is None:
+            return ProcessingResultDTO(False, "Предзагрузка отключена", error_code="preload_disabled")
+
+        source = self.fs.normalize_path(source_path)
+        source_error = self._check_source(source)
+        if source_error is not None:
+            return source_error
+
+        try:
+            sheet_or_error = self._load_sheet(source, ProgressTracker(is_cancelled=is_cancelled), self._required_headers())
+        except ProcessingCancelled:
+            return self._cancelled()
+        if isinstance(sheet_or_error, ProcessingResultDTO):
+            return sheet_or_error
+        return ProcessingResultDTO(True, "Файл загружен", output_path=source)
+
+    def _with_metrics(
+        self,
+        result: ProcessingResultDTO,
+        progress: ProgressTracker,
+        *source_paths: str,
+    ) -> ProcessingResultDTO:
+        elapsed = progress.timer.elapsed()
+        output_paths = result.output_paths or ((result.output_path,) if result.output_path else ())
+        metrics = ProcessingMetricsDTO(
+            stage_seconds=progress.timer.stage_seconds(),
+            total_seconds=round(elapsed, 6),
+            rows_read=progress.rows_read,
+            rows_matched=progress.rows_matched,
+            rows_per_second=round(progress.rows_read / elapsed, 1) if elapsed > 0 else 0.0,
+            input_bytes=self._total_size_or_none(source_paths),
+            output_bytes=self._total_size_or_none(output_paths) if result.success else None,
+            peak_rss_bytes=peak_rss_bytes(),
+            peak_child_rss_bytes=progress.peak_child_rss_bytes,
+        )
+        result = replace(result, metrics=metrics)
+        if self.metrics_sink is not None:
+            try:
+                self.metrics_sink(result)
+            except Exception:
+                pass
+        return result
+
+    def _size_or_none(self, path: str) -> Optional[int]:
+        if not path or not path.strip():
+            return None
+        try:
+            return self.fs.get_size_bytes(self.fs.normalize_path(path))
+        except Exception:
+            return None
+
+    def _total_size_or_none(self, paths: Sequence[str]) -> Optional[int]:
+        sizes = [self._size_or_none(p) for p in paths]
+        if not sizes or any(s is None for s in sizes):
+            return None
+        return sum(sizes)
 
     def _prepare_request(self, request: ProcessingRequestDTO) -> ProcessingRequestDTO | ProcessingResultDTO:
-        if not request.source_path.strip():
+        if not request.source_path.strip() and not request.source_paths:
             return ProcessingResultDTO(False, "Не указан путь к исходному файлу", error_code="source_missing")
         if not request.target_path.strip():
             return ProcessingResultDTO(False, "Не указан путь для сохранения результата", error_code="target_missing")
         if not request.filter_value_raw.strip():
             return ProcessingResultDTO(False, "Не указано значение для фильтрации", error_code="filter_value_missing")
 
-        source = self.fs.normalize_path(request.source_path)
+        sources_or_error = self._resolve_sources(request)
+        if isinstance(sources_or_error, ProcessingResultDTO):
+            return sources_or_error
+        sources = sources_or_error
         target = self.fs.normalize_path(request.target_path)
 
+        target_error = self._check_target(target)
+        if target_error is not None:
+            return target_error
+        if request.summary and os.path.splitext(target)[1].lower() != ".xlsx":
+            return ProcessingResultDTO(
+                False,
+                "Сводный лист можно сохранить только в файл Excel (*.xlsx)",
+                error_code="summary_unsupported",
+            )
+
+        parsed_or_error = self._parse_filter_value(request.filter_column, request.filter_value_raw)
+        if isinstance(parsed_or_error, ProcessingResultDTO):
+            return parsed_or_error
+
+        return replace(
+            request,
+            source_path=sources[0],
+            source_paths=sources,
+            target_path=target,
+            filter_value=parsed_or_error,
+        )
+
+    def _resolve_sources(self, request: ProcessingRequestDTO) -> Tuple[str, ...] | ProcessingResultDTO:
+        sources: List[str] = []
+        for raw in request.source_paths or (request.source_path,):
+            if not raw.strip():
+                continue
+            path = self.fs.normalize_path(raw.strip())
+            if any(ch in raw for ch in _GLOB_CHARS) and not self.fs.exists(path):
+                matched = sorted(self.fs.glob(path))
+                if not matched:
+                    return ProcessingResultDTO(False, f"По шаблону не найдено файлов: {raw}", error_code="source_not_found")
+                sources.extend(matched)
+            else:
+                sources.append(path)
+
+        sources = list(dict.fromkeys(sources))
+        if not sources:
+            return ProcessingResultDTO(False, "Не указан путь к исходному файлу", error_code="source_missing")
+        for source in sources:
+            source_error = self._check_source(source)
+            if source_error is not None:
+                return source_error
+        return tuple(sources)
+
+    def _check_source(self, source: str) -> Optional[ProcessingResultDTO]:
         if not source.lower().endswith(".xlsx"):
             return ProcessingResultDTO(False, "Поддерживаются только файлы Excel (*.xlsx)", error_code="bad_extension")
         if not self.fs.exists(source):
@@ -73,43 +808,71 @@ class ProcessExcelInteractor:
         size = self.fs.get_size_bytes(source)
         if size == 0:
             return ProcessingResultDTO(False, "Файл пустой", error_code="empty_file")
-        if size > self.max_size_bytes:
+        if self.max_size_bytes is not None and size > self.max_size_bytes:
             mb = size / (1024 * 1024)
-            return ProcessingResultDTO(False, f"Файл слишком большой: {mb:.1f}MB (максимум 50MB)", error_code="too_large")
+            max_mb = self.max_size_bytes / (1024 * 1024)
+            return ProcessingResultDTO(False, f"Файл слишком большой: {mb:.1f}MB (максимум {max_mb:.0f}MB)", error_code="too_large")
+        return None
 
+    def _check_target(self, target: str) -> Optional[ProcessingResultDTO]:
+        ext = os.path.splitext(target)[1].lower()
+        if ext != ".xlsx" and ext not in self.writers_by_extension:
+            supported = ", ".join(f"*{e}" for e in [".xlsx", *self.writers_by_extension])
+            return ProcessingResultDTO(
+                False,
+                f"Неподдерживаемый формат результата. Поддерживаются: {supported}",
+                error_code="bad_target_extension",
+            )
         try:
             self.fs.ensure_parent_dir(target)
         except Exception as e:
             return ProcessingResultDTO(False, f"Не удалось создать директорию назначения: {e}", error_code="target_dir_create_failed")
         if not self.fs.can_write_dir_of(target):
             return ProcessingResultDTO(False, "Нет прав на запись в директорию назначения", error_code="no_write_permission")
+        return None
 
-        parsed_or_error = self._parse_filter_value(request.filter_column, request.filter_value_raw)
-        if isinstance(parsed_or_error, ProcessingResultDTO):
-            return parsed_or_error
+    def _writer_for(self, target_path: str) -> ExcelWriterPort:
+        ext = os.path.splitext(target_path)[1].lower()
+        return self.writers_by_extension.get(ext, self.writer)
 
-        return ProcessingRequestDTO(
-            source_path=source,
-            target_path=target,
-            filter_column=request.filter_column,
-            filter_value_raw=request.filter_value_raw,
-            filter_value=parsed_or_error,
-        )
-
-    def _read_rows(self, source_path: str) -> List[Sequence[Any]] | ProcessingResultDTO:
+    def _read_rows(
+        self,
+        source_path: str,
+        projection: Optional[ColumnProjection] = None,
+        sheet_name: Optional[str] = None,
+    ) -> Iterator[Sequence[Any]] | ProcessingResultDTO:
         try:
-            rows = list(self.reader.iter_rows(source_path))
+            if sheet_name is None:
+                it = iter(self.reader.iter_rows(source_path, projection))
+            else:
+                it = iter(self.reader.iter_rows(source_path, projection, sheet_name))
+            first = next(it)
+        except StopIteration:
+            return ProcessingResultDTO(False, "Файл пустой", error_code="empty_file")
         except Exception as e:
             return ProcessingResultDTO(False, f"Ошибка при чтении Excel: {e}", error_code="excel_read_failed")
 
-        if not rows:
-            return ProcessingResultDTO(False, "Файл пустой", error_code="empty_file")
+        return self._stream_rows(chain([first], it), it)
+
+    def _stream_rows(self, rows: Iterable[Sequence[Any]], source: Iterator[Sequence[Any]]) -> Iterator[Sequence[Any]]:
+        try:
+            yield from rows
+        except Exception as e:
+            raise _ExcelReadError(e) from e
+        finally:
+            close = getattr(source, "close", None)
+            if close is not None:
+                close()
 
-        return rows
+    def _project_columns(self, projection: ColumnProjection, col_index: Dict[str, int]) -> Dict[str, int]:
+        wanted = tuple(sorted(set(col_index.values())))
+        projection.indexes = wanted
+        position = {idx: pos for pos, idx in enumerate(wanted)}
+        return {h: position[idx] for h, idx in col_index.items()}
 
     def _locate_header(
         self,
-        rows: Sequence[Sequence[Any]],
+        rows: Iterable[Sequence[Any]],
         required_headers: Sequence[str],
     ) -> Tuple[Dict[str, int], int] | ProcessingResultDTO:
         info = self._find_header_row(rows, required_headers)
@@ -124,73 +887,204 @@ class ProcessExcelInteractor:
     def _filter_rows(
         self,
         *,
-        rows: Sequence[Sequence[Any]],
-        header_row_idx: int,
+        rows: Iterable[Sequence[Any]],
         col_index: Dict[str, int],
         request: ProcessingRequestDTO,
         required_headers: Sequence[str],
-    ) -> List[List[Any]] | ProcessingResultDTO:
+    ) -> Iterator[List[Any]] | ProcessingResultDTO:
         filter_header = request.filter_column.value
         if filter_header not in col_index:
-            return ProcessingResultDTO(
-                False,
-                f"Столбец для фильтрации '{filter_header}' не найден в заголовке",
-                error_code="filter_column_not_found",
-            )
+            return self._filter_column_not_found(filter_header)
 
-        filter_col_i = col_index[filter_header]
-        parsed_filter_value = request.filter_value
+        matches = self._iter_matches(rows, col_index, request, required_headers)
+        first = next(matches, None)
+        if first is None:
+            return self._no_matches(request)
 
-        out: List[List[Any]] = []
-        for row in rows[header_row_idx + 1 :]:
-            cell_value = row[filter_col_i] if filter_col_i < len(row) else None
-            if self._compare_values(cell_value, parsed_filter_value, request.filter_column):
-                out_row: List[Any] = []
-                for h in required_headers:
-                    idx = col_index[h]
-                    out_row.append(row[idx] if idx < len(row) else None)
-                out.append(out_row)
+        return chain([first], matches)
 
-        if not out:
-            return ProcessingResultDTO(
-                False,
-                f"Нет совпадений: '{request.filter_value_raw}' в колонке '{filter_header}'",
-                error_code="no_matches",
-            )
+    def _cancelled(self) -> ProcessingResultDTO:
+        return ProcessingResultDTO(False, "Обработка отменена пользователем", error_code="cancelled")
+
+    def _filter_column_not_found(self, filter_header: str) -> ProcessingResultDTO:
+        return ProcessingResultDTO(
+            False,
+            f"Столбец для фильтрации '{filter_header}' не найден в заголовке",
+            error_code="filter_column_not_found",
+        )
+
+    def _no_matches(self, request: ProcessingRequestDTO) -> ProcessingResultDTO:
+        return ProcessingResultDTO(
+            False,
+            f"Нет совпадений: '{request.filter_value_raw}' в колонке '{request.filter_column.value}'",
+            error_code="no_matches",
+        )
+
+    def _iter_matches(
+        self,
+        rows: Iterable[Sequence[Any]],
+        col_index: Dict[str, int],
+        request: ProcessingRequestDTO,
+        required_headers: Sequence[str],
+        batch_rows: int = VECTOR_BATCH_ROWS,
+    ) -> Iterator[List[Any]]:
+        filter_col_i = col_index[request.filter_column.value]
+        out_idx = [col_index[h] for h in required_headers]
+        engine = compile_vectorized_filter(request) if self.vectorized else None
+        if engine is not None:
+            yield from self._iter_matches_vectorized(engine, rows, filter_col_i, out_idx, batch_rows)
+            return
+
+        matches = compile_filter(request)
+        for row in rows:
+            cell_value = row[filter_col_i] if filter_col_i < len(row) else None
+            if matches(cell_value):
+                yield [row[idx] if idx < len(row) else None for idx in out_idx]
 
-        return out
+    def _iter_matches_vectorized(
+        self,
+        engine: VectorizedFilter,
+        rows: Iterable[Sequence[Any]],
+        filter_col_i: int,
+        out_idx: Sequence[int],
+        batch_rows: int,
+    ) -> Iterator[List[Any]]:
+        cell_of = itemgetter(filter_col_i)
+        rows = iter(rows)
+        while chunk := list(islice(rows, batch_rows)):
+            try:
+                cells = list(map(cell_of, chunk))
+            except IndexError:
+                cells = [row[filter_col_i] if filter_col_i < len(row) else None for row in chunk]
+            for pos in engine.positions(cells):
+                row = chunk[pos]
+                yield [row[idx] if idx < len(row) else None for idx in out_idx]
 
     def _write_output(
         self,
         target_path: str,
         headers: Sequence[str],
-        rows: Sequence[Sequence[Any]],
+        rows: Iterable[Sequence[Any]],
+        summary: Optional[SummarySheet] = None,
     ) -> Optional[ProcessingResultDTO]:
+        summary_kwargs = {"summary": summary} if summary is not None else {}
         try:
-            self.writer.write_table(
+            self._writer_for(target_path).write_table(
                 target_path=target_path,
                 headers=headers,
                 rows=rows,
                 generated_at_iso=datetime.now().isoformat(timespec="minutes"),
+                **summary_kwargs,
             )
             return None
+        except (_ExcelReadError, ProcessingCancelled):
+            raise
         except Exception as e:
             return ProcessingResultDTO(False, f"Ошибка при сохранении Excel: {e}", error_code="excel_write_failed")
 
 
+    def _output_rows(
+        self,
+        req: ProcessingRequestDTO,
+        headers: Sequence[str],
+        rows: Iterable[Sequence[Any]],
+        progress: ProgressTracker,
+    ) -> Tuple[Iterable[Sequence[Any]], Optional[SummarySheet]]:
+        summary = None
+        if req.summary:
+            aggregator = SalaryAggregator(headers)
+            rows = aggregator.track(rows)
+            summary = aggregator.sheet()
+        return self._ordered(req, headers, rows, progress), summary
+
+    def _ordered(
+        self,
+        req: ProcessingRequestDTO,
+        headers: Sequence[str],
+        rows: Iterable[Sequence[Any]],
+        progress: ProgressTracker,
+    ) -> Iterable[Sequence[Any]]:
+        if req.order_by is None:
+            return rows
+        key = row_sort_key(req.order_by, list(headers).index(req.order_by.value), req.order_descending)
+        sorter = ExternalSorter(key, req.order_descending, self.sort_memory_rows, self.sort_spill_dir)
+        return progress.timed(sorter.sort(rows), STAGE_SORT)
+
+    def _append_output(
+        self,
+        target_path: str,
+        headers: Sequence[str],
+        rows: Iterable[Sequence[Any]],
+    ) -> Optional[ProcessingResultDTO]:
+        try:
+            self._writer_for(target_path).append_table(
+                target_path=target_path,
+                headers=headers,
+                rows=rows,
+                generated_at_iso=datetime.now().isoformat(timespec="minutes"),
+            )
+            return None
+        except (_ExcelReadError, ProcessingCancelled):
+            raise
+        except Exception as e:
+            return ProcessingResultDTO(False, f"Ошибка при дописывании результата: {e}", error_code="excel_write_failed")
+
     def _required_headers(self) -> List[str]:
         return [c.value for c in Columns]
 
     def _parse_filter_value(self, column: Columns, raw: str) -> Any | ProcessingResultDTO:
         raw = raw.strip()
 
+        if column in RANGE_COLUMNS:
+            expression = split_filter_expression(raw)
+            if expression is not None:
+                return self._parse_filter_expression(column, expression)
+        return self._parse_scalar(column, raw)
+
+    def _parse_filter_expression(self, column: Columns, expression: FilterExpression) -> Any | ProcessingResultDTO:
+        values = []
+        for operand in expression.operands:
+            if not operand:
+                values.append(None)
+                continue
+            value = self._parse_scalar(column, operand, bound=expression.operator != "in")
+            if isinstance(value, ProcessingResultDTO):
+                return value
+            values.append(value)
+
+        if expression.operator == "in":
+            if not values:
+                return ProcessingResultDTO(False, "Список значений пуст", error_code="filter_value_missing")
+            return InFilter(tuple(dict.fromkeys(values)))
+
+        keys = [range_key(column, v) for v in values]
+        if expression.operator == "..":
+            low, high = keys
+            if low is None and high is None:
+                return ProcessingResultDTO(False, "Укажите хотя бы одну границу диапазона", error_code="range_bad_bounds")
+            if low is not None and high is not None and low > high:
+                return ProcessingResultDTO(False, "Нижняя граница диапазона больше верхней", error_code="range_bad_bounds")
+            return RangeFilter(low=low, high=high)
+
+        (key,) = keys
+        if key is None:
+            return ProcessingResultDTO(False, f"Не указано значение после '{expression.operator}'", error_code="filter_value_missing")
+        if expression.operator == ">":
+            return RangeFilter(low=key, include_low=False)
+        if expression.operator == ">=":
+            return RangeFilter(low=key)
+        if expression.operator == "<":
+            return RangeFilter(high=key, include_high=False)
+        return RangeFilter(high=key)
+
+    def _parse_scalar(self, column: Columns, raw: str, bound: bool = False) -> Any | ProcessingResultDTO:
         if column == Columns.SALARY:
             try:
                 value = float(raw.replace(",", "."))
             except ValueError:
                 return ProcessingResultDTO(False, "Зарплата должна быть числом (например 50000 или 50000.50)", error_code="salary_not_number")
 
-            if value <= 0:
+            if value <= 0 and not bound:
                 return ProcessingResultDTO(False, "Зарплата должна быть положительным числом", error_code="salary_not_positive")
             return value
 
@@ -204,7 +1098,7 @@ class ProcessExcelInteractor:
 
     def _find_header_row(
         self,
-        rows: Sequence[Sequence[Any]],
+        rows: Iterable[Sequence[Any]],
         required_headers: Sequence[str],
     ) -> Optional[Tuple[Dict[str, int], int]]:
         req = set(required_headers)
@@ -226,6 +1120,12 @@ class ProcessExcelInteractor:
         return None
 
     def _compare_values(self, cell_value: Any, filter_value: Any, column: Columns) -> bool:
+        if isinstance(filter_value, InFilter):
+            return any(self._compare_values(cell_value, v, column) for v in filter_value.values)
+        if isinstance(filter_value, RangeFilter):
+            key = range_key(column, cell_value)
+            return key is not None and filter_value.contains(key)
+
         if cell_value is None and filter_value is None:
             return True
         if cell_value is None or filter_value is None:
@@ -243,11 +1143,63 @@ class ProcessExcelInteractor:
             return str(cell_value).strip() == str(filter_value).strip()
 
         if isinstance(cell_value, str) and isinstance(filter_value, str):
-            return cell_value.strip().lower() == filter_value.strip().lower()
+            return cell_value.strip().casefold() == filter_value.strip().casefold()
 
         try:
             return float(cell_value) == float(filter_value)
         except (ValueError, TypeError):
             pass
 
-        return str(cell_value).strip().lower() == str(filter_value).strip().lower()
+        return str(cell_value).strip().casefold() == str(filter_value).strip().casefold()
+
+
+def _filter_sheet_worker(
+    reader: ExcelReaderPort,
+    req: ProcessingRequestDTO,
+    sheet_name: Optional[str],
+    required_headers: Sequence[str],
+) -> _SheetOutcome:
+    interactor = ProcessExcelInteractor(fs=None, reader=reader, writer=None)
+    outcome = interactor._filter_sheet(req, sheet_name, required_headers)
+    outcome.peak_rss_bytes = peak_rss_bytes()
+    return outcome
+
+
+def _read_stage_worker(
+    reader: ExcelReaderPort,
+    source_path: str,
+    required_headers: Sequence[str],
+    chunk_rows: int,
+    *,
+    send: Send,
+) -> None:
+    interactor = ProcessExcelInteractor(fs=None, reader=reader, writer=None)
+    counter = ProgressTracker()
+    projection = ColumnProjection()
+    with counter.timer.stage(STAGE_READ):
+        rows_or_error = interactor._read_rows(source_path, projection)
+    if isinstance(rows_or_error, ProcessingResultDTO):
+        send(("error", rows_or_error))
+        return
+    rows = rows_or_error
+
+    try:
+        tracked_rows = counter.track_read(rows)
+        with counter.timer.stage(STAGE_HEADER):
+            header_or_error = interactor._locate_header(tracked_rows, required_headers)
+        if isinstance(header_or_error, ProcessingResultDTO):
+            send(("error", header_or_error))
+            return
+        col_index, _ = header_or_error
+        col_index = interactor._project_columns(projection, col_index)
+        if not send(("header", (col_index, counter.rows_read))):
+            return
+
+        while chunk := list(islice(tracked_rows, chunk_rows)):
+            if not send(("rows", chunk)):
+                return
+        send(("done", (counter.timer.seconds, peak_rss_bytes())))
+    except _ExcelReadError as e:
+        send(("read_error", str(e)))
+    finally:
+        rows.close()
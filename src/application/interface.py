@@ -1,4 +1,14 @@
-from typing import Protocol, Iterable, Sequence, Any
+from dataclasses import dataclass
+from typing import Protocol, Iterable, Sequence, Any, Callable, Optional, Tuple, List
+
+from src.application.aggregates import SummarySheet
+from src.application.checkpoints import Checkpoint
+from src.application.dto import ProcessingProgressDTO, ProcessingResultDTO
+
+
+ProgressCallback = Callable[[ProcessingProgressDTO], None]
+CancelCheck = Callable[[], bool]
+MetricsSink = Callable[[ProcessingResultDTO], None]
 
 
 class FileSystemPort(Protocol):
@@ -11,10 +21,30 @@ class FileSystemPort(Protocol):
     def can_write_dir_of(self, file_path: str) -> bool: ...
 
     def get_size_bytes(self, path: str) -> int: ...
+    def get_mtime_ns(self, path: str) -> int: ...
+    def glob(self, pattern: str) -> List[str]: ...
+
+
+@dataclass
+class ColumnProjection:
+    indexes: Optional[Tuple[int, ...]] = None
+
+    def project(self, row: Sequence[Any]) -> Sequence[Any]:
+        if self.indexes is None:
+            return row
+        n = len(row)
+        return tuple(row[i] if i < n else None for i in self.indexes)
 
 
 class ExcelReaderPort(Protocol):
-    def iter_rows(self, source_path: str) -> Iterable[Sequence[Any]]: ...
+    def sheet_names(self, source_path: str) -> List[str]: ...
+
+    def iter_rows(
+        self,
+        source_path: str,
+        projection: Optional[ColumnProjection] = None,
+        sheet_name: Optional[str] = None,
+    ) -> Iterable[Sequence[Any]]: ...
 
 
 class ExcelWriterPort(Protocol):
@@ -22,9 +52,38 @@ class ExcelWriterPort(Protocol):
         self,
         target_path: str,
         headers: Sequence[str],
-        rows: Sequence[Sequence[Any]],
+        rows: Iterable[Sequence[Any]],
         *,
         generated_at_iso: str,
         source_type_label: str = "Excel файл",
         sheet_title: str = "Отфильтрованные данные",
+        summary: Optional[SummarySheet] = None,
     ) -> None: ...
+
+    def write_tables(
+        self,
+        target_path: str,
+        headers: Sequence[str],
+        tables: Iterable[Tuple[str, Iterable[Sequence[Any]]]],
+        *,
+        generated_at_iso: str,
+        source_type_label: str = "Excel файл",
+        summary: Optional[SummarySheet] = None,
+    ) -> None: ...
+
+    def append_table(
+        self,
+        target_path: str,
+        headers: Sequence[str],
+        rows: Iterable[Sequence[Any]],
+        *,
+        generated_at_iso: str,
+        source_type_label: str = "Excel файл",
+        sheet_title: str = "Отфильтрованные данные",
+    ) -> None: ...
+
+
+class CheckpointStorePort(Protocol):
+    def load(self, key: str) -> Optional[Checkpoint]: ...
+    def save(self, key: str, checkpoint: Checkpoint) -> None: ...
+    def discard(self, key: str) -> None: ...
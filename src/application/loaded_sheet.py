@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Sequence, Tuple
+
+from src.application.dto import ProcessingRequestDTO, Columns
+from src.application.filters import InFilter, RangeFilter
+from src.application.indexes import EqualityIndex, SortedIndex
+from src.application.predicates import compile_filter
+from src.application.row_store import CompactTable
+
+
+@dataclass
+class LoadedSheet:
+    col_index: Dict[str, int]
+    rows: CompactTable
+    _equality: Dict[str, EqualityIndex] = field(default_factory=dict, repr=False)
+    _sorted: Dict[str, SortedIndex] = field(default_factory=dict, repr=False)
+
+    def column_values(self, header: str) -> Iterator[Any]:
+        return iter(self.rows.column(self.col_index[header]))
+
+    def equality_index(self, header: str) -> EqualityIndex:
+        index = self._equality.get(header)
+        if index is None:
+            index = EqualityIndex.build(Columns(header), self.column_values(header))
+            self._equality[header] = index
+        return index
+
+    def sorted_index(self, header: str) -> SortedIndex:
+        index = self._sorted.get(header)
+        if index is None:
+            index = SortedIndex.build(Columns(header), self.column_values(header))
+            self._sorted[header] = index
+        return index
+
+    def match_positions(self, request: ProcessingRequestDTO) -> List[int]:
+        header = request.filter_column.value
+        filter_value = request.filter_value
+        if isinstance(filter_value, RangeFilter):
+            positions = self.sorted_index(header).lookup_range(filter_value)
+        elif isinstance(filter_value, InFilter):
+            positions = self.equality_index(header).lookup_many(filter_value.values)
+        else:
+            positions = self.equality_index(header).lookup(filter_value)
+        if positions is None:
+            matches = compile_filter(request)
+            positions = [pos for pos, value in enumerate(self.column_values(header)) if matches(value)]
+        return positions
+
+    def project(self, positions: Sequence[int], headers: Sequence[str]) -> Iterator[List[Any]]:
+        return self.rows.project(positions, [self.col_index[h] for h in headers])
+
+
+class LoadedSheetCache:
+    def __init__(self, max_sheets: int = 1):
+        self.max_sheets = max_sheets
+        self._sheets: "OrderedDict[Tuple[str, Hashable], LoadedSheet]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._loading: Dict[Tuple[str, Hashable], threading.Lock] = {}
+
+    def get(self, source_path: str, stamp: Hashable) -> Optional[LoadedSheet]:
+        key = (source_path, stamp)
+        with self._lock:
+            sheet = self._sheets.get(key)
+            if sheet is not None:
+                self._sheets.move_to_end(key)
+            return sheet
+
+    def load_lock(self, source_path: str, stamp: Hashable) -> threading.Lock:
+        with self._lock:
+            return self._loading.setdefault((source_path, stamp), threading.Lock())
+
+    def put(self, source_path: str, stamp: Hashable, sheet: LoadedSheet) -> None:
+        with self._lock:
+            for key in [k for k in self._loading if k[0] == source_path and k[1] != stamp]:
+                del self._loading[key]
+            for key in [k for k in self._sheets if k[0] == source_path]:
+                del self._sheets[key]
+            self._sheets[(source_path, stamp)] = sheet
+            while len(self._sheets) > self.max_sheets:
+                self._sheets.popitem(last=False)
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+STAGE_PREPARE = "prepare"
+STAGE_READ = "read"
+STAGE_HEADER = "header"
+STAGE_FILTER = "filter"
+STAGE_SORT = "sort"
+STAGE_WRITE = "write"
+STAGE_WAIT = "wait"
+
+STAGES = (STAGE_PREPARE, STAGE_READ, STAGE_HEADER, STAGE_FILTER, STAGE_SORT, STAGE_WRITE, STAGE_WAIT)
+
+
+class StageTimer:
+    def __init__(self):
+        self.started = time.perf_counter()
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._per_thread: List[Dict[str, float]] = []
+
+    @property
+    def seconds(self) -> Dict[str, float]:
+        with self._lock:
+            parts = list(self._per_thread)
+        merged: Dict[str, float] = {}
+        for part in parts:
+            for name, value in list(part.items()):
+                merged[name] = merged.get(name, 0.0) + value
+        return merged
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        self.enter(name)
+        try:
+            yield
+        finally:
+            self.exit()
+
+    def enter(self, name: str) -> None:
+        self._stack().append([name, time.perf_counter(), 0.0])
+
+    def exit(self) -> None:
+        stack = self._stack()
+        name, started, nested = stack.pop()
+        elapsed = time.perf_counter() - started
+        seconds = self._local.seconds
+        seconds[name] = seconds.get(name, 0.0) + elapsed - nested
+        if stack:
+            stack[-1][2] += elapsed
+
+    def add(self, name: str, seconds: float) -> None:
+        self._stack()
+        local = self._local.seconds
+        local[name] = local.get(name, 0.0) + seconds
+
+    def _stack(self) -> List[List]:
+        try:
+            return self._local.stack
+        except AttributeError:
+            self._local.stack = []
+            self._local.seconds = {}
+            with self._lock:
+                self._per_thread.append(self._local.seconds)
+            return self._local.stack
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def stage_seconds(self) -> tuple:
+        return tuple((name, round(self.seconds.get(name, 0.0), 6)) for name in STAGES)
+
+
+def peak_rss_bytes() -> Optional[int]:
+    if sys.platform == "win32":
+        return _windows_peak_rss()
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _windows_peak_rss() -> Optional[int]:
+    try:
+        import ctypes
+        from ctypes import wintypes
+    except ImportError:
+        return None
+
+    class _ProcessMemoryCounters(ctypes.Structure):
+        _fields_ = [
+            ("cb", wintypes.DWORD),
+            ("PageFaultCount", wintypes.DWORD),
+            ("PeakWorkingSetSize", ctypes.c_size_t),
+            ("WorkingSetSize", ctypes.c_size_t),
+            ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+            ("PagefileUsage", ctypes.c_size_t),
+            ("PeakPagefileUsage", ctypes.c_size_t),
+        ]
+
+    counters = _ProcessMemoryCounters()
+    counters.cb = ctypes.sizeof(counters)
+    try:
+        process = ctypes.windll.kernel32.GetCurrentProcess()
+        ok = ctypes.windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters), counters.cb)
+    except (AttributeError, OSError):
+        return None
+    return counters.PeakWorkingSetSize if ok else None
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from typing import Any, Callable, Iterable, Iterator, List, Optional
+
+from src.application.channels import RowChannel
+
+Send = Callable[[Any], bool]
+
+
+class StageCrashed(Exception):
+    pass
+
+
+class StagePipeline:
+    def __init__(self, max_chunks: int = 16, chunk_rows: int = 1024):
+        self.max_chunks = max_chunks
+        self.chunk_rows = chunk_rows
+        self._channels: List[RowChannel] = []
+        self._threads: List[threading.Thread] = []
+
+    def stage(self, produce: Callable[[], Iterable[Any]]) -> RowChannel:
+        channel = RowChannel(self.max_chunks, self.chunk_rows)
+        thread = threading.Thread(target=self._run, args=(produce, channel), daemon=True)
+        self._channels.append(channel)
+        self._threads.append(thread)
+        thread.start()
+        return channel
+
+    def stop(self) -> None:
+        for channel in self._channels:
+            channel.mark_failed()
+        for thread in self._threads:
+            thread.join()
+
+    def _run(self, produce: Callable[[], Iterable[Any]], channel: RowChannel) -> None:
+        items = None
+        try:
+            items = iter(produce())
+            for item in items:
+                if channel.failed:
+                    break
+                channel.put(item)
+            channel.close()
+        except BaseException as e:
+            channel.abort(e)
+        finally:
+            close = getattr(items, "close", None)
+            if close is not None:
+                close()
+
+
+class ProcessStage:
+    def __init__(self, target: Callable[..., None], args: tuple, max_messages: int = 16):
+        import multiprocessing
+
+        ctx = multiprocessing.get_context()
+        self._queue = ctx.Queue(max_messages)
+        self._stop = ctx.Event()
+        self._stopped = False
+        self._process = ctx.Process(
+            target=_run_process_stage,
+            args=(target, args, self._queue, self._stop),
+            daemon=True,
+        )
+        self._process.start()
+
+    def messages(self, check: Optional[Callable[[], None]] = None) -> Iterator[Any]:
+        while not self._stopped:
+            try:
+                yield self._queue.get(timeout=0.1)
+                continue
+            except queue.Empty:
+                pass
+            if check is not None:
+                check()
+            if not self._process.is_alive():
+                try:
+                    yield self._queue.get(timeout=0.1)
+                except queue.Empty:
+                    raise StageCrashed(f"процесс чтения завершился с кодом {self._process.exitcode}") from None
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stopped = True
+        self._stop.set()
+        deadline = time.monotonic() + timeout
+        while self._process.is_alive():
+            if time.monotonic() > deadline:
+                self._process.terminate()
+                self._process.join()
+                break
+            try:
+                self._queue.get(timeout=0.05)
+            except queue.Empty:
+                pass
+            self._process.join(timeout=0.05)
+        self._queue.close()
+        self._queue.join_thread()
+
+
+def _run_process_stage(target: Callable[..., None], args: tuple, out, stop) -> None:
+    def send(message: Any) -> bool:
+        while not stop.is_set():
+            try:
+                out.put(message, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    try:
+        target(*args, send=send)
+    finally:
+        if stop.is_set():
+            out.cancel_join_thread()
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from datetime import datetime
+from typing import Any, Callable
+
+from src.application.dto import ProcessingRequestDTO, Columns
+from src.application.filters import InFilter, RangeFilter, range_key
+
+CellPredicate = Callable[[Any], bool]
+
+
+def compile_filter(request: ProcessingRequestDTO) -> CellPredicate:
+    filter_value = request.filter_value
+    if filter_value is None:
+        return _is_none
+    if isinstance(filter_value, RangeFilter):
+        return _range_predicate(request.filter_column, filter_value)
+    if isinstance(filter_value, InFilter):
+        return _in_predicate(request, filter_value)
+
+    if request.filter_column == Columns.SALARY:
+        return _salary_predicate(filter_value)
+    if request.filter_column == Columns.HIRE_DATE:
+        return _hire_date_predicate(filter_value)
+    if isinstance(filter_value, str):
+        return _text_predicate(filter_value)
+    return _generic_predicate(filter_value)
+
+
+def _is_none(cell_value: Any) -> bool:
+    return cell_value is None
+
+
+def _range_predicate(column: Columns, range_filter: RangeFilter) -> CellPredicate:
+    contains = range_filter.contains
+
+    def match(cell_value: Any) -> bool:
+        key = range_key(column, cell_value)
+        return key is not None and contains(key)
+
+    return match
+
+
+def _in_predicate(request: ProcessingRequestDTO, in_filter: InFilter) -> CellPredicate:
+    if request.filter_column == Columns.SALARY:
+        targets = set()
+        for v in in_filter.values:
+            try:
+                targets.add(float(v))
+            except (ValueError, TypeError):
+                pass
+
+        def match_salary(cell_value: Any) -> bool:
+            if cell_value is None:
+                return False
+            try:
+                return float(cell_value) in targets
+            except (ValueError, TypeError):
+                return False
+
+        return match_salary
+
+    predicates = [compile_filter(replace(request, filter_value=v)) for v in in_filter.values]
+    return lambda cell_value: any(p(cell_value) for p in predicates)
+
+
+def _salary_predicate(filter_value: Any) -> CellPredicate:
+    try:
+        target = float(filter_value)
+    except (ValueError, TypeError):
+        return lambda cell_value: False
+
+    def match(cell_value: Any) -> bool:
+        if cell_value is None:
+            return False
+        try:
+            return float(cell_value) == target
+        except (ValueError, TypeError):
+            return False
+
+    return match
+
+
+def _hire_date_predicate(filter_value: Any) -> CellPredicate:
+    target_text = str(filter_value).strip()
+    if not isinstance(filter_value, datetime):
+        def match_text(cell_value: Any) -> bool:
+            return cell_value is not None and str(cell_value).strip() == target_text
+
+        return match_text
+
+    target_date = filter_value.date()
+
+    def match(cell_value: Any) -> bool:
+        if cell_value is None:
+            return False
+        if isinstance(cell_value, datetime):
+            return cell_value.date() == target_date
+        return str(cell_value).strip() == target_text
+
+    return match
+
+
+def _text_predicate(filter_value: str) -> CellPredicate:
+    target = filter_value.strip().casefold()
+    try:
+        target_number = float(filter_value)
+    except ValueError:
+        target_number = None
+
+    def match(cell_value: Any) -> bool:
+        if cell_value is None:
+            return False
+        if isinstance(cell_value, str):
+            return cell_value.strip().casefold() == target
+        if target_number is not None:
+            try:
+                return float(cell_value) == target_number
+            except (ValueError, TypeError):
+                pass
+        return str(cell_value).strip().casefold() == target
+
+    return match
+
+
+def _generic_predicate(filter_value: Any) -> CellPredicate:
+    target = str(filter_value).strip().casefold()
+    try:
+        target_number = float(filter_value)
+    except (ValueError, TypeError):
+        target_number = None
+
+    def match(cell_value: Any) -> bool:
+        if cell_value is None:
+            return False
+        if target_number is not None:
+            try:
+                return float(cell_value) == target_number
+            except (ValueError, TypeError):
+                pass
+        return str(cell_value).strip().casefold() == target
+
+    return match
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, Optional, TypeVar
+
+from src.application.dto import ProcessingProgressDTO, ProcessingStage
+from src.application.interface import ProgressCallback, CancelCheck
+from src.application.metrics import StageTimer, STAGE_READ, STAGE_FILTER
+
+T = TypeVar("T")
+
+
+class ProcessingCancelled(Exception):
+    pass
+
+
+@dataclass
+class ProgressTracker:
+    on_progress: Optional[ProgressCallback] = None
+    is_cancelled: Optional[CancelCheck] = None
+    report_every: int = 1000
+
+    stage: ProcessingStage = ProcessingStage.PREPARE
+    rows_read: int = 0
+    rows_matched: int = 0
+    timer: StageTimer = field(default_factory=StageTimer)
+    peak_child_rss_bytes: Optional[int] = None
+
+    def set_stage(self, stage: ProcessingStage) -> None:
+        self.stage = stage
+        self.check_cancelled()
+        self._report()
+
+    def note_child_rss(self, peak: Optional[int]) -> None:
+        if peak is not None and (self.peak_child_rss_bytes is None or peak > self.peak_child_rss_bytes):
+            self.peak_child_rss_bytes = peak
+
+    def check_cancelled(self) -> None:
+        if self.is_cancelled is not None and self.is_cancelled():
+            raise ProcessingCancelled()
+
+    def track_read(self, rows: Iterable[T]) -> Iterator[T]:
+        for row in self.timed(rows, STAGE_READ):
+            self.rows_read += 1
+            if self.rows_read % self.report_every == 0:
+                self.check_cancelled()
+                self._report()
+            yield row
+
+    def add_read(self, rows: int) -> None:
+        before = self.rows_read
+        self.rows_read += rows
+        if self.rows_read // self.report_every != before // self.report_every:
+            self.check_cancelled()
+            self._report()
+
+    def track_matched(self, rows: Iterable[T], stage: str = STAGE_FILTER) -> Iterator[T]:
+        for row in self.timed(rows, stage):
+            self.rows_matched += 1
+            if self.rows_matched % self.report_every == 0:
+                self.check_cancelled()
+                self._report()
+            yield row
+        self.set_stage(ProcessingStage.SAVE)
+
+    def timed(self, rows: Iterable[T], stage: str) -> Iterator[T]:
+        it = iter(rows)
+        enter, exit_ = self.timer.enter, self.timer.exit
+        while True:
+            enter(stage)
+            try:
+                row = next(it)
+            except StopIteration:
+                return
+            finally:
+                exit_()
+            yield row
+
+    def _report(self) -> None:
+        if self.on_progress is None:
+            return
+        self.on_progress(ProcessingProgressDTO(self.stage, self.rows_read, self.rows_matched))
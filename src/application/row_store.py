@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+from array import array
+from datetime import date, datetime
+from itertools import islice
+from typing import Any, Iterable, Iterator, List, Optional, Sequence
+
+BUILD_CHUNK_ROWS = 4096
+
+_EXACT_KEY_TYPES = {str, datetime, date, type(None)}
+
+
+class _DictColumn:
+    __slots__ = ("codes", "values")
+
+    def __init__(self, codes: array, values: List[Any]):
+        self.codes = codes
+        self.values = values
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, pos: int) -> Any:
+        return self.values[self.codes[pos]]
+
+    def __iter__(self) -> Iterator[Any]:
+        return map(self.values.__getitem__, self.codes)
+
+
+class _ColumnBuilder:
+    __slots__ = ("codes", "values", "lookup", "typed", "loose_type", "plain")
+
+    def __init__(self):
+        self.codes = array("I")
+        self.values: List[Any] = []
+        self.lookup = {}
+        self.typed = False
+        self.loose_type: Optional[type] = None
+        self.plain: Optional[List[Any]] = None
+
+    def extend(self, cells: Sequence[Any]) -> None:
+        if self.plain is not None:
+            self.plain.extend(cells)
+            return
+        try:
+            self._encode(cells)
+        except TypeError:
+            self.plain = list(map(self.values.__getitem__, self.codes))
+            self.plain.extend(cells)
+
+    def _encode(self, cells: Sequence[Any]) -> None:
+        if not self.typed:
+            loose = set(map(type, cells)) - _EXACT_KEY_TYPES
+            if self.loose_type is not None:
+                loose.add(self.loose_type)
+            if len(loose) > 1:
+                self.typed = True
+                self.lookup = {(v.__class__, v): code for code, v in enumerate(self.values)}
+            elif loose:
+                (self.loose_type,) = loose
+
+        keys = [(v.__class__, v) for v in cells] if self.typed else cells
+        lookup = self.lookup
+        for key in dict.fromkeys(keys):
+            if key not in lookup:
+                lookup[key] = len(self.values)
+                self.values.append(key[1] if self.typed else key)
+        self.codes.extend(map(lookup.__getitem__, keys))
+
+    def finish(self) -> Sequence[Any]:
+        if self.plain is not None:
+            return self.plain
+
+        distinct = len(self.values)
+        if distinct <= len(self.codes) // 2 or not self.codes:
+            if distinct <= 0xFF:
+                return _DictColumn(array("B", self.codes), self.values)
+            if distinct <= 0xFFFF:
+                return _DictColumn(array("H", self.codes), self.values)
+            return _DictColumn(self.codes, self.values)
+
+        classes = {v.__class__ for v in self.values}
+        if classes == {float}:
+            return array("d", map(self.values.__getitem__, self.codes))
+        if classes == {int}:
+            try:
+                return array("q", map(self.values.__getitem__, self.codes))
+            except OverflowError:
+                pass
+        return list(map(self.values.__getitem__, self.codes))
+
+
+class RowView:
+    __slots__ = ("_table", "_pos")
+
+    def __init__(self, table: "CompactTable", pos: int):
+        self._table = table
+        self._pos = pos
+
+    def __len__(self) -> int:
+        return self._table.width
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return tuple(self)[i]
+        return self._table._columns[i][self._pos]
+
+    def __iter__(self) -> Iterator[Any]:
+        pos = self._pos
+        return (column[pos] for column in self._table._columns)
+
+    def __repr__(self) -> str:
+        return f"RowView{tuple(self)!r}"
+
+
+class CompactTable:
+    __slots__ = ("width", "_columns", "_length")
+
+    def __init__(self, columns: Sequence[Sequence[Any]] = (), length: int = 0):
+        self._columns = list(columns)
+        self.width = len(self._columns)
+        self._length = length
+
+    @classmethod
+    def build(cls, rows: Iterable[Sequence[Any]], width: int) -> "CompactTable":
+        builders = [_ColumnBuilder() for _ in range(width)]
+        length = 0
+        rows = iter(rows)
+        while chunk := list(islice(rows, BUILD_CHUNK_ROWS)):
+            if any(len(row) != width for row in chunk):
+                chunk = [_fit(row, width) for row in chunk]
+            for builder, cells in zip(builders, zip(*chunk)):
+                builder.extend(cells)
+            length += len(chunk)
+        return cls([b.finish() for b in builders], length)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, pos: int) -> RowView:
+        if pos < 0:
+            pos += self._length
+        if not 0 <= pos < self._length:
+            raise IndexError(pos)
+        return RowView(self, pos)
+
+    def __iter__(self) -> Iterator[RowView]:
+        return (RowView(self, pos) for pos in range(self._length))
+
+    def column(self, i: int) -> Sequence[Any]:
+        return self._columns[i]
+
+    def project(self, positions: Iterable[int], indexes: Sequence[int]) -> Iterator[List[Any]]:
+        columns = [self._columns[i] for i in indexes]
+        for pos in positions:
+            yield [column[pos] for column in columns]
+
+    def lists(self) -> Iterator[List[Any]]:
+        return self.project(range(self._length), range(self.width))
+
+
+def _fit(row: Sequence[Any], width: int) -> tuple:
+    n = len(row)
+    return tuple(row[i] if i < n else None for i in range(width))
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import heapq
+import os
+import pickle
+import tempfile
+from contextlib import ExitStack
+from itertools import islice
+from typing import Any, Callable, IO, Iterable, Iterator, List, Optional, Sequence
+
+from src.application.dto import Columns
+from src.application.filters import RANGE_COLUMNS, range_key
+
+SORT_MEMORY_ROWS = 200_000
+SPILL_BLOCK_ROWS = 4096
+MERGE_FAN_IN = 64
+
+SortKey = Callable[[Sequence[Any]], tuple]
+
+
+def row_sort_key(column: Columns, position: int, descending: bool = False) -> SortKey:
+    present, missing = (1, 0) if descending else (0, 1)
+
+    def key(row: Sequence[Any]) -> tuple:
+        value = row[position] if position < len(row) else None
+        if column in RANGE_COLUMNS:
+            value = range_key(column, value)
+        elif value is not None:
+            value = str(value).strip().casefold()
+        if value is None:
+            return (missing, "")
+        return (present, value)
+
+    return key
+
+
+class ExternalSorter:
+    def __init__(
+        self,
+        key: SortKey,
+        descending: bool = False,
+        memory_rows: int = SORT_MEMORY_ROWS,
+        spill_dir: Optional[str] = None,
+    ):
+        self.key = key
+        self.descending = descending
+        self.memory_rows = max(1, memory_rows)
+        self.spill_dir = spill_dir
+        self.runs_spilled = 0
+
+    def sort(self, rows: Iterable[Sequence[Any]]) -> Iterator[Sequence[Any]]:
+        rows = iter(rows)
+        chunk = list(islice(rows, self.memory_rows + 1))
+        if len(chunk) <= self.memory_rows:
+            chunk.sort(key=self.key, reverse=self.descending)
+            yield from chunk
+            return
+
+        runs: List[str] = []
+        try:
+            pending = chunk[self.memory_rows:]
+            chunk = chunk[:self.memory_rows]
+            while chunk:
+                chunk.sort(key=self.key, reverse=self.descending)
+                runs.append(self._spill(chunk))
+                chunk = pending + list(islice(rows, self.memory_rows - len(pending)))
+                pending = []
+
+            while len(runs) > MERGE_FAN_IN:
+                merged: List[str] = []
+                try:
+                    while runs:
+                        group, runs = runs[:MERGE_FAN_IN], runs[MERGE_FAN_IN:]
+                        try:
+                            merged.append(self._spill(self._merge(group)))
+                        finally:
+                            _discard(group)
+                except BaseException:
+                    _discard(merged)
+                    raise
+                runs = merged
+            yield from self._merge(runs)
+        finally:
+            _discard(runs)
+
+    def _spill(self, rows: Iterable[Sequence[Any]]) -> str:
+        fd, path = tempfile.mkstemp(prefix="sort-run-", suffix=".tmp", dir=self.spill_dir)
+        try:
+            with open(fd, "wb") as f:
+                rows = iter(rows)
+                while block := list(islice(rows, SPILL_BLOCK_ROWS)):
+                    pickle.dump(block, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except BaseException:
+            _discard([path])
+            raise
+        self.runs_spilled += 1
+        return path
+
+    def _merge(self, paths: Sequence[str]) -> Iterator[Sequence[Any]]:
+        with ExitStack() as stack:
+            files = [stack.enter_context(open(path, "rb")) for path in paths]
+            yield from heapq.merge(*(_read_run(f) for f in files), key=self.key, reverse=self.descending)
+
+
+def _discard(paths: Iterable[str]) -> None:
+    for path in paths:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def _read_run(f: IO[bytes]) -> Iterator[Sequence[Any]]:
+    while True:
+        try:
+            block = pickle.load(f)
+        except EOFError:
+            return
+        yield from block
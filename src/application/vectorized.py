@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+from typing import Any, List, Optional, Sequence, Tuple
+
+from src.application.dto import ProcessingRequestDTO, Columns
+from src.application.filters import InFilter, RangeFilter
+from src.application.predicates import compile_filter
+
+VECTOR_BATCH_ROWS = 65_536
+
+_EXACT_KEY_TYPES = {str, datetime, date, type(None)}
+
+
+def load_numpy():
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+class VectorizedFilter:
+    def __init__(self, np, request: ProcessingRequestDTO):
+        self._np = np
+        self._column = request.filter_column
+        self._filter_value = request.filter_value
+        self._matches = compile_filter(request)
+        self._salary_targets = self._parse_salary_targets(request.filter_value)
+
+    def mask(self, cells: Sequence[Any]):
+        filter_value = self._filter_value
+        if isinstance(filter_value, RangeFilter):
+            if self._column == Columns.SALARY:
+                return self._range_mask(self._salaries(cells), filter_value.low, filter_value.high, filter_value)
+            if self._column == Columns.HIRE_DATE:
+                np = self._np
+                low = None if filter_value.low is None else np.datetime64(filter_value.low, "D")
+                high = None if filter_value.high is None else np.datetime64(filter_value.high, "D")
+                try:
+                    hire_dates = self._hire_dates(cells)
+                except TypeError:
+                    return self._scan_mask(cells)
+                return self._range_mask(hire_dates, low, high, filter_value)
+
+        if self._salary_targets is not None:
+            salaries = self._salaries(cells)
+            if isinstance(filter_value, InFilter):
+                return self._np.isin(salaries, self._salary_targets)
+            return salaries == self._salary_targets[0]
+
+        return self._encoded_mask(cells)
+
+    def positions(self, cells: Sequence[Any]) -> List[int]:
+        return self._np.flatnonzero(self.mask(cells)).tolist()
+
+    def _parse_salary_targets(self, filter_value: Any):
+        if self._column != Columns.SALARY or filter_value is None or isinstance(filter_value, RangeFilter):
+            return None
+        values = filter_value.values if isinstance(filter_value, InFilter) else (filter_value,)
+        targets = []
+        for v in values:
+            try:
+                targets.append(float(v))
+            except (ValueError, TypeError):
+                pass
+        if not targets:
+            return self._np.array([self._np.nan])
+        return self._np.array(targets, dtype=self._np.float64)
+
+    def _range_mask(self, keys, low, high, range_filter: RangeFilter):
+        mask = keys == keys
+        if low is not None:
+            mask &= (keys >= low) if range_filter.include_low else (keys > low)
+        if high is not None:
+            mask &= (keys <= high) if range_filter.include_high else (keys < high)
+        return mask
+
+    def _salaries(self, cells: Sequence[Any]):
+        np = self._np
+        try:
+            return np.array(cells, dtype=np.float64)
+        except (ValueError, TypeError):
+            return np.fromiter(map(_float_or_nan, cells), np.float64, len(cells))
+
+    def _hire_dates(self, cells: Sequence[Any]):
+        codes, distinct = self._encode(cells)
+        days = self._np.array(
+            [v.date() if isinstance(v, datetime) else None for v in distinct],
+            dtype="datetime64[D]",
+        )
+        return days[codes]
+
+    def _encoded_mask(self, cells: Sequence[Any]):
+        try:
+            codes, distinct = self._encode(cells)
+        except TypeError:
+            return self._scan_mask(cells)
+        return self._scan_mask(distinct)[codes]
+
+    def _scan_mask(self, cells: Sequence[Any]):
+        return self._np.fromiter(map(self._matches, cells), bool, len(cells))
+
+    def _encode(self, cells: Sequence[Any]) -> Tuple[Any, List[Any]]:
+        keys = cells
+        unique = dict.fromkeys(keys)
+        if len(set(map(type, cells)) - _EXACT_KEY_TYPES) > 1:
+            keys = [(v.__class__, v) for v in cells]
+            unique = dict.fromkeys(keys)
+        index = {k: i for i, k in enumerate(unique)}
+        codes = self._np.fromiter(map(index.__getitem__, keys), self._np.intp, len(cells))
+        distinct = list(unique) if keys is cells else [v for _, v in unique]
+        return codes, distinct
+
+
+def compile_vectorized_filter(request: ProcessingRequestDTO) -> Optional[VectorizedFilter]:
+    np = load_numpy()
+    if np is None:
+        return None
+    return VectorizedFilter(np, request)
+
+
+def _float_or_nan(value: Any) -> float:
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return float("nan")
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import os
+import stat
+import tempfile
+from contextlib import contextmanager
+from typing import Iterator
+
+
+def _current_umask() -> int:
+    umask = os.umask(0o022)
+    os.umask(umask)
+    return umask
+
+
+_UMASK = _current_umask()
+
+
+@contextmanager
+def atomic_output(target_path: str, suffix: str = ".tmp") -> Iterator[str]:
+    target_dir = os.path.dirname(target_path) or "."
+    os.makedirs(target_dir, exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(suffix=suffix, dir=target_dir)
+    os.close(fd)
+    try:
+        yield tmp_path
+        os.chmod(tmp_path, _output_mode(target_path))
+        os.replace(tmp_path, target_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _output_mode(target_path: str) -> int:
+    try:
+        return stat.S_IMODE(os.stat(target_path).st_mode)
+    except OSError:
+        return 0o666 & ~_UMASK
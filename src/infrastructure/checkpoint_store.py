@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from dataclasses import asdict
+from typing import Optional
+
+from src.application.checkpoints import Checkpoint
+
+
+class JsonCheckpointStore:
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    def load(self, key: str) -> Optional[Checkpoint]:
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                data = json.load(f)
+            return Checkpoint(**data)
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def save(self, key: str, checkpoint: Checkpoint) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(suffix=".tmp", dir=self.directory)
+        try:
+            with open(fd, "w", encoding="utf-8") as f:
+                json.dump(asdict(checkpoint), f, ensure_ascii=False)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def discard(self, key: str) -> None:
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + ".json")
@@ -0,0 +1,393 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import struct
+import tempfile
+import time as _time
+from array import array
+from datetime import date, datetime, time, timedelta
+from typing import Iterable, Iterator, Sequence, Any, Dict, List, Optional, Tuple
+
+from src.application.interface import ExcelReaderPort, ColumnProjection
+
+MAGIC = b"XLCC2\n"
+BLOCK_ROWS = 65536
+RACY_WINDOW_NS = 2_000_000_000
+_LEN = struct.Struct("<Q")
+
+_KIND_NONE = 0
+_KIND_STR = 1
+_KIND_INT = 2
+_KIND_FLOAT = 3
+_KIND_TRUE = 4
+_KIND_FALSE = 5
+_KIND_DATETIME = 6
+_KIND_OTHER = 7
+
+_INT64_MIN = -(2 ** 63)
+_INT64_MAX = 2 ** 63 - 1
+_DATETIME_ZERO = datetime(1, 1, 1)
+
+
+class CachedExcelReader:
+    def __init__(self, inner: ExcelReaderPort, cache_dir: str, max_cache_bytes: int = 512 * 1024 * 1024):
+        self.inner = inner
+        self.cache_dir = cache_dir
+        self.max_cache_bytes = max_cache_bytes
+
+    def iter_rows(
+        self,
+        source_path: str,
+        projection: Optional[ColumnProjection] = None,
+        sheet_name: Optional[str] = None,
+    ) -> Iterable[Sequence[Any]]:
+        projection = projection or ColumnProjection()
+        path = os.path.normcase(os.path.abspath(source_path))
+        st = os.stat(path)
+        entry_path = os.path.join(self.cache_dir, self._fingerprint(path, st, sheet_name) + ".xlcc")
+
+        blocks = self._open_entry(entry_path, path)
+        if blocks is None:
+            yield from self._read_and_store(source_path, projection, sheet_name, entry_path, path, st)
+            return
+
+        replayed = 0
+        for indexes, rows in blocks:
+            for row in rows:
+                if projection.indexes != indexes:
+                    yield from self._resume(source_path, projection, sheet_name, replayed)
+                    return
+                yield row
+                replayed += 1
+
+    def sheet_names(self, source_path: str) -> List[str]:
+        return self.inner.sheet_names(source_path)
+
+    def _resume(
+        self,
+        source_path: str,
+        projection: ColumnProjection,
+        sheet_name: Optional[str],
+        skip: int,
+    ) -> Iterator[Sequence[Any]]:
+        for i, row in enumerate(self.inner.iter_rows(source_path, projection, sheet_name)):
+            if i >= skip:
+                yield row
+
+    def _read_and_store(
+        self,
+        source_path: str,
+        projection: ColumnProjection,
+        sheet_name: Optional[str],
+        entry_path: str,
+        path: str,
+        st: os.stat_result,
+    ) -> Iterator[Sequence[Any]]:
+        os.makedirs(self.cache_dir, exist_ok=True)
+        racy = _time.time_ns() - st.st_mtime_ns < RACY_WINDOW_NS
+        digest = _content_digest(path) if racy else None
+
+        fd, tmp_path = tempfile.mkstemp(suffix=".tmp", dir=self.cache_dir)
+        completed = False
+        try:
+            with os.fdopen(fd, "wb") as out:
+                out.write(MAGIC)
+                _write_chunk(out, _dump_json({"digest": digest}))
+                storing = True
+                block: List[Sequence[Any]] = []
+                block_indexes: Optional[Tuple[int, ...]] = None
+
+                for row in self.inner.iter_rows(source_path, projection, sheet_name):
+                    indexes = projection.indexes
+                    if storing and block and (indexes != block_indexes or len(block) >= BLOCK_ROWS):
+                        storing = _try_write_block(out, block_indexes, block)
+                        block = []
+                    if storing:
+                        block_indexes = indexes
+                        block.append(row)
+                    yield row
+
+                if storing and block:
+                    storing = _try_write_block(out, block_indexes, block)
+            completed = storing and _unchanged(path, st)
+        finally:
+            if completed:
+                os.replace(tmp_path, entry_path)
+                self._evict()
+            elif os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _open_entry(
+        self, entry_path: str, source_path: str
+    ) -> Optional[Iterator[Tuple[Optional[Tuple[int, ...]], List[Tuple[Any, ...]]]]]:
+        try:
+            f = open(entry_path, "rb")
+        except OSError:
+            return None
+
+        try:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError("bad cache header")
+            digest = json.loads(_read_chunk(f))["digest"]
+            if digest is not None and digest != _content_digest(source_path):
+                raise ValueError("stale cache entry")
+            os.utime(entry_path)
+        except Exception:
+            f.close()
+            self._discard(entry_path)
+            return None
+
+        return self._iter_blocks(f, entry_path)
+
+    def _iter_blocks(self, f, entry_path: str) -> Iterator[Tuple[Optional[Tuple[int, ...]], List[Tuple[Any, ...]]]]:
+        with f:
+            while True:
+                try:
+                    header = _read_chunk(f)
+                    if header is None:
+                        return
+                    block = json.loads(header)
+                    body = f.read(block["size"])
+                    if len(body) != block["size"]:
+                        raise ValueError("truncated block")
+                    indexes = None if block["indexes"] is None else tuple(block["indexes"])
+                    rows = _decode_rows(block, memoryview(body))
+                except (ValueError, KeyError, TypeError, IndexError):
+                    self._discard(entry_path)
+                    raise ValueError("Повреждён файл кэша")
+                yield indexes, rows
+
+    def _fingerprint(self, path: str, st: os.stat_result, sheet_name: Optional[str] = None) -> str:
+        key = hashlib.blake2b(digest_size=16)
+        key.update(path.encode("utf-8", "surrogatepass"))
+        key.update(f"|{st.st_size}|{st.st_mtime_ns}|".encode())
+        if sheet_name is not None:
+            key.update(b"|sheet|" + sheet_name.encode("utf-8", "surrogatepass"))
+        return key.hexdigest()
+
+    def _evict(self) -> None:
+        entries = []
+        total = 0
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(".xlcc"):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            entries.append((st.st_mtime_ns, st.st_size, path))
+            total += st.st_size
+
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_cache_bytes:
+                break
+            self._discard(path)
+            total -= size
+
+    def _discard(self, path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+class _Uncacheable(ValueError):
+    pass
+
+
+def _content_digest(path: str) -> str:
+    content = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            content.update(chunk)
+    return content.hexdigest()
+
+
+def _unchanged(path: str, st: os.stat_result) -> bool:
+    try:
+        now = os.stat(path)
+    except OSError:
+        return False
+    return (now.st_size, now.st_mtime_ns) == (st.st_size, st.st_mtime_ns)
+
+
+def _dump_json(data: Any) -> bytes:
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8", "surrogatepass")
+
+
+def _write_chunk(out, payload: bytes) -> None:
+    out.write(_LEN.pack(len(payload)))
+    out.write(payload)
+
+
+def _read_chunk(f) -> Optional[str]:
+    raw_len = f.read(_LEN.size)
+    if not raw_len:
+        return None
+    if len(raw_len) != _LEN.size:
+        raise ValueError("truncated chunk")
+    (size,) = _LEN.unpack(raw_len)
+    payload = f.read(size)
+    if len(payload) != size:
+        raise ValueError("truncated chunk")
+    return payload.decode("utf-8", "surrogatepass")
+
+
+def _try_write_block(out, indexes: Optional[Tuple[int, ...]], rows: List[Sequence[Any]]) -> bool:
+    try:
+        header, body = _encode_block(indexes, rows)
+    except _Uncacheable:
+        return False
+    _write_chunk(out, header)
+    out.write(body)
+    return True
+
+
+def _encode_block(indexes: Optional[Tuple[int, ...]], rows: List[Sequence[Any]]) -> Tuple[bytes, bytes]:
+    lengths = array("I", (len(r) for r in rows))
+    width = max(lengths, default=0)
+    body = [lengths.tobytes()]
+    columns = []
+    for col in range(width):
+        meta, arrays = _encode_column(r[col] if col < len(r) else None for r in rows)
+        columns.append(meta)
+        body.extend(arrays)
+
+    body_bytes = b"".join(body)
+    header = {
+        "indexes": None if indexes is None else list(indexes),
+        "rows": len(rows),
+        "size": len(body_bytes),
+        "columns": columns,
+    }
+    return _dump_json(header), body_bytes
+
+
+def _encode_column(values: Iterable[Any]) -> Tuple[Dict[str, Any], List[bytes]]:
+    kinds = array("b")
+    str_index: Dict[str, int] = {}
+    strings: List[str] = []
+    str_codes = array("I")
+    ints = array("q")
+    floats = array("d")
+    datetimes = array("q")
+    other: List[Any] = []
+
+    for v in values:
+        t = type(v)
+        if v is None:
+            kinds.append(_KIND_NONE)
+        elif t is str:
+            code = str_index.get(v)
+            if code is None:
+                code = str_index[v] = len(strings)
+                strings.append(v)
+            str_codes.append(code)
+            kinds.append(_KIND_STR)
+        elif t is bool:
+            kinds.append(_KIND_TRUE if v else _KIND_FALSE)
+        elif t is int and _INT64_MIN <= v <= _INT64_MAX:
+            ints.append(v)
+            kinds.append(_KIND_INT)
+        elif t is float:
+            floats.append(v)
+            kinds.append(_KIND_FLOAT)
+        elif t is datetime and v.tzinfo is None:
+            delta = v - _DATETIME_ZERO
+            datetimes.append((delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds)
+            kinds.append(_KIND_DATETIME)
+        else:
+            other.append(_encode_other(v))
+            kinds.append(_KIND_OTHER)
+
+    arrays = [kinds.tobytes(), str_codes.tobytes(), ints.tobytes(), floats.tobytes(), datetimes.tobytes()]
+    meta = {"strings": strings, "other": other, "sizes": [len(a) for a in arrays]}
+    return meta, arrays
+
+
+def _encode_other(value: Any) -> List[Any]:
+    t = type(value)
+    if t is int:
+        return ["int", str(value)]
+    if t is datetime:
+        return ["datetime", value.isoformat()]
+    if t is date:
+        return ["date", value.isoformat()]
+    if t is time:
+        return ["time", value.isoformat()]
+    if t is timedelta:
+        return ["timedelta", value.days, value.seconds, value.microseconds]
+    raise _Uncacheable(t.__name__)
+
+
+def _decode_other(encoded: List[Any]) -> Any:
+    tag, *args = encoded
+    if tag == "int":
+        return int(args[0])
+    if tag == "datetime":
+        return datetime.fromisoformat(args[0])
+    if tag == "date":
+        return date.fromisoformat(args[0])
+    if tag == "time":
+        return time.fromisoformat(args[0])
+    if tag == "timedelta":
+        return timedelta(days=args[0], seconds=args[1], microseconds=args[2])
+    raise ValueError(tag)
+
+
+def _decode_column(meta: Dict[str, Any], body: memoryview, offset: int) -> Tuple[List[Any], int]:
+    parts = []
+    for typecode, size in zip(("b", "I", "q", "d", "q"), meta["sizes"]):
+        part = array(typecode)
+        part.frombytes(body[offset:offset + size])
+        parts.append(part)
+        offset += size
+    kinds, str_codes, ints, floats, datetimes = parts
+    strings = meta["strings"]
+
+    next_str = iter(str_codes).__next__
+    next_int = iter(ints).__next__
+    next_float = iter(floats).__next__
+    next_datetime = iter(datetimes).__next__
+    next_other = iter(meta["other"]).__next__
+
+    out: List[Any] = []
+    append = out.append
+    for kind in kinds:
+        if kind == _KIND_NONE:
+            append(None)
+        elif kind == _KIND_STR:
+            append(strings[next_str()])
+        elif kind == _KIND_INT:
+            append(next_int())
+        elif kind == _KIND_FLOAT:
+            append(next_float())
+        elif kind == _KIND_TRUE:
+            append(True)
+        elif kind == _KIND_FALSE:
+            append(False)
+        elif kind == _KIND_DATETIME:
+            append(_DATETIME_ZERO + timedelta(microseconds=next_datetime()))
+        else:
+            append(_decode_other(next_other()))
+    return out, offset
+
+
+def _decode_rows(block: Dict[str, Any], body: memoryview) -> List[Tuple[Any, ...]]:
+    lengths = array("I")
+    offset = block["rows"] * lengths.itemsize
+    lengths.frombytes(body[:offset])
+    columns = []
+    for meta in block["columns"]:
+        column, offset = _decode_column(meta, body, offset)
+        columns.append(column)
+    if not columns:
+        return [()] * len(lengths)
+
+    rows = list(zip(*columns))
+    width = len(columns)
+    return [row if n == width else row[:n] for row, n in zip(rows, lengths)]
@@ -0,0 +1,110 @@
+import csv
+from datetime import date, datetime, time
+from itertools import islice
+from typing import Iterable, Sequence, Any, Tuple, Dict, List, Optional, TYPE_CHECKING
+
+from src.infrastructure.atomic_file import atomic_output
+
+if TYPE_CHECKING:
+    from src.application.aggregates import SummarySheet
+
+BUFFER_BYTES = 1024 * 1024
+CHUNK_ROWS = 4096
+
+
+class CsvTableWriter:
+    def __init__(self, delimiter: str = ",", bom: bool = False):
+        self.delimiter = delimiter
+        self.bom = bom
+
+    def write_table(
+        self,
+        target_path: str,
+        headers: Sequence[str],
+        rows: Iterable[Sequence[Any]],
+        *,
+        generated_at_iso: str,
+        source_type_label: str = "Excel файл",
+        sheet_title: str = "Отфильтрованные данные",
+        summary: Optional["SummarySheet"] = None,
+    ) -> None:
+        self.write_tables(
+            target_path,
+            headers,
+            [(sheet_title, rows)],
+            generated_at_iso=generated_at_iso,
+            source_type_label=source_type_label,
+            summary=summary,
+        )
+
+    def write_tables(
+        self,
+        target_path: str,
+        headers: Sequence[str],
+        tables: Iterable[Tuple[str, Iterable[Sequence[Any]]]],
+        *,
+        generated_at_iso: str,
+        source_type_label: str = "Excel файл",
+        summary: Optional["SummarySheet"] = None,
+    ) -> None:
+        if summary is not None:
+            raise ValueError("Сводный лист поддерживается только в формате XLSX")
+        tables = list(tables)
+        with_sheet = len(tables) > 1
+
+        with atomic_output(target_path) as tmp_path:
+            encoding = "utf-8-sig" if self.bom else "utf-8"
+            with open(tmp_path, "w", encoding=encoding, newline="", buffering=BUFFER_BYTES) as f:
+                out = csv.writer(f, delimiter=self.delimiter, lineterminator="\r\n")
+                out.writerow(["Лист", *headers] if with_sheet else list(headers))
+                for title, rows in tables:
+                    prefix = [title] if with_sheet else []
+                    self._write_rows(out, rows, prefix)
+
+    def append_table(
+        self,
+        target_path: str,
+        headers: Sequence[str],
+        rows: Iterable[Sequence[Any]],
+        *,
+        generated_at_iso: str,
+        source_type_label: str = "Excel файл",
+        sheet_title: str = "Отфильтрованные данные",
+    ) -> None:
+        with open(target_path, encoding="utf-8-sig", newline="") as f:
+            existing_headers = next(csv.reader(f, delimiter=self.delimiter), None)
+        if existing_headers != list(headers):
+            raise ValueError(f"Заголовок файла результата не совпадает: {target_path}")
+
+        with open(target_path, "a", encoding="utf-8", newline="", buffering=BUFFER_BYTES) as f:
+            out = csv.writer(f, delimiter=self.delimiter, lineterminator="\r\n")
+            self._write_rows(out, rows, [])
+
+    def _write_rows(self, out, rows: Iterable[Sequence[Any]], prefix: List[Any]) -> None:
+        it = iter(rows)
+        while True:
+            chunk = list(islice(it, CHUNK_ROWS))
+            if not chunk:
+                return
+            out.writerows([prefix + [_format_value(v) for v in row] for row in chunk])
+
+
+def _format_value(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        if value.time() == time(0, 0):
+            return value.date().isoformat()
+        return value.isoformat(sep=" ")
+    if isinstance(value, (date, time)):
+        return value.isoformat()
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def csv_writers(bom: bool = False) -> Dict[str, CsvTableWriter]:
+    return {
+        ".csv": CsvTableWriter(delimiter=",", bom=bom),
+        ".tsv": CsvTableWriter(delimiter="\t", bom=bom),
+    }
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import logging
+import zipfile
+from typing import Any, Iterable, List, Optional, Sequence
+from xml.etree.ElementTree import ParseError
+
+from src.application.interface import ExcelReaderPort, ColumnProjection
+
+READER_OPENPYXL = "openpyxl"
+READER_NATIVE = "native"
+READER_KINDS = (READER_OPENPYXL, READER_NATIVE)
+
+FALLBACK_ERRORS = (zipfile.BadZipFile, ParseError, KeyError)
+
+logger = logging.getLogger(__name__)
+
+
+class FallbackExcelReader:
+    def __init__(self, primary: ExcelReaderPort, fallback: ExcelReaderPort):
+        self.primary = primary
+        self.fallback = fallback
+
+    def iter_rows(
+        self,
+        source_path: str,
+        projection: Optional[ColumnProjection] = None,
+        sheet_name: Optional[str] = None,
+    ) -> Iterable[Sequence[Any]]:
+        rows = iter(self.primary.iter_rows(source_path, projection, sheet_name))
+        try:
+            first = next(rows, None)
+        except FALLBACK_ERRORS as e:
+            logger.warning("Файл %s читается через openpyxl: %r", source_path, e)
+            yield from self.fallback.iter_rows(source_path, projection, sheet_name)
+            return
+        if first is None:
+            return
+        yield first
+        yield from rows
+
+    def sheet_names(self, source_path: str) -> List[str]:
+        try:
+            return self.primary.sheet_names(source_path)
+        except FALLBACK_ERRORS as e:
+            logger.warning("Листы файла %s читаются через openpyxl: %r", source_path, e)
+            return self.fallback.sheet_names(source_path)
+
+
+def excel_reader(kind: str = READER_OPENPYXL) -> ExcelReaderPort:
+    from src.infrastructure.openpyxl_reader import OpenPyxlExcelReader
+
+    if kind == READER_NATIVE:
+        from src.infrastructure.native_xlsx_reader import NativeXlsxReader
+
+        return FallbackExcelReader(NativeXlsxReader(), OpenPyxlExcelReader())
+    if kind == READER_OPENPYXL:
+        return OpenPyxlExcelReader()
+    raise ValueError(f"Неизвестный способ чтения: {kind}")
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import os
+from glob import glob
 from pathlib import Path
+from typing import List
 
 
 class LocalFileSystem:
@@ -32,3 +34,9 @@ class LocalFileSystem:
 
     def get_size_bytes(self, path: str) -> int:
         return os.path.getsize(path)
+
+    def get_mtime_ns(self, path: str) -> int:
+        return os.stat(path).st_mtime_ns
+
+    def glob(self, pattern: str) -> List[str]:
+        return sorted(self.normalize_path(p) for p in glob(pattern, recursive=True) if os.path.isfile(p))
@@ -0,0 +1,52 @@
+import json
+import logging
+import os
+from dataclasses import asdict
+from datetime import datetime
+from logging.handlers import RotatingFileHandler
+from typing import Optional
+
+from src.application.dto import ProcessingResultDTO
+
+LOGGER_NAME = "excel_filter.metrics"
+
+
+class JsonLogMetricsSink:
+    def __init__(self, logger: Optional[logging.Logger] = None):
+        self.logger = logger or logging.getLogger(LOGGER_NAME)
+
+    def __call__(self, result: ProcessingResultDTO) -> None:
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        self.logger.info(json.dumps(self.record(result), ensure_ascii=False, default=str))
+
+    def record(self, result: ProcessingResultDTO) -> dict:
+        metrics = asdict(result.metrics) if result.metrics is not None else {}
+        metrics["stage_seconds"] = dict(metrics.get("stage_seconds", ()))
+        return {
+            "event": "processing_finished",
+            "ts": datetime.now().isoformat(timespec="seconds"),
+            "success": result.success,
+            "error_code": result.error_code,
+            "output_path": result.output_path,
+            **metrics,
+        }
+
+
+def log_event(event: str, logger: Optional[logging.Logger] = None, **fields) -> None:
+    logger = logger or logging.getLogger(LOGGER_NAME)
+    record = {"event": event, "ts": datetime.now().isoformat(timespec="seconds"), **fields}
+    logger.info(json.dumps(record, ensure_ascii=False, default=str))
+
+
+def log_metrics_to_file(path: str, max_bytes: int = 5 * 1024 * 1024, backups: int = 3) -> logging.Logger:
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    logger = logging.getLogger(LOGGER_NAME)
+    target = os.path.abspath(path)
+    if not any(getattr(h, "baseFilename", None) == target for h in logger.handlers):
+        handler = RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backups, encoding="utf-8")
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    return logger
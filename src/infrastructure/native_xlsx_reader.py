@@ -0,0 +1,354 @@
+from __future__ import annotations
+
+import posixpath
+import re
+import zipfile
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Iterable, Iterator, Sequence, Any, Dict, List, Optional, Set, Tuple
+from xml.etree.ElementTree import iterparse
+
+from src.application.interface import ColumnProjection
+
+MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+DOC_REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+STRICT_DOC_REL_NS = "http://purl.oclc.org/ooxml/officeDocument/relationships"
+
+WINDOWS_EPOCH = datetime(1899, 12, 30)
+MAC_EPOCH = datetime(1904, 1, 1)
+SECS_PER_DAY = 86400
+
+BUILTIN_DATE_FORMATS = {14, 15, 16, 17, 18, 19, 20, 21, 22, 45, 46, 47}
+BUILTIN_TIMEDELTA_FORMATS = {46}
+
+_FORMAT_STRIP_RE = re.compile(r'\\.|"[^"]*"|\[(?![hms]+\])[^\]]*\]', re.IGNORECASE)
+_DATE_TOKEN_RE = re.compile(r"[dmyhs]", re.IGNORECASE)
+_TIMEDELTA_RE = re.compile(r"\[[hms]+\]", re.IGNORECASE)
+_CELL_REF_RE = re.compile(r"([A-Z]+)(\d+)")
+
+
+@dataclass(frozen=True)
+class _CellDecoder:
+    shared_strings: List[str]
+    date_styles: Set[int]
+    timedelta_styles: Set[int]
+    epoch: datetime
+    v_tag: str
+    is_tag: str
+
+
+class NativeXlsxReader:
+    def iter_rows(
+        self,
+        source_path: str,
+        projection: Optional[ColumnProjection] = None,
+        sheet_name: Optional[str] = None,
+    ) -> Iterable[Sequence[Any]]:
+        projection = projection or ColumnProjection()
+        with zipfile.ZipFile(source_path) as zf:
+            sheet_path, epoch = self._sheet_path(zf, sheet_name)
+            shared_strings = self._shared_strings(zf)
+            date_styles, timedelta_styles = self._date_styles(zf)
+
+            with zf.open(sheet_path) as f:
+                yield from self._iter_sheet(f, projection, shared_strings, date_styles, timedelta_styles, epoch)
+
+    def sheet_names(self, source_path: str) -> List[str]:
+        with zipfile.ZipFile(source_path) as zf:
+            sheets, _, _ = self._workbook_sheets(zf)
+        return [name for name, _, is_worksheet in sheets if is_worksheet]
+
+    def _sheet_path(self, zf: zipfile.ZipFile, sheet_name: Optional[str]) -> Tuple[str, datetime]:
+        sheets, active_tab, epoch = self._workbook_sheets(zf)
+        if sheet_name is None:
+            if not sheets:
+                raise ValueError("В файле нет активного листа")
+            _, path, _ = sheets[active_tab if 0 <= active_tab < len(sheets) else 0]
+            return path, epoch
+
+        for name, path, is_worksheet in sheets:
+            if name == sheet_name and is_worksheet:
+                return path, epoch
+        raise ValueError(f"В файле нет листа '{sheet_name}'")
+
+    def _workbook_sheets(self, zf: zipfile.ZipFile) -> Tuple[List[Tuple[str, str, bool]], int, datetime]:
+        active_tab = 0
+        epoch = WINDOWS_EPOCH
+        declared: List[Tuple[str, str]] = []
+
+        with zf.open("xl/workbook.xml") as f:
+            for _, el in iterparse(f, events=("end",)):
+                tag = _local(el.tag)
+                if tag == "workbookPr":
+                    if el.get("date1904") in ("1", "true"):
+                        epoch = MAC_EPOCH
+                elif tag == "workbookView":
+                    active_tab = int(el.get("activeTab", "0"))
+                elif tag == "sheet":
+                    rid = el.get(f"{{{DOC_REL_NS}}}id") or el.get(f"{{{STRICT_DOC_REL_NS}}}id")
+                    declared.append((el.get("name", ""), rid))
+
+        rels: Dict[str, Tuple[str, str]] = {}
+        with zf.open("xl/_rels/workbook.xml.rels") as f:
+            for _, el in iterparse(f, events=("end",)):
+                if el.tag == f"{{{REL_NS}}}Relationship":
+                    rels[el.get("Id")] = (el.get("Target", ""), el.get("Type", ""))
+
+        sheets: List[Tuple[str, str, bool]] = []
+        for name, rid in declared:
+            if rid not in rels:
+                continue
+            target, rel_type = rels[rid]
+            if target.startswith("/"):
+                path = target.lstrip("/")
+            else:
+                path = posixpath.normpath(posixpath.join("xl", target))
+            sheets.append((name, path, not rel_type.endswith("/chartsheet")))
+        return sheets, active_tab, epoch
+
+    def _shared_strings(self, zf: zipfile.ZipFile) -> List[str]:
+        try:
+            f = zf.open("xl/sharedStrings.xml")
+        except KeyError:
+            return []
+
+        strings: List[str] = []
+        with f:
+            for _, el in iterparse(f, events=("end",)):
+                if _local(el.tag) != "si":
+                    continue
+                strings.append(_text_of(el))
+                el.clear()
+        return strings
+
+    def _date_styles(self, zf: zipfile.ZipFile) -> Tuple[Set[int], Set[int]]:
+        try:
+            f = zf.open("xl/styles.xml")
+        except KeyError:
+            return set(), set()
+
+        custom_formats: Dict[int, str] = {}
+        xf_formats: List[int] = []
+        with f:
+            in_cell_xfs = False
+            for event, el in iterparse(f, events=("start", "end")):
+                tag = _local(el.tag)
+                if tag == "cellXfs":
+                    in_cell_xfs = event == "start"
+                elif event == "end" and tag == "numFmt":
+                    custom_formats[int(el.get("numFmtId"))] = el.get("formatCode", "")
+                elif event == "end" and tag == "xf" and in_cell_xfs:
+                    xf_formats.append(int(el.get("numFmtId", "0")))
+
+        date_styles: Set[int] = set()
+        timedelta_styles: Set[int] = set()
+        for style_idx, fmt_id in enumerate(xf_formats):
+            fmt = custom_formats.get(fmt_id)
+            if fmt is None:
+                if fmt_id in BUILTIN_TIMEDELTA_FORMATS:
+                    timedelta_styles.add(style_idx)
+                elif fmt_id in BUILTIN_DATE_FORMATS:
+                    date_styles.add(style_idx)
+            elif _is_timedelta_format(fmt):
+                timedelta_styles.add(style_idx)
+            elif _is_date_format(fmt):
+                date_styles.add(style_idx)
+        return date_styles, timedelta_styles
+
+    def _iter_sheet(
+        self,
+        f,
+        projection: ColumnProjection,
+        shared_strings: List[str],
+        date_styles: Set[int],
+        timedelta_styles: Set[int],
+        epoch: datetime,
+    ) -> Iterator[Tuple[Any, ...]]:
+        context = iterparse(f, events=("start", "end"))
+        ns = MAIN_NS
+        for event, el in context:
+            if event == "start":
+                ns = _namespace(el.tag) or ns
+                break
+
+        row_tag = f"{{{ns}}}row"
+        c_tag = f"{{{ns}}}c"
+        dimension_tag = f"{{{ns}}}dimension"
+        sheet_data_tag = f"{{{ns}}}sheetData"
+        decoder = _CellDecoder(
+            shared_strings, date_styles, timedelta_styles, epoch,
+            v_tag=f"{{{ns}}}v",
+            is_tag=f"{{{ns}}}is",
+        )
+
+        width: Optional[int] = None
+        sheet_data = None
+        next_row = 1
+        last_wanted: Optional[Tuple[int, ...]] = None
+        positions: Dict[int, int] = {}
+
+        for event, el in context:
+            tag = el.tag
+            if event == "start":
+                if tag == sheet_data_tag:
+                    sheet_data = el
+                continue
+
+            if tag == dimension_tag:
+                width = _dimension_width(el.get("ref", ""))
+                continue
+            if tag != row_tag:
+                continue
+
+            r = el.get("r")
+            row_idx = int(r) if r else next_row
+
+            wanted = projection.indexes
+            if wanted is None:
+                values = self._row_values(el, c_tag, decoder)
+                if width is not None and len(values) < width:
+                    values.extend([None] * (width - len(values)))
+                empty_row: Tuple[Any, ...] = (None,) * width if width is not None else ()
+            else:
+                if wanted is not last_wanted:
+                    positions = {idx: pos for pos, idx in enumerate(wanted)}
+                    last_wanted = wanted
+                values = self._projected_values(el, positions, c_tag, decoder)
+                empty_row = (None,) * len(wanted)
+
+            if sheet_data is not None:
+                sheet_data.clear()
+            else:
+                el.clear()
+
+            while next_row < row_idx:
+                yield empty_row
+                next_row += 1
+            if row_idx >= next_row:
+                yield tuple(values)
+                next_row = row_idx + 1
+
+    def _row_values(self, row_el, c_tag: str, decoder: _CellDecoder) -> List[Any]:
+        values: List[Any] = []
+        col = 0
+        for c in row_el.iter(c_tag):
+            ref = c.get("r")
+            if ref:
+                col_idx = _column_index(ref)
+                if col_idx > col:
+                    values.extend([None] * (col_idx - col))
+                    col = col_idx
+            values.append(self._cell_value(c, decoder))
+            col += 1
+        return values
+
+    def _projected_values(self, row_el, positions: Dict[int, int], c_tag: str, decoder: _CellDecoder) -> List[Any]:
+        values: List[Any] = [None] * len(positions)
+        col = 0
+        for c in row_el.iter(c_tag):
+            ref = c.get("r")
+            if ref:
+                col = _column_index(ref)
+            pos = positions.get(col)
+            if pos is not None:
+                values[pos] = self._cell_value(c, decoder)
+            col += 1
+        return values
+
+    def _cell_value(self, c, decoder: _CellDecoder) -> Any:
+        data_type = c.get("t", "n")
+
+        if data_type == "inlineStr":
+            inline = c.find(decoder.is_tag)
+            return _text_of(inline) if inline is not None else None
+
+        v = c.find(decoder.v_tag)
+        if v is None or v.text is None:
+            return None
+        text = v.text
+
+        if data_type == "n":
+            number = _to_number(text)
+            style = c.get("s")
+            if style is not None:
+                style_idx = int(style)
+                if style_idx in decoder.date_styles:
+                    return _from_excel(number, decoder.epoch)
+                if style_idx in decoder.timedelta_styles:
+                    return timedelta(milliseconds=round(number * SECS_PER_DAY * 1000))
+            return number
+        if data_type == "s":
+            return decoder.shared_strings[int(text)]
+        if data_type == "b":
+            return bool(int(text))
+        if data_type == "d":
+            return datetime.fromisoformat(text.rstrip("Z"))
+        return text
+
+
+def _local(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def _namespace(tag: str) -> Optional[str]:
+    if tag.startswith("{"):
+        return tag[1:].split("}", 1)[0]
+    return None
+
+
+def _text_of(el) -> str:
+    parts: List[str] = []
+    for child in el.iter():
+        tag = _local(child.tag)
+        if tag == "rPh":
+            break
+        if tag == "t" and child.text:
+            parts.append(child.text)
+    return "".join(parts)
+
+
+def _column_index(ref: str) -> int:
+    idx = 0
+    for ch in ref:
+        if "A" <= ch <= "Z":
+            idx = idx * 26 + (ord(ch) - 64)
+        else:
+            break
+    return idx - 1
+
+
+def _dimension_width(ref: str) -> Optional[int]:
+    last = ref.split(":")[-1]
+    m = _CELL_REF_RE.match(last)
+    if m is None:
+        return None
+    return _column_index(m.group(1)) + 1
+
+
+def _to_number(text: str) -> int | float:
+    if "." in text or "E" in text or "e" in text:
+        return float(text)
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+def _is_date_format(fmt: str) -> bool:
+    fmt = _FORMAT_STRIP_RE.sub("", fmt.split(";")[0])
+    return _DATE_TOKEN_RE.search(fmt) is not None
+
+
+def _is_timedelta_format(fmt: str) -> bool:
+    return _TIMEDELTA_RE.search(fmt.split(";")[0]) is not None
+
+
+def _from_excel(value: float, epoch: datetime) -> Any:
+    day, fraction = divmod(value, 1)
+    diff = timedelta(milliseconds=round(fraction * SECS_PER_DAY * 1000))
+    if 0 <= value < 1 and diff.days == 0:
+        return (datetime.min + diff).time()
+    if 0 < value < 60 and epoch == WINDOWS_EPOCH:
+        day += 1
+    return epoch + timedelta(days=day) + diff
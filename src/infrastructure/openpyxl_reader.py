@@ -1,23 +1,46 @@
 from contextlib import contextmanager
-from typing import Iterable, Sequence, Any
+from typing import Iterable, Sequence, Any, Optional, List
 
-import openpyxl
+from src.application.interface import ColumnProjection
 
 
 class OpenPyxlExcelReader:
-    def iter_rows(self, source_path: str) -> Iterable[Sequence[Any]]:
-        with self._workbook(source_path) as sheet:
+    def iter_rows(
+        self,
+        source_path: str,
+        projection: Optional[ColumnProjection] = None,
+        sheet_name: Optional[str] = None,
+    ) -> Iterable[Sequence[Any]]:
+        with self._workbook(source_path, sheet_name) as sheet:
             for row in sheet.iter_rows(values_only=True):
+                if projection is not None:
+                    row = projection.project(row)
                 yield row
 
+    def sheet_names(self, source_path: str) -> List[str]:
+        import openpyxl
+
+        wb = openpyxl.load_workbook(source_path, read_only=True, data_only=True)
+        try:
+            return [ws.title for ws in wb.worksheets]
+        finally:
+            wb.close()
+
     @contextmanager
-    def _workbook(self, source_path: str):
+    def _workbook(self, source_path: str, sheet_name: Optional[str] = None):
+        import openpyxl
+
         wb = None
         try:
             wb = openpyxl.load_workbook(source_path, read_only=True, data_only=True)
-            sheet = wb.active
-            if sheet is None:
-                raise ValueError("В файле нет активного листа")
+            if sheet_name is None:
+                sheet = wb.active
+                if sheet is None:
+                    raise ValueError("В файле нет активного листа")
+            else:
+                if sheet_name not in wb.sheetnames:
+                    raise ValueError(f"В файле нет листа '{sheet_name}'")
+                sheet = wb[sheet_name]
             yield sheet
         finally:
             if wb is not None:
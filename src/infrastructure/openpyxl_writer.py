@@ -1,9 +1,20 @@
+from __future__ import annotations
+
 import os
+import re
 from datetime import datetime
-from typing import Sequence, Any
+from itertools import chain
+from typing import Iterable, Iterator, Sequence, Any, Optional, Tuple, TYPE_CHECKING
+
+from src.infrastructure.atomic_file import atomic_output
+
+if TYPE_CHECKING:
+    from openpyxl.cell import WriteOnlyCell
 
-import openpyxl
-from openpyxl.styles import Font, Alignment
+    from src.application.aggregates import SummarySheet
+
+_INVALID_TITLE_CHARS_RE = re.compile(r"[\[\]:*?/\\]")
+MAX_SHEET_TITLE = 31
 
 
 class OpenPyxlExcelWriter:
@@ -11,37 +22,131 @@ class OpenPyxlExcelWriter:
         self,
         target_path: str,
         headers: Sequence[str],
-        rows: Sequence[Sequence[Any]],
+        rows: Iterable[Sequence[Any]],
         *,
         generated_at_iso: str,
         source_type_label: str = "Excel файл",
         sheet_title: str = "Отфильтрованные данные",
+        summary: Optional[SummarySheet] = None,
+    ) -> None:
+        self.write_tables(
+            target_path,
+            headers,
+            [(sheet_title, rows)],
+            generated_at_iso=generated_at_iso,
+            source_type_label=source_type_label,
+            summary=summary,
+        )
+
+    def write_tables(
+        self,
+        target_path: str,
+        headers: Sequence[str],
+        tables: Iterable[Tuple[str, Iterable[Sequence[Any]]]],
+        *,
+        generated_at_iso: str,
+        source_type_label: str = "Excel файл",
+        summary: Optional[SummarySheet] = None,
     ) -> None:
-        os.makedirs(os.path.dirname(target_path) or ".", exist_ok=True)
+        import openpyxl
 
-        wb = openpyxl.Workbook()
+        wb = openpyxl.Workbook(write_only=True)
         try:
-            ws = wb.active
-            ws.title = sheet_title
+            with atomic_output(target_path, suffix=".xlsx") as tmp_path:
+                used_titles = set()
+                for title, rows in tables:
+                    ws = wb.create_sheet(title=self._sheet_title(title, used_titles))
+                    self._write_sheet(ws, headers, rows, generated_at_iso, source_type_label)
+                if summary is not None:
+                    ws = wb.create_sheet(title=self._sheet_title(summary.title, used_titles))
+                    self._write_sheet(ws, summary.headers, summary.rows, generated_at_iso, source_type_label)
 
-            ws["A1"] = "Тип файла:"
-            ws["A1"].font = Font(bold=True)
-            ws["B1"] = source_type_label
+                wb.save(tmp_path)
+        except BaseException:
+            self._discard_sheets(wb)
+            raise
+        finally:
+            wb.close()
 
-            ws["A2"] = "Дата формирования"
-            ws["A2"].font = Font(bold=True)
-            ws["B2"] = self._format_generated_at(generated_at_iso)
+    def _discard_sheets(self, wb) -> None:
+        for ws in wb.worksheets:
+            if ws.closed:
+                continue
+            try:
+                ws.close()
+            except Exception:
+                pass
+            writer = getattr(ws, "_writer", None)
+            if writer is not None and os.path.exists(writer.out):
+                os.remove(writer.out)
 
-            start_row = 4
+    def append_table(
+        self,
+        target_path: str,
+        headers: Sequence[str],
+        rows: Iterable[Sequence[Any]],
+        *,
+        generated_at_iso: str,
+        source_type_label: str = "Excel файл",
+        sheet_title: str = "Отфильтрованные данные",
+    ) -> None:
+        existing = self._existing_rows(target_path, headers)
+        next(existing)
+        self.write_table(
+            target_path,
+            headers,
+            chain(existing, rows),
+            generated_at_iso=generated_at_iso,
+            source_type_label=source_type_label,
+            sheet_title=sheet_title,
+        )
 
-            self._write_header(ws, start_row, headers)
-            self._write_rows(ws, start_row + 1, rows)
-            self._auto_width(ws, headers)
+    def _existing_rows(self, target_path: str, headers: Sequence[str]) -> Iterator[Sequence[Any]]:
+        import openpyxl
 
-            wb.save(target_path)
+        wb = openpyxl.load_workbook(target_path, read_only=True)
+        try:
+            width = len(headers)
+            rows = wb.worksheets[0].iter_rows(values_only=True)
+            for row in rows:
+                if tuple(row[:width]) == tuple(headers):
+                    break
+            else:
+                raise ValueError(f"В файле результата не найден заголовок: {target_path}")
+            yield None
+            for row in rows:
+                yield row[:width]
         finally:
             wb.close()
 
+    def _write_sheet(
+        self,
+        ws,
+        headers: Sequence[str],
+        rows: Iterable[Sequence[Any]],
+        generated_at_iso: str,
+        source_type_label: str,
+    ) -> None:
+        self._auto_width(ws, headers)
+
+        ws.append([self._bold(ws, "Тип файла:"), source_type_label])
+        ws.append([self._bold(ws, "Дата формирования"), self._format_generated_at(generated_at_iso)])
+        ws.append([])
+
+        self._write_header(ws, headers)
+        self._write_rows(ws, rows)
+
+    def _sheet_title(self, title: str, used: set) -> str:
+        base = _INVALID_TITLE_CHARS_RE.sub("_", title).strip("'")[:MAX_SHEET_TITLE] or "Лист"
+        candidate = base
+        n = 2
+        while candidate.casefold() in used:
+            suffix = f" ({n})"
+            candidate = base[:MAX_SHEET_TITLE - len(suffix)] + suffix
+            n += 1
+        used.add(candidate.casefold())
+        return candidate
+
     def _format_generated_at(self, generated_at_iso: str) -> str:
         try:
             dt = datetime.fromisoformat(generated_at_iso)
@@ -49,23 +154,36 @@ class OpenPyxlExcelWriter:
         except Exception:
             return generated_at_iso
 
-    def _write_header(self, ws, row_idx: int, headers: Sequence[str]) -> None:
+    def _bold(self, ws, value: Any) -> WriteOnlyCell:
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.styles import Font
+
+        cell = WriteOnlyCell(ws, value=value)
+        cell.font = Font(bold=True)
+        return cell
+
+    def _write_header(self, ws, headers: Sequence[str]) -> None:
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.styles import Font, Alignment
+
         bold = Font(bold=True)
         align = Alignment(horizontal="center", vertical="center")
 
-        for col_idx, h in enumerate(headers, start=1):
-            cell = ws.cell(row=row_idx, column=col_idx, value=h)
+        header_cells = []
+        for h in headers:
+            cell = WriteOnlyCell(ws, value=h)
             cell.font = bold
             cell.alignment = align
+            header_cells.append(cell)
+        ws.append(header_cells)
 
-    def _write_rows(self, ws, start_row: int, rows: Sequence[Sequence[Any]]) -> None:
-        r = start_row
+    def _write_rows(self, ws, rows: Iterable[Sequence[Any]]) -> None:
         for row in rows:
-            for c, value in enumerate(row, start=1):
-                ws.cell(row=r, column=c, value=value)
-            r += 1
+            ws.append(row)
 
     def _auto_width(self, ws, headers: Sequence[str]) -> None:
+        from openpyxl.utils import get_column_letter
+
         for col_idx, header in enumerate(headers, start=1):
-            letter = openpyxl.utils.get_column_letter(col_idx)
+            letter = get_column_letter(col_idx)
             ws.column_dimensions[letter].width = max(len(str(header)) + 5, 12)
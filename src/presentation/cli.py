@@ -0,0 +1,333 @@
+import argparse
+import csv
+import glob
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from dataclasses import dataclass, asdict
+from typing import List, Dict, Optional, Tuple
+
+from src.application.dto import ProcessingRequestDTO, ProcessingResultDTO, PartitionRequestDTO, Columns
+from src.application.interactors.partition_excel_interactor import PartitionExcelInteractor
+from src.application.interactors.process_excel_interactor import ProcessExcelInteractor
+from src.application.sorting import SORT_MEMORY_ROWS
+from src.infrastructure.checkpoint_store import JsonCheckpointStore
+from src.infrastructure.csv_writer import csv_writers
+from src.infrastructure.fallback_reader import READER_KINDS, READER_OPENPYXL, excel_reader
+from src.infrastructure.filesystem import LocalFileSystem
+from src.infrastructure.metrics_log import JsonLogMetricsSink, log_metrics_to_file
+from src.infrastructure.openpyxl_writer import OpenPyxlExcelWriter
+
+EXIT_OK = 0
+EXIT_JOB_FAILED = 1
+EXIT_BAD_MANIFEST = 2
+
+MANIFEST_FIELDS = ("source", "column", "value", "target")
+
+DEFAULT_CHECKPOINT_DIR = os.path.join(os.path.expanduser("~"), ".cache", "excel_filter", "checkpoints")
+
+
+@dataclass(frozen=True)
+class BatchJob:
+    source: str
+    column: Columns
+    value: str
+    target: str
+    sheets: Tuple[str, ...] = ()
+    all_sheets: bool = False
+    split_sheets: bool = False
+    sources: Tuple[str, ...] = ()
+    source_column: bool = False
+    incremental: bool = False
+    order_by: Optional[Columns] = None
+    descending: bool = False
+    summary: bool = False
+
+    def source_list(self) -> Tuple[str, ...]:
+        return self.sources or (self.source,)
+
+
+class ManifestError(ValueError):
+    pass
+
+
+def parse_column(raw: str) -> Columns:
+    raw = (raw or "").strip()
+    for c in Columns:
+        if raw.casefold() in (c.value.casefold(), c.name.casefold()):
+            return c
+    raise ManifestError(f"Неизвестный столбец: '{raw}'")
+
+
+def parse_sheets(raw) -> Tuple[bool, Tuple[str, ...]]:
+    if isinstance(raw, list):
+        names = tuple(str(n).strip() for n in raw if str(n).strip())
+    else:
+        text = str(raw or "").strip()
+        if text == "*":
+            return True, ()
+        names = tuple(n.strip() for n in text.split(",") if n.strip())
+    return False, names
+
+
+def parse_sources(raw) -> Tuple[str, ...]:
+    if isinstance(raw, list):
+        return tuple(str(p).strip() for p in raw if str(p).strip())
+    return tuple(p.strip() for p in str(raw or "").split(";") if p.strip())
+
+
+def parse_flag(raw) -> bool:
+    if isinstance(raw, bool):
+        return raw
+    return str(raw or "").strip().casefold() in ("1", "true", "yes", "да")
+
+
+def load_manifest(path: str) -> List[BatchJob]:
+    if path.lower().endswith(".json"):
+        with open(path, encoding="utf-8") as f:
+            records = json.load(f)
+        if isinstance(records, dict):
+            records = records.get("jobs", [])
+    else:
+        with open(path, encoding="utf-8-sig", newline="") as f:
+            records = list(csv.DictReader(f))
+
+    jobs: List[BatchJob] = []
+    for n, rec in enumerate(records, start=1):
+        if not isinstance(rec, dict):
+            raise ManifestError(f"Задание {n}: ожидается объект с полями {', '.join(MANIFEST_FIELDS)}")
+        missing = [k for k in MANIFEST_FIELDS if not str(rec.get(k) or "").strip()]
+        if missing:
+            raise ManifestError(f"Задание {n}: не заполнены поля {', '.join(missing)}")
+        all_sheets, sheets = parse_sheets(rec.get("sheets"))
+        sources = parse_sources(rec["source"])
+        jobs.append(BatchJob(
+            source="; ".join(sources),
+            column=parse_column(str(rec["column"])),
+            value=str(rec["value"]),
+            target=str(rec["target"]),
+            sheets=sheets,
+            all_sheets=all_sheets,
+            split_sheets=parse_flag(rec.get("split_sheets")),
+            sources=sources if len(sources) > 1 else (),
+            source_column=parse_flag(rec.get("source_column")),
+            incremental=parse_flag(rec.get("incremental")),
+            order_by=parse_column(str(rec["order_by"])) if str(rec.get("order_by") or "").strip() else None,
+            descending=parse_flag(rec.get("descending")),
+            summary=parse_flag(rec.get("summary")),
+        ))
+    return jobs
+
+
+def run_job(
+    job: BatchJob,
+    csv_bom: bool = False,
+    pipelined: bool = False,
+    checkpoint_dir: str = DEFAULT_CHECKPOINT_DIR,
+    sort_memory_rows: int = SORT_MEMORY_ROWS,
+    reader: str = READER_OPENPYXL,
+    max_size_bytes: Optional[int] = None,
+) -> ProcessingResultDTO:
+    interactor = ProcessExcelInteractor(
+        fs=LocalFileSystem(),
+        reader=excel_reader(reader),
+        writer=OpenPyxlExcelWriter(),
+        max_size_bytes=max_size_bytes,
+        sheet_workers=1,
+        writers_by_extension=csv_writers(bom=csv_bom),
+        pipelined=pipelined,
+        checkpoints=JsonCheckpointStore(checkpoint_dir),
+        sort_memory_rows=sort_memory_rows,
+    )
+    req = ProcessingRequestDTO(
+        source_path=job.source,
+        target_path=job.target,
+        filter_column=job.column,
+        filter_value_raw=job.value,
+        all_sheets=job.all_sheets,
+        sheet_names=job.sheets,
+        split_sheets=job.split_sheets,
+        source_paths=job.sources,
+        add_source_column=job.source_column,
+        incremental=job.incremental,
+        order_by=job.order_by,
+        order_descending=job.descending,
+        summary=job.summary,
+    )
+    try:
+        return interactor(req)
+    except Exception as e:
+        return ProcessingResultDTO(False, f"Непредвиденная ошибка: {e}", error_code="unexpected_error")
+
+
+def estimate_job_bytes(job: BatchJob, bytes_per_source_byte: int) -> int:
+    total = 0
+    for pattern in job.source_list():
+        for path in glob.glob(pattern, recursive=True) or [pattern]:
+            try:
+                total += os.path.getsize(path)
+            except OSError:
+                pass
+    return total * bytes_per_source_byte
+
+
+def run_batch(
+    jobs: List[BatchJob],
+    *,
+    workers: Optional[int] = None,
+    memory_budget_bytes: Optional[int] = None,
+    bytes_per_source_byte: int = 10,
+    csv_bom: bool = False,
+    pipelined: bool = False,
+    checkpoint_dir: str = DEFAULT_CHECKPOINT_DIR,
+    sort_memory_rows: int = SORT_MEMORY_ROWS,
+    reader: str = READER_OPENPYXL,
+    max_size_bytes: Optional[int] = None,
+) -> List[ProcessingResultDTO]:
+    results: List[Optional[ProcessingResultDTO]] = [None] * len(jobs)
+    estimates = [estimate_job_bytes(j, bytes_per_source_byte) for j in jobs]
+    pending = list(range(len(jobs)))
+
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        running: Dict = {}
+        in_use = 0
+        while pending or running:
+            while pending:
+                i = pending[0]
+                fits = memory_budget_bytes is None or in_use + estimates[i] <= memory_budget_bytes
+                if running and not fits:
+                    break
+                pending.pop(0)
+                future = pool.submit(
+                    run_job, jobs[i], csv_bom, pipelined, checkpoint_dir, sort_memory_rows, reader, max_size_bytes,
+                )
+                running[future] = i
+                in_use += estimates[i]
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for fut in done:
+                i = running.pop(fut)
+                in_use -= estimates[i]
+                try:
+                    results[i] = fut.result()
+                except Exception as e:
+                    results[i] = ProcessingResultDTO(False, f"Сбой процесса обработки: {e}", error_code="worker_failed")
+
+    return results
+
+
+def run_partition(
+    source: str,
+    column: Columns,
+    target_dir: str,
+    reader: str = READER_OPENPYXL,
+    max_size_bytes: Optional[int] = None,
+) -> ProcessingResultDTO:
+    interactor = PartitionExcelInteractor(
+        fs=LocalFileSystem(),
+        reader=excel_reader(reader),
+        writer=OpenPyxlExcelWriter(),
+        max_size_bytes=max_size_bytes,
+        writers_by_extension=csv_writers(),
+    )
+    return interactor(PartitionRequestDTO(source_path=source, target_dir=target_dir, partition_column=column))
+
+
+def _print_summary(jobs: List[BatchJob], results: List[ProcessingResultDTO], as_json: bool) -> None:
+    if as_json:
+        payload = [
+            {
+                "job": n,
+                **asdict(job),
+                "column": job.column.value,
+                "order_by": job.order_by.value if job.order_by else None,
+                **asdict(result),
+            }
+            for n, (job, result) in enumerate(zip(jobs, results), start=1)
+        ]
+        json.dump(payload, sys.stdout, ensure_ascii=False, indent=2)
+        sys.stdout.write("\n")
+        return
+
+    for n, (job, result) in enumerate(zip(jobs, results), start=1):
+        status = "OK" if result.success else f"ERROR[{result.error_code}]"
+        print(f"{n}\t{status}\t{job.source} -> {job.target}\t{result.message}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Пакетная обработка Excel файлов по манифесту (JSON или CSV)")
+    parser.add_argument("manifest", nargs="?", help="Файл манифеста с полями source, column, value, target")
+    parser.add_argument(
+        "--partition", nargs=3, metavar=("SOURCE", "COLUMN", "TARGET_DIR"),
+        help="Разбить исходный файл на отдельные файлы по значениям столбца",
+    )
+    parser.add_argument("--workers", type=int, default=None, help="Число процессов (по умолчанию все ядра)")
+    parser.add_argument("--max-memory-mb", type=int, default=None, help="Ограничение суммарной памяти одновременно выполняемых заданий")
+    parser.add_argument("--json", action="store_true", help="Вывести сводку в формате JSON")
+    parser.add_argument("--metrics-log", default=None, help="Дописывать метрики заданий в файл в формате JSON Lines")
+    parser.add_argument("--csv-bom", action="store_true", help="Добавлять BOM в CSV/TSV результаты (для Excel в Windows)")
+    parser.add_argument(
+        "--pipelined", action="store_true",
+        help="Читать, фильтровать и записывать одновременно (чтение в отдельном процессе)",
+    )
+    parser.add_argument(
+        "--checkpoint-dir", default=DEFAULT_CHECKPOINT_DIR,
+        help="Каталог контрольных точек для заданий с incremental (дописывание только новых строк)",
+    )
+    parser.add_argument(
+        "--sort-memory-rows", type=int, default=SORT_MEMORY_ROWS,
+        help="Сколько строк сортировать в памяти; больший результат сортируется через временные файлы",
+    )
+    parser.add_argument(
+        "--reader", choices=READER_KINDS, default=READER_OPENPYXL,
+        help="Способ чтения xlsx: openpyxl или native (разбор XML листа напрямую, при ошибке — через openpyxl)",
+    )
+    parser.add_argument(
+        "--max-size-mb", type=int, default=None,
+        help="Не обрабатывать исходные файлы больше заданного размера (по умолчанию без ограничения)",
+    )
+    args = parser.parse_args(argv)
+    max_size_bytes = args.max_size_mb * 1024 * 1024 if args.max_size_mb else None
+
+    if args.partition:
+        source, column_raw, target_dir = args.partition
+        try:
+            column = parse_column(column_raw)
+        except ManifestError as e:
+            print(e, file=sys.stderr)
+            return EXIT_BAD_MANIFEST
+        result = run_partition(source, column, target_dir, args.reader, max_size_bytes)
+        if args.metrics_log:
+            JsonLogMetricsSink(log_metrics_to_file(args.metrics_log))(result)
+        print(result.message)
+        for path in result.output_paths:
+            print(path)
+        return EXIT_OK if result.success else EXIT_JOB_FAILED
+
+    if not args.manifest:
+        parser.error("укажите файл манифеста или --partition")
+
+    try:
+        jobs = load_manifest(args.manifest)
+    except (OSError, ValueError) as e:
+        print(f"Ошибка манифеста: {e}", file=sys.stderr)
+        return EXIT_BAD_MANIFEST
+
+    budget = args.max_memory_mb * 1024 * 1024 if args.max_memory_mb else None
+    results = run_batch(
+        jobs, workers=args.workers, memory_budget_bytes=budget, csv_bom=args.csv_bom,
+        pipelined=args.pipelined, checkpoint_dir=args.checkpoint_dir, sort_memory_rows=args.sort_memory_rows,
+        reader=args.reader, max_size_bytes=max_size_bytes,
+    )
+    if args.metrics_log:
+        sink = JsonLogMetricsSink(log_metrics_to_file(args.metrics_log))
+        for result in results:
+            sink(result)
+    _print_summary(jobs, results, args.json)
+
+    return EXIT_OK if all(r.success for r in results) else EXIT_JOB_FAILED
+
+
+if __name__ == "__main__":
+    sys.exit(main())
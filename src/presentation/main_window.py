@@ -1,30 +1,38 @@
+import argparse
+import importlib
+import os
 import sys
+import threading
+import time
+from typing import Optional
 
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QThreadPool, QTimer
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout,
     QLabel, QMessageBox
 )
 
-from src.application.interactors.process_excel_interactor import ProcessExcelInteractor
-from src.infrastructure.filesystem import LocalFileSystem
-from src.infrastructure.openpyxl_reader import OpenPyxlExcelReader
-from src.infrastructure.openpyxl_writer import OpenPyxlExcelWriter
 from src.presentation.presenter import MainPresenter
 from src.presentation.widgets.file_frame import FileFrame
 from src.presentation.widgets.filter_frame import FilterFrame
 from src.presentation.widgets.save_frame import SaveFrame
 from src.presentation.widgets.execute_frame import ExecuteFrame
 
+_STARTED_AT = time.perf_counter()
+
 
 class MainWindow(QMainWindow):
-    def __init__(self, interactor=None):
+    def __init__(self, interactor=None, preview_interactor=None):
         super().__init__()
 
-        self.presenter = MainPresenter(interactor)
+        self.presenter = MainPresenter(interactor, preview_interactor)
 
         self._init_ui()
 
+    def attach_interactors(self, interactor, preview_interactor=None) -> None:
+        self.presenter.set_interactors(interactor, preview_interactor)
+        self.filter_frame.schedule_preview()
+
     def _init_ui(self):
         self.setWindowTitle("Обработчик Excel файлов")
 
@@ -41,10 +49,14 @@ class MainWindow(QMainWindow):
         """)
         layout.addWidget(title)
 
-        layout.addWidget(FileFrame(self, self.presenter))
-        layout.addWidget(FilterFrame(self, self.presenter))
+        file_frame = FileFrame(self, self.presenter)
+        layout.addWidget(file_frame)
+        self.filter_frame = FilterFrame(self, self.presenter)
+        layout.addWidget(self.filter_frame)
+        file_frame.path_input.textChanged.connect(self.filter_frame.schedule_preview)
         layout.addWidget(SaveFrame(self, self.presenter))
-        layout.addWidget(ExecuteFrame(self, self.presenter))
+        self.execute_frame = ExecuteFrame(self, self.presenter)
+        layout.addWidget(self.execute_frame)
 
         layout.addStretch()
 
@@ -56,19 +68,86 @@ class MainWindow(QMainWindow):
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
             QMessageBox.StandardButton.No,
         )
-        event.accept() if reply == QMessageBox.StandardButton.Yes else event.ignore()
-
-
-def main():
-    app = QApplication([])
-
+        if reply != QMessageBox.StandardButton.Yes:
+            event.ignore()
+            return
+
+        if self.execute_frame.is_running():
+            self.execute_frame.cancel()
+            QThreadPool.globalInstance().waitForDone()
+        self.presenter.shutdown()
+        self.filter_frame.shutdown_preview()
+        event.accept()
+
+
+def build_interactors(native_reader: bool = False, max_size_bytes: Optional[int] = None):
+    from src.application.interactors.preview_matches_interactor import PreviewMatchesInteractor
+    from src.application.interactors.process_excel_interactor import ProcessExcelInteractor
+    from src.application.loaded_sheet import LoadedSheetCache
+    from src.infrastructure.checkpoint_store import JsonCheckpointStore
+    from src.infrastructure.columnar_cache import CachedExcelReader
+    from src.infrastructure.csv_writer import csv_writers
+    from src.infrastructure.fallback_reader import READER_NATIVE, READER_OPENPYXL, excel_reader
+    from src.infrastructure.filesystem import LocalFileSystem
+    from src.infrastructure.metrics_log import JsonLogMetricsSink, log_metrics_to_file
+    from src.infrastructure.openpyxl_writer import OpenPyxlExcelWriter
+
+    cache_dir = os.path.join(os.path.expanduser("~"), ".cache", "excel_filter")
     fs = LocalFileSystem()
-    reader = OpenPyxlExcelReader()
+    reader = CachedExcelReader(excel_reader(READER_NATIVE if native_reader else READER_OPENPYXL), cache_dir=cache_dir)
     writer = OpenPyxlExcelWriter()
-    interactor = ProcessExcelInteractor(fs=fs, reader=reader, writer=writer)
+    loaded_sheets = LoadedSheetCache()
+    interactor = ProcessExcelInteractor(
+        fs=fs,
+        reader=reader,
+        writer=writer,
+        max_size_bytes=max_size_bytes,
+        loaded_sheets=loaded_sheets,
+        writers_by_extension=csv_writers(bom=True),
+        metrics_sink=JsonLogMetricsSink(log_metrics_to_file(os.path.join(cache_dir, "metrics.log"))),
+        checkpoints=JsonCheckpointStore(os.path.join(cache_dir, "checkpoints")),
+    )
+    preview_interactor = PreviewMatchesInteractor(
+        fs=fs, reader=reader, writer=writer, max_size_bytes=max_size_bytes, loaded_sheets=loaded_sheets,
+    )
+    return interactor, preview_interactor
+
+
+def _warm_up_imports() -> None:
+    threading.Thread(target=importlib.import_module, args=("openpyxl",), daemon=True).start()
+
+
+def _finish_startup(
+    window: "MainWindow",
+    app: QApplication,
+    probe: bool,
+    native_reader: bool,
+    max_size_bytes: Optional[int],
+) -> None:
+    shown_ms = (time.perf_counter() - _STARTED_AT) * 1000
+    window.attach_interactors(*build_interactors(native_reader, max_size_bytes))
+    if probe:
+        from src.infrastructure.metrics_log import log_event
+
+        ready_ms = (time.perf_counter() - _STARTED_AT) * 1000
+        log_event("startup", window_shown_ms=round(shown_ms, 1), ready_ms=round(ready_ms, 1))
+        app.quit()
+        return
+    _warm_up_imports()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--startup-probe", action="store_true")
+    parser.add_argument("--native-reader", action="store_true")
+    parser.add_argument("--max-size-mb", type=int, default=None)
+    args, _ = parser.parse_known_args(sys.argv[1:] if argv is None else argv)
+    max_size_bytes = args.max_size_mb * 1024 * 1024 if args.max_size_mb else None
+    app = QApplication([])
 
-    window = MainWindow(interactor=interactor)
+    window = MainWindow()
     window.show()
+    QTimer.singleShot(0, lambda: _finish_startup(window, app, args.startup_probe, args.native_reader, max_size_bytes))
 
     app.exec()
 
@@ -1,7 +1,11 @@
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Tuple
 
-from src.application.dto import ProcessingRequestDTO, ProcessingResultDTO, Columns
+from src.application.dto import ProcessingRequestDTO, ProcessingResultDTO, MatchPreviewDTO, Columns
+from src.application.interface import ProgressCallback, CancelCheck
+from src.presentation.workers.sheet_preloader import SheetPreloader
+
+SOURCE_SEPARATOR = ";"
 
 
 @dataclass
@@ -10,15 +14,26 @@ class PresenterState:
     target_path: str = ""
     filter_column: Optional[Columns] = None
     filter_value_raw: str = ""
+    all_sheets: bool = False
+    split_sheets: bool = False
+    add_source_column: bool = False
+    incremental: bool = False
+    order_by: Optional[Columns] = None
+    order_descending: bool = False
+    summary: bool = False
 
 
 class MainPresenter:
-    def __init__(self, interactor):
+    def __init__(self, interactor, preview_interactor=None):
         self._interactor = interactor
+        self._preview_interactor = preview_interactor
+        self._preloader = self._make_preloader(interactor)
         self.state = PresenterState()
 
     def set_source_path(self, path: str) -> None:
         self.state.source_path = path or ""
+        if self._preloader is not None:
+            self._preloader.request(self.state.source_path)
 
     def set_target_path(self, path: str) -> None:
         self.state.target_path = path or ""
@@ -30,7 +45,35 @@ class MainPresenter:
     def set_filter_value_raw(self, raw: str) -> None:
         self.state.filter_value_raw = raw or ""
 
-    def run(self) -> ProcessingResultDTO:
+    def set_all_sheets(self, enabled: bool) -> None:
+        self.state.all_sheets = bool(enabled)
+
+    def set_split_sheets(self, enabled: bool) -> None:
+        self.state.split_sheets = bool(enabled)
+
+    def set_add_source_column(self, enabled: bool) -> None:
+        self.state.add_source_column = bool(enabled)
+
+    def set_incremental(self, enabled: bool) -> None:
+        self.state.incremental = bool(enabled)
+
+    def set_order_by(self, col: Optional[Columns]) -> None:
+        self.state.order_by = col
+
+    def set_order_descending(self, enabled: bool) -> None:
+        self.state.order_descending = bool(enabled)
+
+    def set_summary(self, enabled: bool) -> None:
+        self.state.summary = bool(enabled)
+
+    def source_paths(self) -> Tuple[str, ...]:
+        return tuple(p.strip() for p in self.state.source_path.split(SOURCE_SEPARATOR) if p.strip())
+
+    def is_multi_source(self) -> bool:
+        sources = self.source_paths()
+        return len(sources) > 1 or any(ch in p for p in sources for ch in "*?")
+
+    def build_request(self) -> ProcessingRequestDTO | ProcessingResultDTO:
         if self.state.filter_column is None:
             return ProcessingResultDTO(
                 success=False,
@@ -38,13 +81,75 @@ class MainPresenter:
                 error_code="ui_filter_column_missing",
             )
 
-        req = ProcessingRequestDTO(
-            source_path=self.state.source_path,
+        sources = self.source_paths()
+        multi_source = self.is_multi_source()
+        return ProcessingRequestDTO(
+            source_path="" if len(sources) > 1 else self.state.source_path,
             target_path=self.state.target_path,
             filter_column=self.state.filter_column,
             filter_value_raw=self.state.filter_value_raw,
+            all_sheets=self.state.all_sheets,
+            split_sheets=(self.state.all_sheets or multi_source) and self.state.split_sheets,
+            source_paths=sources if len(sources) > 1 else (),
+            add_source_column=self.state.add_source_column,
+            incremental=self.state.incremental,
+            order_by=self.state.order_by,
+            order_descending=self.state.order_descending,
+            summary=self.state.summary,
         )
 
-        result: ProcessingResultDTO = self._interactor(req)
+    def execute(
+        self,
+        req: ProcessingRequestDTO,
+        on_progress: Optional[ProgressCallback] = None,
+        is_cancelled: Optional[CancelCheck] = None,
+    ) -> ProcessingResultDTO:
+        if self._interactor is None:
+            return ProcessingResultDTO(False, "Приложение ещё загружается, повторите попытку", error_code="not_ready")
+
+        result: ProcessingResultDTO = self._interactor(req, on_progress=on_progress, is_cancelled=is_cancelled)
 
         return result
+
+    def run(
+        self,
+        on_progress: Optional[ProgressCallback] = None,
+        is_cancelled: Optional[CancelCheck] = None,
+    ) -> ProcessingResultDTO:
+        req_or_error = self.build_request()
+        if isinstance(req_or_error, ProcessingResultDTO):
+            return req_or_error
+
+        return self.execute(req_or_error, on_progress=on_progress, is_cancelled=is_cancelled)
+
+    def set_interactors(self, interactor, preview_interactor=None) -> None:
+        self.shutdown()
+        self._interactor = interactor
+        self._preview_interactor = preview_interactor
+        self._preloader = self._make_preloader(interactor)
+        if self._preloader is not None:
+            self._preloader.request(self.state.source_path)
+
+    def shutdown(self) -> None:
+        if self._preloader is not None:
+            self._preloader.cancel()
+
+    def _make_preloader(self, interactor) -> Optional[SheetPreloader]:
+        if interactor is None or not hasattr(interactor, "preload"):
+            return None
+        return SheetPreloader(interactor)
+
+    def can_preview(self) -> bool:
+        return self._preview_interactor is not None
+
+    def preview(self, is_cancelled: Optional[CancelCheck] = None) -> Optional[MatchPreviewDTO]:
+        if self._preview_interactor is None or self.state.filter_column is None or self.is_multi_source():
+            return None
+
+        req = ProcessingRequestDTO(
+            source_path=self.state.source_path,
+            target_path=self.state.target_path,
+            filter_column=self.state.filter_column,
+            filter_value_raw=self.state.filter_value_raw,
+        )
+        return self._preview_interactor(req, is_cancelled=is_cancelled)
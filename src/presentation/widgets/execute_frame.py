@@ -1,21 +1,73 @@
-from PyQt6.QtCore import Qt
-from PyQt6.QtWidgets import QGroupBox, QVBoxLayout, QHBoxLayout, QPushButton, QMessageBox
+from typing import Optional
+
+from PyQt6.QtCore import Qt, QThreadPool
+from PyQt6.QtWidgets import (
+    QGroupBox, QVBoxLayout, QHBoxLayout, QPushButton, QMessageBox,
+    QLabel, QProgressBar
+)
+
+from src.application.dto import ProcessingResultDTO, ProcessingProgressDTO
+from src.presentation.workers.processing_worker import ProcessingWorker
 
 
 class ExecuteFrame(QGroupBox):
     def __init__(self, parent, presenter):
         super().__init__(parent)
         self.presenter = presenter
+        self._worker: Optional[ProcessingWorker] = None
         self._build_ui()
 
+    def is_running(self) -> bool:
+        return self._worker is not None
+
+    def cancel(self) -> None:
+        if self._worker is not None:
+            self._worker.cancel()
+            self.cancel_btn.setEnabled(False)
+            self.status_label.setText("Отмена...")
+
     def _run(self):
-        result = self.presenter.run()
+        if self._worker is not None:
+            return
+
+        req_or_error = self.presenter.build_request()
+        if isinstance(req_or_error, ProcessingResultDTO):
+            self._show_result(req_or_error)
+            return
 
+        self._worker = ProcessingWorker(self.presenter, req_or_error)
+        self._worker.signals.progress.connect(self._on_progress)
+        self._worker.signals.finished.connect(self._on_finished)
+        self._set_running(True)
+        QThreadPool.globalInstance().start(self._worker)
+
+    def _on_progress(self, progress: ProcessingProgressDTO):
+        if self._worker is None:
+            return
+        self.status_label.setText(
+            f"{progress.stage.value}: прочитано строк {progress.rows_read}, "
+            f"совпадений {progress.rows_matched}"
+        )
+
+    def _on_finished(self, result: ProcessingResultDTO):
+        self._worker = None
+        self._set_running(False)
+        self._show_result(result)
+
+    def _show_result(self, result: ProcessingResultDTO):
         if result.success:
             QMessageBox.information(
                 self,
                 "Готово",
-                f"{result.message}\n\nФайл успешно сохранён:\n{result.output_path}",
+                f"{result.message}\n\nФайл успешно сохранён:\n{result.output_path}"
+                f"{self._format_sheet_counts(result)}"
+                f"{self._format_metrics(result)}",
+            )
+        elif result.error_code == "cancelled":
+            QMessageBox.information(
+                self,
+                "Отменено",
+                result.message,
             )
         else:
             QMessageBox.critical(
@@ -24,6 +76,51 @@ class ExecuteFrame(QGroupBox):
                 result.message,
             )
 
+    def _format_sheet_counts(self, result: ProcessingResultDTO) -> str:
+        if not result.sheet_counts:
+            return ""
+        lines = []
+        for c in result.sheet_counts:
+            if c.header_found:
+                lines.append(f"{c.sheet_name}: прочитано {c.rows_read}, найдено {c.rows_matched}")
+            else:
+                lines.append(f"{c.sheet_name}: заголовок не найден, пропущено")
+        return "\n\nПо листам и файлам:\n" + "\n".join(lines)
+
+    def _format_metrics(self, result: ProcessingResultDTO) -> str:
+        m = result.metrics
+        if m is None:
+            return ""
+        labels = {
+            "prepare": "проверка",
+            "read": "чтение",
+            "header": "заголовок",
+            "filter": "фильтрация",
+            "sort": "сортировка",
+            "write": "запись",
+            "wait": "ожидание очередей",
+        }
+        stages = ", ".join(f"{labels.get(name, name)} {sec:.2f} с" for name, sec in m.stage_seconds)
+        lines = [
+            f"Время: {m.total_seconds:.2f} с ({stages})",
+            f"Строк прочитано: {m.rows_read}, найдено: {m.rows_matched}, {m.rows_per_second:.0f} строк/с",
+        ]
+        if m.input_bytes is not None or m.output_bytes is not None:
+            lines.append(f"Размер: вход {_format_bytes(m.input_bytes)}, результат {_format_bytes(m.output_bytes)}")
+        if m.peak_rss_bytes is not None:
+            lines.append(f"Пиковая память: {_format_bytes(m.peak_rss_bytes)}")
+        if m.peak_child_rss_bytes is not None:
+            lines.append(f"Пиковая память дочерних процессов: {_format_bytes(m.peak_child_rss_bytes)}")
+        return "\n\nМетрики:\n" + "\n".join(lines)
+
+    def _set_running(self, running: bool):
+        self.run_btn.setEnabled(not running)
+        self.cancel_btn.setEnabled(running)
+        self.progress_bar.setVisible(running)
+        self.status_label.setVisible(running)
+        if running:
+            self.status_label.setText("Запуск...")
+
     def _exit(self):
         self.window().close()
 
@@ -36,10 +133,16 @@ class ExecuteFrame(QGroupBox):
         row = QHBoxLayout()
         row.setSpacing(12)
 
-        run_btn = QPushButton("Выполнить обработку")
-        run_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        run_btn.clicked.connect(self._run)
-        row.addWidget(run_btn)
+        self.run_btn = QPushButton("Выполнить обработку")
+        self.run_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.run_btn.clicked.connect(self._run)
+        row.addWidget(self.run_btn)
+
+        self.cancel_btn = QPushButton("Отмена")
+        self.cancel_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.cancel_btn.clicked.connect(self.cancel)
+        self.cancel_btn.setEnabled(False)
+        row.addWidget(self.cancel_btn)
 
         exit_btn = QPushButton("Выход")
         exit_btn.setCursor(Qt.CursorShape.PointingHandCursor)
@@ -47,3 +150,22 @@ class ExecuteFrame(QGroupBox):
         row.addWidget(exit_btn)
 
         layout.addLayout(row)
+
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 0)
+        self.progress_bar.setVisible(False)
+        layout.addWidget(self.progress_bar)
+
+        self.status_label = QLabel()
+        self.status_label.setVisible(False)
+        layout.addWidget(self.status_label)
+
+
+def _format_bytes(size: Optional[int]) -> str:
+    if size is None:
+        return "—"
+    for unit in ("Б", "КБ", "МБ"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "Б" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} ГБ"
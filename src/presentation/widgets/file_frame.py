@@ -6,6 +6,8 @@ from PyQt6.QtWidgets import (
     QLineEdit, QPushButton, QFileDialog
 )
 
+from src.presentation.presenter import SOURCE_SEPARATOR
+
 
 class FileFrame(QGroupBox):
     def __init__(self, parent, presenter):
@@ -14,15 +16,16 @@ class FileFrame(QGroupBox):
         self._build_ui()
 
     def _select_file(self):
-        file_name, _ = QFileDialog.getOpenFileName(
+        file_names, _ = QFileDialog.getOpenFileNames(
             self,
-            "Выберите Excel файл",
+            "Выберите Excel файлы",
             os.path.expanduser("~"),
             "Excel Files (*.xlsx);;All Files (*.*)",
         )
-        if file_name:
-            self.path_input.setText(file_name)
-            self.presenter.set_source_path(file_name)
+        if file_names:
+            source = f"{SOURCE_SEPARATOR} ".join(file_names)
+            self.path_input.setText(source)
+            self.presenter.set_source_path(source)
 
     def _build_ui(self):
         self.setTitle("1. Выбор файла")
@@ -30,7 +33,10 @@ class FileFrame(QGroupBox):
         layout = QVBoxLayout(self)
         layout.setSpacing(10)
 
-        info = QLabel("Выберите исходный Excel файл (.xlsx) для обработки.")
+        info = QLabel(
+            "Выберите исходный Excel файл (.xlsx) для обработки. Можно выбрать несколько файлов "
+            "или указать шаблон, например C:/payroll/2024-*.xlsx — совпадения объединятся в один результат."
+        )
         info.setWordWrap(True)
         layout.addWidget(info)
 
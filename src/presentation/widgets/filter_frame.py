@@ -1,24 +1,99 @@
-from PyQt6.QtWidgets import QGroupBox, QVBoxLayout, QLabel, QComboBox, QLineEdit
+from datetime import datetime
 
-from src.application.dto import Columns
+from PyQt6.QtCore import QThreadPool, QTimer
+from PyQt6.QtWidgets import (
+    QGroupBox, QVBoxLayout, QLabel, QComboBox, QLineEdit, QCheckBox,
+    QTableWidget, QTableWidgetItem, QAbstractItemView
+)
+
+from src.application.dto import Columns, MatchPreviewDTO
+from src.presentation.workers.preview_worker import PreviewWorker
+
+PREVIEW_DEBOUNCE_MS = 250
 
 
 class FilterFrame(QGroupBox):
     def __init__(self, parent, presenter):
         super().__init__(parent)
         self.presenter = presenter
+        self._preview_generation = 0
+        self._preview_pool = QThreadPool(self)
+        self._preview_pool.setMaxThreadCount(1)
         self._build_ui()
 
+    def schedule_preview(self, *_):
+        if not self.presenter.can_preview():
+            return
+        self._preview_generation += 1
+        self._preview_timer.start()
+
+    def shutdown_preview(self) -> None:
+        self._preview_generation += 1
+        self._preview_timer.stop()
+        self._preview_pool.clear()
+        self._preview_pool.waitForDone()
+
     def _on_column_changed(self):
         col = self.column_combo.currentData()
         self.presenter.set_filter_column(col)
 
         if col == Columns.HIRE_DATE:
-            self.value_input.setPlaceholderText("ДД.ММ.ГГГГ (например, 19.10.2025)")
+            self.value_input.setPlaceholderText("ДД.ММ.ГГГГ, >01.01.2024, 01.01.2024..31.12.2024 или список через ;")
         elif col == Columns.SALARY:
-            self.value_input.setPlaceholderText("Число (например, 50000 или 50000.50)")
+            self.value_input.setPlaceholderText("Число, >=80000, 80000..120000 или список через ; (50000; 60000)")
         else:
             self.value_input.setPlaceholderText("Введите значение...")
+        self.schedule_preview()
+
+    def _on_value_changed(self, raw: str):
+        self.presenter.set_filter_value_raw(raw)
+        self.schedule_preview()
+
+    def _start_preview(self):
+        if self.presenter.state.filter_column is None:
+            self._show_preview(None)
+            return
+
+        if self.presenter.state.filter_value_raw.strip():
+            self.preview_label.setText("Поиск совпадений...")
+            self.preview_label.setVisible(True)
+        else:
+            self._show_preview(None)
+        self._preview_pool.clear()
+        worker = PreviewWorker(self.presenter, self._preview_generation, self._is_stale)
+        worker.signals.finished.connect(self._on_preview_finished)
+        self._preview_pool.start(worker)
+
+    def _is_stale(self, generation: int) -> bool:
+        return generation != self._preview_generation
+
+    def _on_preview_finished(self, generation: int, preview: MatchPreviewDTO):
+        if self._is_stale(generation):
+            return
+        if not self.presenter.state.filter_value_raw.strip():
+            preview = None
+        self._show_preview(preview)
+
+    def _show_preview(self, preview):
+        if preview is None or preview.error_code in ("filter_value_missing", "cancelled"):
+            self.preview_label.setVisible(False)
+            self.preview_table.setVisible(False)
+            return
+
+        self.preview_label.setText(preview.message)
+        self.preview_label.setVisible(True)
+        if not preview.success or not preview.rows:
+            self.preview_table.setVisible(False)
+            return
+
+        self.preview_table.setColumnCount(len(preview.headers))
+        self.preview_table.setHorizontalHeaderLabels(list(preview.headers))
+        self.preview_table.setRowCount(len(preview.rows))
+        for r, row in enumerate(preview.rows):
+            for c, value in enumerate(row):
+                self.preview_table.setItem(r, c, QTableWidgetItem(_display(value)))
+        self.preview_table.resizeColumnsToContents()
+        self.preview_table.setVisible(True)
 
     def _build_ui(self):
         self.setTitle("2. Настройка фильтрации")
@@ -40,5 +115,32 @@ class FilterFrame(QGroupBox):
 
         self.value_input = QLineEdit()
         self.value_input.setPlaceholderText("Введите значение...")
-        self.value_input.textChanged.connect(self.presenter.set_filter_value_raw)
+        self.value_input.textChanged.connect(self._on_value_changed)
         layout.addWidget(self.value_input)
+
+        self.all_sheets_check = QCheckBox("Обрабатывать все листы книги")
+        self.all_sheets_check.toggled.connect(self.presenter.set_all_sheets)
+        layout.addWidget(self.all_sheets_check)
+
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(PREVIEW_DEBOUNCE_MS)
+        self._preview_timer.timeout.connect(self._start_preview)
+
+        self.preview_label = QLabel()
+        self.preview_label.setVisible(False)
+        layout.addWidget(self.preview_label)
+
+        self.preview_table = QTableWidget()
+        self.preview_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.preview_table.setMaximumHeight(180)
+        self.preview_table.setVisible(False)
+        layout.addWidget(self.preview_table)
+
+
+def _display(value) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.strftime("%d.%m.%Y")
+    return str(value)
@@ -3,9 +3,11 @@ import os
 from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import (
     QGroupBox, QVBoxLayout, QLabel, QHBoxLayout,
-    QLineEdit, QPushButton, QFileDialog
+    QLineEdit, QPushButton, QFileDialog, QCheckBox, QComboBox
 )
 
+from src.application.dto import Columns
+
 
 class SaveFrame(QGroupBox):
     def __init__(self, parent, presenter):
@@ -15,15 +17,20 @@ class SaveFrame(QGroupBox):
 
     def _select_target_file(self):
         default_name = "обработанный_файл.xlsx"
-        file_name, _ = QFileDialog.getSaveFileName(
+        file_name, selected_filter = QFileDialog.getSaveFileName(
             self,
             "Сохранить файл как",
             os.path.join(os.path.expanduser("~"), default_name),
-            "Excel Files (*.xlsx);;All Files (*.*)",
+            "Excel Files (*.xlsx);;CSV (*.csv);;TSV (*.tsv);;All Files (*.*)",
         )
         if file_name:
-            if not file_name.lower().endswith(".xlsx"):
-                file_name += ".xlsx"
+            if not file_name.lower().endswith((".xlsx", ".csv", ".tsv")):
+                if selected_filter.startswith("CSV"):
+                    file_name += ".csv"
+                elif selected_filter.startswith("TSV"):
+                    file_name += ".tsv"
+                else:
+                    file_name += ".xlsx"
             self.path_input.setText(file_name)
             self.presenter.set_target_path(file_name)
 
@@ -33,7 +40,7 @@ class SaveFrame(QGroupBox):
         layout = QVBoxLayout(self)
         layout.setSpacing(10)
 
-        info = QLabel("Укажите, куда сохранить результат (.xlsx).")
+        info = QLabel("Укажите, куда сохранить результат (.xlsx, .csv или .tsv).")
         info.setWordWrap(True)
         layout.addWidget(info)
 
@@ -52,3 +59,38 @@ class SaveFrame(QGroupBox):
         row.addWidget(btn)
 
         layout.addLayout(row)
+
+        order_row = QHBoxLayout()
+        order_row.setSpacing(10)
+        order_row.addWidget(QLabel("Сортировать по:"))
+
+        self.order_combo = QComboBox()
+        self.order_combo.addItem("-- Без сортировки --", None)
+        for c in Columns:
+            self.order_combo.addItem(c.value, c)
+        self.order_combo.currentIndexChanged.connect(
+            lambda _: self.presenter.set_order_by(self.order_combo.currentData())
+        )
+        order_row.addWidget(self.order_combo)
+
+        self.descending_check = QCheckBox("по убыванию")
+        self.descending_check.toggled.connect(self.presenter.set_order_descending)
+        order_row.addWidget(self.descending_check)
+
+        layout.addLayout(order_row)
+
+        self.split_sheets_check = QCheckBox("Отдельный лист результата для каждого листа или исходного файла")
+        self.split_sheets_check.toggled.connect(self.presenter.set_split_sheets)
+        layout.addWidget(self.split_sheets_check)
+
+        self.source_column_check = QCheckBox("Добавить столбец с именем исходного файла")
+        self.source_column_check.toggled.connect(self.presenter.set_add_source_column)
+        layout.addWidget(self.source_column_check)
+
+        self.summary_check = QCheckBox("Добавить лист «Сводка»: численность и зарплаты по отделам и должностям")
+        self.summary_check.toggled.connect(self.presenter.set_summary)
+        layout.addWidget(self.summary_check)
+
+        self.incremental_check = QCheckBox("Дописывать только новые строки (для файлов, которые растут снизу)")
+        self.incremental_check.toggled.connect(self.presenter.set_incremental)
+        layout.addWidget(self.incremental_check)
@@ -0,0 +1,28 @@
+from typing import Callable
+
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+from src.application.dto import MatchPreviewDTO
+
+
+class PreviewWorkerSignals(QObject):
+    finished = pyqtSignal(int, object)
+
+
+class PreviewWorker(QRunnable):
+    def __init__(self, presenter, generation: int, is_stale: Callable[[int], bool]):
+        super().__init__()
+        self.signals = PreviewWorkerSignals()
+        self._presenter = presenter
+        self._generation = generation
+        self._is_stale = is_stale
+
+    def run(self) -> None:
+        if self._is_stale(self._generation):
+            return
+        try:
+            result = self._presenter.preview(is_cancelled=lambda: self._is_stale(self._generation))
+        except Exception as e:
+            result = MatchPreviewDTO(False, f"Непредвиденная ошибка: {e}", error_code="unexpected_error")
+        if not self._is_stale(self._generation):
+            self.signals.finished.emit(self._generation, result)
@@ -0,0 +1,33 @@
+import threading
+
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+from src.application.dto import ProcessingRequestDTO, ProcessingResultDTO
+
+
+class ProcessingWorkerSignals(QObject):
+    progress = pyqtSignal(object)
+    finished = pyqtSignal(object)
+
+
+class ProcessingWorker(QRunnable):
+    def __init__(self, presenter, request: ProcessingRequestDTO):
+        super().__init__()
+        self.signals = ProcessingWorkerSignals()
+        self._presenter = presenter
+        self._request = request
+        self._cancel_event = threading.Event()
+
+    def cancel(self) -> None:
+        self._cancel_event.set()
+
+    def run(self) -> None:
+        try:
+            result = self._presenter.execute(
+                self._request,
+                on_progress=self.signals.progress.emit,
+                is_cancelled=self._cancel_event.is_set,
+            )
+        except Exception as e:
+            result = ProcessingResultDTO(False, f"Непредвиденная ошибка: {e}", error_code="unexpected_error")
+        self.signals.finished.emit(result)
@@ -0,0 +1,35 @@
+import os
+import threading
+from typing import Optional
+
+
+class SheetPreloader:
+    def __init__(self, interactor):
+        self._interactor = interactor
+        self._path: Optional[str] = None
+        self._cancel_event: Optional[threading.Event] = None
+
+    def request(self, path: str) -> None:
+        path = (path or "").strip()
+        if path == self._path:
+            return
+        self.cancel()
+        self._path = path
+        if not path.lower().endswith(".xlsx") or not os.path.isfile(path):
+            return
+
+        cancel_event = threading.Event()
+        self._cancel_event = cancel_event
+        threading.Thread(target=self._load, args=(path, cancel_event), daemon=True).start()
+
+    def cancel(self) -> None:
+        if self._cancel_event is not None:
+            self._cancel_event.set()
+            self._cancel_event = None
+        self._path = None
+
+    def _load(self, path: str, cancel_event: threading.Event) -> None:
+        try:
+            self._interactor.preload(path, is_cancelled=cancel_event.is_set)
+        except Exception:
+            pass
@@ -0,0 +1,105 @@
+from datetime import datetime
+from typing import Any, List, Optional, Sequence
+
+from src.application.dto import Columns, ProcessingRequestDTO
+from src.application.interactors.process_excel_interactor import ProcessExcelInteractor
+
+HEADERS = ("id", "ФИО", "Должность", "Отдел", "Дата найма", "Зарплата", "Примечание")
+
+
+class StubFileSystem:
+    def __init__(self, size_bytes: int = 100):
+        self.size_bytes = size_bytes
+
+    def normalize_path(self, path: str) -> str:
+        return path
+
+    def exists(self, path: str) -> bool:
+        return True
+
+    def is_file(self, path: str) -> bool:
+        return True
+
+    def can_read(self, path: str) -> bool:
+        return True
+
+    def ensure_parent_dir(self, file_path: str) -> None:
+        pass
+
+    def can_write_dir_of(self, file_path: str) -> bool:
+        return True
+
+    def get_size_bytes(self, path: str) -> int:
+        return self.size_bytes
+
+    def get_mtime_ns(self, path: str) -> int:
+        return 1
+
+    def glob(self, pattern: str) -> List[str]:
+        return [pattern]
+
+
+class ListReader:
+    def __init__(self, rows: Sequence[Sequence[Any]], sheets: Optional[dict] = None):
+        self.rows = rows
+        self.sheets = sheets or {}
+
+    def sheet_names(self, source_path: str) -> List[str]:
+        return list(self.sheets) or ["Лист1"]
+
+    def iter_rows(self, source_path, projection=None, sheet_name=None):
+        rows = self.sheets.get(sheet_name, self.rows) if sheet_name is not None else self.rows
+        for row in rows:
+            yield projection.project(row) if projection is not None else row
+
+
+class ListWriter:
+    def __init__(self):
+        self.headers = None
+        self.rows = None
+        self.tables = None
+        self.summary = None
+
+    def write_table(self, target_path, headers, rows, *, generated_at_iso, summary=None, **kwargs):
+        self.headers = list(headers)
+        self.rows = [list(r) for r in rows]
+        if summary is not None:
+            self.summary = [list(r) for r in summary.rows]
+
+    def write_tables(self, target_path, headers, tables, *, generated_at_iso, summary=None, **kwargs):
+        self.headers = list(headers)
+        self.tables = [(title, [list(r) for r in rows]) for title, rows in tables]
+        self.rows = [r for _, rows in self.tables for r in rows]
+
+
+def employee_rows(count: int = 10) -> List[tuple]:
+    rows = [("Отчёт по сотрудникам",), (), HEADERS]
+    for i in range(count):
+        rows.append((
+            i,
+            f"Сотрудник {i}",
+            "Инженер" if i % 2 else "Менеджер",
+            f"Отдел {i % 3}",
+            datetime(2024, 1, 1 + i % 5),
+            1000.0 * (i % 4 + 1),
+            None,
+        ))
+    return rows
+
+
+def request(column: Columns = Columns.POSITION, value: str = "инженер", **kwargs) -> ProcessingRequestDTO:
+    kwargs.setdefault("source_path", "source.xlsx")
+    kwargs.setdefault("target_path", "result.xlsx")
+    return ProcessingRequestDTO(filter_column=column, filter_value_raw=value, **kwargs)
+
+
+def parsed_request(column: Columns, raw: str) -> Optional[ProcessingRequestDTO]:
+    value = ProcessExcelInteractor(fs=None, reader=None, writer=None)._parse_filter_value(column, raw)
+    if hasattr(value, "error_code"):
+        return None
+    return request(column, raw).with_parsed_filter_value(value)
+
+
+def baseline_matches(req: ProcessingRequestDTO, cell: Any) -> bool:
+    interactor = ProcessExcelInteractor(fs=None, reader=None, writer=None)
+    return interactor._compare_values(cell, req.filter_value, req.filter_column)
@@ -0,0 +1,25 @@
+from datetime import date, datetime
+
+from src.application.dto import Columns
+
+CELLS = (
+    None, "", " ", "Инженер", " инженер ", "ИНЖЕНЕР", "ß", "SS", "abc",
+    0, 1, 1.0, -1, "1", " 1 ", "1.0", "1,0", True, False, float("nan"), "nan",
+    50000, 50000.0, 50000.5, "50000", "50 000", 10 ** 20,
+    datetime(2024, 1, 5), datetime(2024, 1, 5, 13, 30), date(2024, 1, 5),
+    "05.01.2024", "2024-01-05 00:00:00", datetime(1999, 12, 31),
+)
+
+RAW_FILTERS = {
+    Columns.FIO: ("инженер", "ss", "1", "1.0", "nan", "abc", "50000"),
+    Columns.POSITION: ("ИНЖЕНЕР", "ß", "0", "true", "05.01.2024"),
+    Columns.DEPARTMENT: ("1", "abc", "50 000", "инженер;abc", "1;50000"),
+    Columns.SALARY: (
+        "50000", "50000,0", "1", "0.5", ">0", ">=0", "<1", "<=50000", "0..100000", "..1",
+        "50000..", "1;50000", "50000.5;-1", "abc", "0",
+    ),
+    Columns.HIRE_DATE: (
+        "05.01.2024", "31.12.1999", ">=01.01.2024", "<05.01.2024", "01.01.2000..05.01.2024",
+        "05.01.2024;31.12.1999", "2024-01-05",
+    ),
+}
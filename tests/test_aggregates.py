@@ -0,0 +1,91 @@
+import random
+
+from src.application.aggregates import SUMMARY_HEADERS, TOTAL_LABEL, SalaryAggregator
+from src.application.dto import Columns
+from src.application.interactors.process_excel_interactor import ProcessExcelInteractor
+from src.infrastructure.csv_writer import csv_writers
+from tests.fakes import ListReader, ListWriter, StubFileSystem, employee_rows, request
+
+HEADERS = [Columns.FIO.value, Columns.DEPARTMENT.value, Columns.POSITION.value, Columns.SALARY.value]
+
+
+def _rows(count=300):
+    rng = random.Random(11)
+    return [
+        [
+            f"С{i}",
+            rng.choice(["Б", "а", "В", None]),
+            rng.choice(["Инженер", "инженер", "Менеджер"]),
+            rng.choice([1000, 2500.5, 0, "нет", None, float("nan"), True, "300"]),
+        ]
+        for i in range(count)
+    ]
+
+
+def _reference(rows):
+    groups = {}
+    for _, department, position, salary in rows:
+        group = groups.setdefault((department, position), [0, []])
+        group[0] += 1
+        if salary is not None and not isinstance(salary, bool):
+            try:
+                value = float(salary)
+            except ValueError:
+                continue
+            if value == value:
+                group[1].append(value)
+    return groups
+
+
+def test_groups_match_a_plain_group_by():
+    rows = _rows()
+    aggregator = SalaryAggregator(HEADERS)
+    assert list(aggregator.track(rows)) == rows
+
+    sheet = aggregator.sheet()
+    assert tuple(sheet.headers) == SUMMARY_HEADERS
+    out = [list(r) for r in sheet.rows]
+    *groups, total = out
+
+    reference = _reference(rows)
+    assert len(groups) == len(reference)
+    for department, position, count, paid_sum, mean, low, high in groups:
+        expected_count, salaries = reference[(department, position)]
+        assert count == expected_count
+        if salaries:
+            assert paid_sum == sum(salaries)
+            assert mean == round(sum(salaries) / len(salaries), 2)
+            assert (low, high) == (min(salaries), max(salaries))
+        else:
+            assert (paid_sum, mean, low, high) == (None, None, None, None)
+
+    labels = [("" if d is None else d.casefold(), p.casefold()) for d, p, *_ in groups]
+    assert labels == sorted(labels)
+    all_salaries = [s for _, salaries in reference.values() for s in salaries]
+    assert total[:2] == [TOTAL_LABEL, None]
+    assert total[2] == len(rows)
+    assert total[3] == sum(all_salaries)
+    assert (total[5], total[6]) == (min(all_salaries), max(all_salaries))
+
+
+def test_empty_input_has_only_the_total_row():
+    assert [list(r) for r in SalaryAggregator(HEADERS).sheet().rows] == [[TOTAL_LABEL, None, 0, None, None, None, None]]
+
+
+def test_interactor_builds_summary_from_matched_rows():
+    writer = ListWriter()
+    interactor = ProcessExcelInteractor(fs=StubFileSystem(), reader=ListReader(employee_rows(30)), writer=writer)
+    result = interactor(request(Columns.POSITION, "инженер", summary=True))
+
+    assert result.success
+    *groups, total = writer.summary
+    assert total[2] == len(writer.rows) == 15
+    assert {g[1] for g in groups} == {"Инженер"}
+
+
+def test_summary_requires_xlsx():
+    interactor = ProcessExcelInteractor(
+        fs=StubFileSystem(), reader=ListReader(employee_rows(3)), writer=ListWriter(), writers_by_extension=csv_writers(),
+    )
+    result = interactor(request(summary=True, target_path="result.csv"))
+    assert result.error_code == "summary_unsupported"
@@ -0,0 +1,152 @@
+import os
+import pickle
+import time
+from datetime import date, datetime, time as dtime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+
+from src.application.interface import ColumnProjection
+from src.infrastructure import columnar_cache
+from src.infrastructure.columnar_cache import MAGIC, CachedExcelReader
+
+ROWS = [
+    ("Отчёт",),
+    (),
+    ("ФИО", "Дата", "Время", "Стаж", "Число", "Флаг", "Большое", "Дробь", "С поясом", "Текст"),
+    *[
+        (
+            f"Сотрудник {i}", datetime(2024, 1, 1 + i % 28, i % 24), dtime(9, i % 60), timedelta(days=i, seconds=7),
+            i - 50, i % 2 == 0, 2 ** 70 + i, i / 3, datetime(2024, 1, 1, tzinfo=timezone.utc),
+            None if i % 5 else "\ud800 суррогат",
+        )
+        for i in range(100)
+    ],
+    (date(2020, 2, 29), None, "хвост"),
+]
+
+
+class CountingReader:
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = 0
+
+    def iter_rows(self, source_path, projection=None, sheet_name=None):
+        self.calls += 1
+        for row in self.rows:
+            yield projection.project(row) if projection is not None else row
+
+    def sheet_names(self, source_path):
+        return ["Лист1"]
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "source.xlsx"
+    path.write_bytes(b"workbook")
+    old = time.time_ns() - 60 * 10 ** 9
+    os.utime(path, ns=(old, old))
+    return str(path)
+
+
+def _reader(tmp_path, rows=ROWS):
+    inner = CountingReader(rows)
+    return CachedExcelReader(inner, cache_dir=str(tmp_path / "cache")), inner
+
+
+def _entries(tmp_path):
+    return [n for n in os.listdir(tmp_path / "cache") if n.endswith(".xlcc")]
+
+
+def test_cache_hit_replays_rows_with_their_types(tmp_path, source, monkeypatch):
+    reader, inner = _reader(tmp_path)
+    first = [tuple(r) for r in reader.iter_rows(source)]
+
+    def no_hashing(path):
+        raise AssertionError("content hashed on a cache hit")
+
+    monkeypatch.setattr(columnar_cache, "_content_digest", no_hashing)
+    second = [tuple(r) for r in reader.iter_rows(source)]
+
+    assert inner.calls == 1
+    assert first == second == [tuple(r) for r in ROWS]
+    for got, want in zip(second, ROWS):
+        assert [type(v) for v in got] == [type(v) for v in want]
+
+
+def test_changed_file_misses_the_cache(tmp_path, source):
+    reader, inner = _reader(tmp_path)
+    list(reader.iter_rows(source))
+    with open(source, "ab") as f:
+        f.write(b"more")
+    list(reader.iter_rows(source))
+    assert inner.calls == 2
+
+
+def test_recently_modified_file_is_verified_by_content(tmp_path):
+    path = tmp_path / "fresh.xlsx"
+    path.write_bytes(b"aaaa")
+    st = os.stat(path)
+    reader, inner = _reader(tmp_path)
+    list(reader.iter_rows(str(path)))
+
+    path.write_bytes(b"bbbb")
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+    list(reader.iter_rows(str(path)))
+    assert inner.calls == 2
+
+    list(reader.iter_rows(str(path)))
+    assert inner.calls == 2
+
+
+def test_projection_change_resumes_from_the_inner_reader(tmp_path, source):
+    reader, inner = _reader(tmp_path)
+    list(reader.iter_rows(source))
+
+    projection = ColumnProjection()
+    rows = reader.iter_rows(source, projection)
+    assert [tuple(next(rows)) for _ in range(3)] == [tuple(r) for r in ROWS[:3]]
+    projection.indexes = (4, 0)
+    assert [tuple(r) for r in rows] == [projection.project(r) for r in ROWS[3:]]
+    assert inner.calls == 2
+
+
+def test_values_without_an_encoding_are_not_cached(tmp_path, source):
+    reader, inner = _reader(tmp_path, [("a", Decimal("1.5"))])
+    assert list(reader.iter_rows(source)) == [("a", Decimal("1.5"))]
+    assert _entries(tmp_path) == []
+
+
+def test_truncated_entry_is_reported_and_removed(tmp_path, source):
+    reader, _ = _reader(tmp_path)
+    list(reader.iter_rows(source))
+    (name,) = _entries(tmp_path)
+    entry = tmp_path / "cache" / name
+    entry.write_bytes(entry.read_bytes()[:-100])
+
+    with pytest.raises(ValueError):
+        list(reader.iter_rows(source))
+    assert _entries(tmp_path) == []
+
+
+class _Exploit:
+    ran = False
+
+    def __reduce__(self):
+        return (_Exploit.mark, ())
+
+    @staticmethod
+    def mark():
+        _Exploit.ran = True
+
+
+def test_entries_never_unpickle(tmp_path, source):
+    reader, inner = _reader(tmp_path)
+    list(reader.iter_rows(source))
+    (name,) = _entries(tmp_path)
+    payload = pickle.dumps(_Exploit())
+    (tmp_path / "cache" / name).write_bytes(MAGIC + len(payload).to_bytes(8, "little") + payload)
+
+    assert [tuple(r) for r in reader.iter_rows(source)] == [tuple(r) for r in ROWS]
+    assert not _Exploit.ran
+    assert inner.calls == 2
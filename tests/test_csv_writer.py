@@ -0,0 +1,82 @@
+import csv
+import os
+import stat
+import sys
+from datetime import datetime
+
+import pytest
+
+from src.infrastructure.csv_writer import CsvTableWriter, csv_writers
+
+HEADERS = ["ФИО", "Дата найма", "Зарплата"]
+ROWS = [["Иванов", datetime(2024, 1, 5), 1000.5], ["Петрова, А.", None, 2000]]
+
+
+def _umask():
+    mask = os.umask(0o022)
+    os.umask(mask)
+    return mask
+
+
+def _read(path, delimiter=","):
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        return list(csv.reader(f, delimiter=delimiter))
+
+
+def test_csv_and_tsv_output(tmp_path):
+    writers = csv_writers(bom=True)
+    writers[".csv"].write_table(str(tmp_path / "a.csv"), HEADERS, iter(ROWS), generated_at_iso="2024-05-01T10:30")
+    writers[".tsv"].write_table(str(tmp_path / "a.tsv"), HEADERS, iter(ROWS), generated_at_iso="2024-05-01T10:30")
+
+    assert (tmp_path / "a.csv").read_bytes().startswith(b"\xef\xbb\xbf")
+    for name, delimiter in (("a.csv", ","), ("a.tsv", "\t")):
+        rows = _read(tmp_path / name, delimiter)
+        assert rows[0] == HEADERS
+        assert rows[1][0] == "Иванов" and rows[1][1].startswith("2024-01-05")
+        assert rows[2][:2] == ["Петрова, А.", ""]
+
+
+def test_several_tables_get_a_sheet_column(tmp_path):
+    target = tmp_path / "a.csv"
+    CsvTableWriter().write_tables(str(target), HEADERS, [("Январь", ROWS[:1]), ("Февраль", ROWS[1:])],
+                                  generated_at_iso="2024-05-01T10:30")
+    rows = _read(target)
+    assert rows[0] == ["Лист", *HEADERS]
+    assert [r[0] for r in rows[1:]] == ["Январь", "Февраль"]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX permissions")
+def test_new_output_follows_umask_and_existing_mode_is_kept(tmp_path):
+    target = tmp_path / "a.csv"
+    CsvTableWriter().write_table(str(target), HEADERS, ROWS, generated_at_iso="")
+    assert stat.S_IMODE(os.stat(target).st_mode) == 0o666 & ~_umask()
+
+    os.chmod(target, 0o640)
+    CsvTableWriter().write_table(str(target), HEADERS, ROWS, generated_at_iso="")
+    assert stat.S_IMODE(os.stat(target).st_mode) == 0o640
+
+
+def test_failed_write_keeps_previous_output(tmp_path):
+    target = tmp_path / "a.csv"
+    CsvTableWriter().write_table(str(target), HEADERS, ROWS, generated_at_iso="")
+    before = target.read_bytes()
+
+    def failing_rows():
+        yield ROWS[0]
+        raise RuntimeError("чтение прервано")
+
+    with pytest.raises(RuntimeError):
+        CsvTableWriter().write_table(str(target), HEADERS, failing_rows(), generated_at_iso="")
+    assert target.read_bytes() == before
+    assert os.listdir(tmp_path) == ["a.csv"]
+
+
+def test_append_checks_the_header(tmp_path):
+    target = tmp_path / "a.csv"
+    writer = CsvTableWriter(bom=True)
+    writer.write_table(str(target), HEADERS, ROWS[:1], generated_at_iso="")
+    writer.append_table(str(target), HEADERS, ROWS[1:], generated_at_iso="")
+    assert [r[0] for r in _read(target)] == ["ФИО", "Иванов", "Петрова, А."]
+
+    with pytest.raises(ValueError):
+        writer.append_table(str(target), ["ФИО"], ROWS, generated_at_iso="")
@@ -0,0 +1,80 @@
+import logging
+import zipfile
+from xml.etree.ElementTree import ParseError
+
+import pytest
+
+from src.application.interface import ColumnProjection
+from src.infrastructure.fallback_reader import FallbackExcelReader, excel_reader, READER_NATIVE, READER_OPENPYXL
+
+
+class ListReader:
+    def __init__(self, rows, fail_after=None, names=("Лист",), error=zipfile.BadZipFile):
+        self.rows = rows
+        self.fail_after = fail_after
+        self.error = error
+        self.names = list(names)
+        self.calls = 0
+
+    def iter_rows(self, source_path, projection=None, sheet_name=None):
+        self.calls += 1
+        for i, row in enumerate(self.rows):
+            if self.fail_after is not None and i == self.fail_after:
+                raise self.error("unsupported")
+            yield projection.project(row) if projection is not None else row
+
+    def sheet_names(self, source_path):
+        if self.fail_after is not None:
+            raise self.error("unsupported")
+        return self.names
+
+
+ROWS = [(i, f"v{i}", i * 1.5) for i in range(10)]
+
+
+def test_primary_rows_are_used_when_it_succeeds():
+    primary, fallback = ListReader(ROWS), ListReader(ROWS)
+    assert list(FallbackExcelReader(primary, fallback).iter_rows("f.xlsx")) == ROWS
+    assert fallback.calls == 0
+
+
+@pytest.mark.parametrize("error", [zipfile.BadZipFile, KeyError, ParseError])
+def test_fallback_before_the_first_row_is_logged(caplog, error):
+    primary, fallback = ListReader(ROWS, fail_after=0, error=error), ListReader(ROWS)
+    with caplog.at_level(logging.WARNING):
+        assert list(FallbackExcelReader(primary, fallback).iter_rows("f.xlsx")) == ROWS
+    assert fallback.calls == 1
+    assert "f.xlsx" in caplog.text
+
+
+def test_error_after_the_first_row_is_not_hidden():
+    primary, fallback = ListReader(ROWS, fail_after=3), ListReader(ROWS)
+    rows = FallbackExcelReader(primary, fallback).iter_rows("f.xlsx")
+    with pytest.raises(zipfile.BadZipFile):
+        list(rows)
+    assert fallback.calls == 0
+
+
+def test_unexpected_errors_are_not_hidden():
+    primary, fallback = ListReader(ROWS, fail_after=0, error=ZeroDivisionError), ListReader(ROWS)
+    with pytest.raises(ZeroDivisionError):
+        list(FallbackExcelReader(primary, fallback).iter_rows("f.xlsx"))
+    assert fallback.calls == 0
+
+
+def test_fallback_keeps_projection():
+    projection = ColumnProjection(indexes=(2, 0))
+    rows = FallbackExcelReader(ListReader(ROWS, fail_after=0), ListReader(ROWS)).iter_rows("f.xlsx", projection)
+    assert list(rows) == [(r[2], r[0]) for r in ROWS]
+
+
+def test_sheet_names_fall_back():
+    reader = FallbackExcelReader(ListReader(ROWS, fail_after=0), ListReader(ROWS, names=("A", "B")))
+    assert reader.sheet_names("f.xlsx") == ["A", "B"]
+
+
+def test_excel_reader_kinds():
+    assert isinstance(excel_reader(READER_NATIVE), FallbackExcelReader)
+    assert not isinstance(excel_reader(READER_OPENPYXL), FallbackExcelReader)
+    with pytest.raises(ValueError):
+        excel_reader("xlrd")
@@ -0,0 +1,126 @@
+from datetime import datetime
+
+import pytest
+
+from src.application.dto import Columns
+from src.application.interactors.process_excel_interactor import ProcessExcelInteractor
+from src.infrastructure.checkpoint_store import JsonCheckpointStore
+from src.infrastructure.csv_writer import CsvTableWriter, csv_writers
+from src.infrastructure.filesystem import LocalFileSystem
+from tests.fakes import HEADERS, ListReader, employee_rows, request
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    source = tmp_path / "source.xlsx"
+    source.write_bytes(b"placeholder")
+    return tmp_path, str(source)
+
+
+def _interactor(tmp_path, rows, checkpoints=True):
+    return ProcessExcelInteractor(
+        fs=LocalFileSystem(),
+        reader=ListReader(rows),
+        writer=CsvTableWriter(),
+        writers_by_extension=csv_writers(),
+        checkpoints=JsonCheckpointStore(str(tmp_path / "checkpoints")) if checkpoints else None,
+    )
+
+
+def _run(tmp_path, source, rows, target="out.csv", **kwargs):
+    target = str(tmp_path / target)
+    req = request(Columns.POSITION, "инженер", source_path=source, target_path=target, **kwargs)
+    result = _interactor(tmp_path, rows)(req)
+    with open(target, encoding="utf-8") as f:
+        return result, f.read()
+
+
+def _full(tmp_path, source, rows):
+    return _run(tmp_path, source, rows, target="full.csv")[1]
+
+
+def _more_rows(rows, start, count):
+    return rows + [
+        (i, f"Новый {i}", "Инженер" if i % 3 else "Менеджер", "Отдел 9", datetime(2025, 1, 1), 1.0, None)
+        for i in range(start, start + count)
+    ]
+
+
+def test_appended_rows_are_filtered_once(workspace):
+    tmp_path, source = workspace
+    rows = employee_rows(20)
+    result, _ = _run(tmp_path, source, rows, incremental=True)
+    assert result.success and result.message == "Документ обработан"
+
+    grown = _more_rows(rows, 100, 9)
+    result, text = _run(tmp_path, source, grown, incremental=True)
+    assert result.success and result.message == "Добавлено строк: 6"
+    assert result.metrics.rows_matched == 6
+    assert text == _full(tmp_path, source, grown)
+
+    result, text = _run(tmp_path, source, grown, incremental=True)
+    assert result.success and result.message == "Новых совпадений нет"
+    assert text == _full(tmp_path, source, grown)
+
+
+def test_changed_prefix_rebuilds_output(workspace):
+    tmp_path, source = workspace
+    rows = employee_rows(20)
+    _run(tmp_path, source, rows, incremental=True)
+
+    edited = list(rows)
+    edited[3] = (*edited[3][:2], "Инженер", *edited[3][3:])
+    edited = _more_rows(edited, 100, 3)
+    result, text = _run(tmp_path, source, edited, incremental=True)
+    assert result.success and result.message == "Документ обработан"
+    assert text == _full(tmp_path, source, edited)
+
+
+def test_reordered_header_rebuilds_output(workspace):
+    tmp_path, source = workspace
+    rows = employee_rows(10)
+    _run(tmp_path, source, rows, incremental=True)
+
+    order = [1, 0, 2, 3, 4, 5, 6]
+    moved = [tuple(r[i] for i in order) if len(r) == len(HEADERS) else r for r in rows]
+    result, text = _run(tmp_path, source, moved, incremental=True)
+    assert result.message == "Документ обработан"
+    assert text == _full(tmp_path, source, moved)
+
+
+def test_edited_output_rebuilds_output(workspace):
+    tmp_path, source = workspace
+    rows = employee_rows(10)
+    _run(tmp_path, source, rows, incremental=True)
+    with open(tmp_path / "out.csv", "a", encoding="utf-8") as f:
+        f.write("лишняя строка\r\n")
+
+    grown = _more_rows(rows, 100, 3)
+    result, text = _run(tmp_path, source, grown, incremental=True)
+    assert result.message == "Документ обработан"
+    assert text == _full(tmp_path, source, grown)
+
+
+def test_incremental_requires_a_plain_request(workspace):
+    tmp_path, source = workspace
+    rows = employee_rows(5)
+    req = request(source_path=source, target_path=str(tmp_path / "out.csv"), incremental=True)
+
+    assert _interactor(tmp_path, rows, checkpoints=False)(req).error_code == "incremental_unavailable"
+    sorted_req = request(source_path=source, target_path=str(tmp_path / "out.csv"), incremental=True, order_by=Columns.FIO)
+    assert _interactor(tmp_path, rows)(sorted_req).error_code == "incremental_unsupported"
+
+
+def test_checkpoint_store_round_trip_and_corruption(tmp_path):
+    from src.application.checkpoints import Checkpoint
+
+    store = JsonCheckpointStore(str(tmp_path / "checkpoints"))
+    checkpoint = Checkpoint(12, "abc", {"ФИО": 1}, 3, 100, 5)
+    store.save("key", checkpoint)
+    assert store.load("key") == checkpoint
+
+    (tmp_path / "checkpoints" / "key.json").write_text("{не json", encoding="utf-8")
+    assert store.load("key") is None
+    store.discard("key")
+    store.discard("key")
+    assert store.load("key") is None
@@ -0,0 +1,44 @@
+import pytest
+
+from src.application.filters import InFilter, RangeFilter
+from src.application.indexes import EqualityIndex
+from src.application.loaded_sheet import LoadedSheet
+from src.application.row_store import CompactTable
+from tests.fakes import baseline_matches, parsed_request
+from tests.filter_cases import CELLS, RAW_FILTERS
+
+CASES = [(column, raw) for column, raws in RAW_FILTERS.items() for raw in raws]
+IDS = [f"{c.name}:{r}" for c, r in CASES]
+
+
+def _parsed(column, raw):
+    req = parsed_request(column, raw)
+    if req is None:
+        pytest.skip("filter value is rejected before matching")
+    return req
+
+
+def _baseline_positions(req, cells=CELLS):
+    return [pos for pos, cell in enumerate(cells) if baseline_matches(req, cell)]
+
+
+@pytest.mark.parametrize("column, raw", CASES, ids=IDS)
+def test_equality_index_matches_compare_values(column, raw):
+    req = _parsed(column, raw)
+    if isinstance(req.filter_value, RangeFilter):
+        pytest.skip("ranges are answered by the sorted index")
+    index = EqualityIndex.build(column, CELLS)
+    if isinstance(req.filter_value, InFilter):
+        positions = index.lookup_many(req.filter_value.values)
+    else:
+        positions = index.lookup(req.filter_value)
+    if positions is not None:
+        assert positions == _baseline_positions(req)
+
+
+@pytest.mark.parametrize("column, raw", CASES, ids=IDS)
+def test_loaded_sheet_positions_match_compare_values(column, raw):
+    req = _parsed(column, raw)
+    sheet = LoadedSheet({column.value: 0}, CompactTable.build([(cell,) for cell in CELLS], 1))
+    assert sheet.match_positions(req) == _baseline_positions(req)
+    assert sheet.match_positions(req) == _baseline_positions(req)
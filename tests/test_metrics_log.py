@@ -0,0 +1,36 @@
+import json
+
+from src.application.dto import ProcessingResultDTO
+from src.infrastructure.metrics_log import JsonLogMetricsSink, log_event, log_metrics_to_file
+
+
+def test_repeated_setup_writes_each_record_once(tmp_path):
+    path = tmp_path / "metrics.jsonl"
+    logger = log_metrics_to_file(str(path))
+    try:
+        assert log_metrics_to_file(str(path)) is logger
+        JsonLogMetricsSink(logger)(ProcessingResultDTO(True, "ok", output_path="out.xlsx"))
+        for handler in logger.handlers:
+            handler.flush()
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 1
+        assert json.loads(lines[0])["output_path"] == "out.xlsx"
+    finally:
+        for handler in list(logger.handlers):
+            logger.removeHandler(handler)
+            handler.close()
+
+
+def test_log_event_goes_to_the_metrics_file(tmp_path):
+    path = tmp_path / "metrics.jsonl"
+    logger = log_metrics_to_file(str(path))
+    try:
+        log_event("startup", window_shown_ms=12.5)
+        for handler in logger.handlers:
+            handler.flush()
+        record = json.loads(path.read_text(encoding="utf-8"))
+        assert record["event"] == "startup" and record["window_shown_ms"] == 12.5
+    finally:
+        for handler in list(logger.handlers):
+            logger.removeHandler(handler)
+            handler.close()
@@ -0,0 +1,61 @@
+import time
+from dataclasses import replace
+
+import pytest
+
+from src.application.dto import Columns
+from src.application.interactors.process_excel_interactor import ProcessExcelInteractor
+from tests.fakes import HEADERS, ListReader, ListWriter, StubFileSystem, employee_rows, request
+
+SHEETS = {
+    "Январь": employee_rows(10),
+    "Февраль": employee_rows(7),
+    "Пусто": [("нет заголовка",)],
+    "Март": employee_rows(4),
+}
+
+
+class SlowReader(ListReader):
+    def iter_rows(self, source_path, projection=None, sheet_name=None):
+        for row in super().iter_rows(source_path, projection, sheet_name):
+            time.sleep(0.001)
+            yield row
+
+
+def _interactor(reader, writer, workers):
+    return ProcessExcelInteractor(fs=StubFileSystem(), reader=reader, writer=writer, sheet_workers=workers)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+@pytest.mark.parametrize("split", [False, True])
+def test_all_sheets_are_filtered_in_order(workers, split):
+    writer = ListWriter()
+    result = _interactor(ListReader([], SHEETS), writer, workers)(
+        request(Columns.POSITION, "инженер", all_sheets=True, split_sheets=split)
+    )
+
+    assert result.success
+    counts = {c.sheet_name: (c.rows_matched, c.header_found) for c in result.sheet_counts}
+    assert counts == {"Январь": (5, True), "Февраль": (3, True), "Пусто": (0, False), "Март": (2, True)}
+    assert len(writer.rows) == 10
+    if split:
+        assert [title for title, _ in writer.tables] == ["Январь", "Февраль", "Март"]
+
+
+def test_selected_sheets_only():
+    writer = ListWriter()
+    result = _interactor(ListReader([], SHEETS), writer, 1)(request(sheet_names=("Март",)))
+    assert result.success and [c.sheet_name for c in result.sheet_counts] == ["Март"]
+    assert len(writer.rows) == 2
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_cancel_stops_sheet_workers_promptly(workers):
+    sheets = {f"Лист {i}": [HEADERS] + employee_rows(3000)[3:] for i in range(6)}
+    started = time.perf_counter()
+    result = _interactor(SlowReader([], sheets), ListWriter(), workers)(
+        replace(request(), all_sheets=True),
+        is_cancelled=lambda: time.perf_counter() - started > 0.3,
+    )
+    assert result.error_code == "cancelled"
+    assert time.perf_counter() - started < 3
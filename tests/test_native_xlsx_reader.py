@@ -0,0 +1,179 @@
+import zipfile
+from datetime import datetime
+
+import pytest
+
+from src.application.interface import ColumnProjection
+from src.infrastructure.native_xlsx_reader import NativeXlsxReader
+from src.infrastructure.openpyxl_reader import OpenPyxlExcelReader
+
+pytest.importorskip("openpyxl")
+
+MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+PKG_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+
+STYLES = f"""<styleSheet xmlns="{MAIN_NS}">
+<numFmts count="6">
+<numFmt numFmtId="164" formatCode="dd/mm/yyyy\\ hh:mm"/>
+<numFmt numFmtId="165" formatCode="[h]:mm:ss"/>
+<numFmt numFmtId="166" formatCode="[$-419]mmmm\\ yyyy;@"/>
+<numFmt numFmtId="167" formatCode="[Red]0.00;[Blue]\\-0.00"/>
+<numFmt numFmtId="168" formatCode="&quot;Год&quot;\\ 0"/>
+<numFmt numFmtId="169" formatCode="hh:mm"/>
+</numFmts>
+<fonts count="1"><font/></fonts><fills count="1"><fill><patternFill patternType="none"/></fill></fills><borders count="1"><border/></borders>
+<cellStyleXfs count="1"><xf numFmtId="0"/></cellStyleXfs>
+<cellXfs count="10">
+<xf numFmtId="0"/><xf numFmtId="14" applyNumberFormat="1"/><xf numFmtId="22" applyNumberFormat="1"/>
+<xf numFmtId="46" applyNumberFormat="1"/><xf numFmtId="164" applyNumberFormat="1"/><xf numFmtId="165" applyNumberFormat="1"/>
+<xf numFmtId="166" applyNumberFormat="1"/><xf numFmtId="167" applyNumberFormat="1"/><xf numFmtId="168" applyNumberFormat="1"/>
+<xf numFmtId="169" applyNumberFormat="1"/>
+</cellXfs>
+<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>
+</styleSheet>"""
+
+SHARED = [
+    "<si><t>ФИО</t></si>",
+    "<si><r><rPr><b/></rPr><t>Инж</t></r><r><t xml:space=\"preserve\">енер </t></r><rPh sb=\"0\" eb=\"1\"><t>x</t></rPh></si>",
+    "<si><t xml:space=\"preserve\">  пробелы  </t></si>",
+    "<si><t/></si>",
+]
+
+
+def _write_xlsx(path, sheet_xml, shared=SHARED, date1904=False):
+    workbook_pr = '<workbookPr date1904="1"/>' if date1904 else "<workbookPr/>"
+    with zipfile.ZipFile(path, "w") as z:
+        z.writestr("[Content_Types].xml", """<?xml version="1.0" encoding="UTF-8"?>
+<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
+<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
+<Default Extension="xml" ContentType="application/xml"/>
+<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>
+<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>
+<Override PartName="/xl/worksheets/sheet2.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>
+<Override PartName="/xl/sharedStrings.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sharedStrings+xml"/>
+<Override PartName="/xl/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>
+</Types>""")
+        z.writestr("_rels/.rels", f"""<?xml version="1.0" encoding="UTF-8"?>
+<Relationships xmlns="{PKG_REL_NS}">
+<Relationship Id="rId1" Type="{REL_NS}/officeDocument" Target="xl/workbook.xml"/>
+</Relationships>""")
+        z.writestr("xl/workbook.xml", f"""<?xml version="1.0" encoding="UTF-8"?>
+<workbook xmlns="{MAIN_NS}" xmlns:r="{REL_NS}">{workbook_pr}
+<bookViews><workbookView activeTab="1"/></bookViews>
+<sheets><sheet name="Пусто" sheetId="1" r:id="rId1"/><sheet name="Данные" sheetId="2" r:id="rId2"/></sheets>
+</workbook>""")
+        z.writestr("xl/_rels/workbook.xml.rels", f"""<?xml version="1.0" encoding="UTF-8"?>
+<Relationships xmlns="{PKG_REL_NS}">
+<Relationship Id="rId1" Type="{REL_NS}/worksheet" Target="worksheets/sheet1.xml"/>
+<Relationship Id="rId2" Type="{REL_NS}/worksheet" Target="/xl/worksheets/sheet2.xml"/>
+<Relationship Id="rId3" Type="{REL_NS}/sharedStrings" Target="sharedStrings.xml"/>
+<Relationship Id="rId4" Type="{REL_NS}/styles" Target="styles.xml"/>
+</Relationships>""")
+        z.writestr("xl/worksheets/sheet1.xml", f'<worksheet xmlns="{MAIN_NS}"><sheetData/></worksheet>')
+        z.writestr("xl/worksheets/sheet2.xml", f'<worksheet xmlns="{MAIN_NS}">{sheet_xml}</worksheet>')
+        z.writestr("xl/sharedStrings.xml", f'<sst xmlns="{MAIN_NS}">{"".join(shared)}</sst>')
+        z.writestr("xl/styles.xml", STYLES)
+    return str(path)
+
+
+def _rows(reader, path, sheet_name=None):
+    return [tuple(row) for row in reader.iter_rows(path, sheet_name=sheet_name)]
+
+
+def _assert_same_rows(path, sheet_name=None):
+    expected = _rows(OpenPyxlExcelReader(), path, sheet_name)
+    actual = _rows(NativeXlsxReader(), path, sheet_name)
+    assert len(actual) == len(expected)
+    for row_no, (got, want) in enumerate(zip(actual, expected), start=1):
+        assert len(got) == len(want), f"row {row_no}"
+        for col_no, (a, b) in enumerate(zip(got, want), start=1):
+            assert type(a) is type(b) and a == b, f"cell R{row_no}C{col_no}: {a!r} != {b!r}"
+    return actual
+
+
+def test_shared_rich_and_inline_strings(tmp_path):
+    path = _write_xlsx(tmp_path / "strings.xlsx", """<dimension ref="A1:E3"/><sheetData>
+<row r="1"><c r="A1" t="s"><v>0</v></c><c r="B1" t="s"><v>1</v></c><c r="C1" t="s"><v>2</v></c><c r="D1" t="s"><v>3</v></c></row>
+<row r="2"><c r="A2" t="inlineStr"><is><t>строка</t></is></c><c r="B2" t="inlineStr"><is><r><t>бо</t></r><r><t>гатая</t></r></is></c>
+<c r="C2" t="str"><v>формула</v></c><c r="D2" t="b"><v>1</v></c><c r="E2" t="b"><v>0</v></c></row>
+<row r="3"><c r="A3" t="e"><v>#N/A</v></c><c r="B3"><v>42</v></c><c r="C3"><v>-1.5</v></c><c r="D3"><v>1E-3</v></c><c r="E3"><v>12345678901</v></c></row>
+</sheetData>""")
+    rows = _assert_same_rows(path)
+    assert rows[0][:2] == ("ФИО", "Инженер ")
+
+
+@pytest.mark.parametrize("date1904", [False, True])
+def test_builtin_and_custom_number_formats(tmp_path, date1904):
+    path = _write_xlsx(tmp_path / "formats.xlsx", """<dimension ref="A1:I2"/><sheetData>
+<row r="1"><c r="A1" s="1"><v>45949</v></c><c r="B1" s="2"><v>45949.75</v></c><c r="C1" s="3"><v>1.5</v></c>
+<c r="D1" s="4"><v>45949.5</v></c><c r="E1" s="5"><v>2.25</v></c><c r="F1" s="6"><v>45949</v></c>
+<c r="G1" s="7"><v>45949</v></c><c r="H1" s="8"><v>2024</v></c><c r="I1" s="9"><v>0.5</v></c></row>
+<row r="2"><c r="A2" s="1"><v>60</v></c><c r="B2" s="1"><v>1</v></c><c r="C2" s="5"><v>0</v></c><c r="D2" s="0"><v>45949</v></c></row>
+</sheetData>""", date1904=date1904)
+    rows = _assert_same_rows(path)
+    assert isinstance(rows[0][0], datetime)
+    assert rows[0][6] == 45949 and rows[0][7] == 2024
+
+
+def test_sparse_rows_and_cells(tmp_path):
+    path = _write_xlsx(tmp_path / "sparse.xlsx", """<dimension ref="A1:F9"/><sheetData>
+<row r="2"><c r="B2"><v>1</v></c></row>
+<row r="5"><c r="A5" t="s"><v>0</v></c><c r="F5"><v>6</v></c></row>
+<row r="6"/>
+<row r="8"><c r="C8" t="inlineStr"><is><t>x</t></is></c></row>
+</sheetData>""")
+    _assert_same_rows(path)
+
+
+def test_rows_and_cells_without_references(tmp_path):
+    path = _write_xlsx(tmp_path / "no_refs.xlsx", """<sheetData>
+<row><c t="s"><v>0</v></c><c><v>1</v></c><c t="inlineStr"><is><t>a</t></is></c></row>
+<row><c><v>2</v></c></row>
+<row><c r="C3"><v>3</v></c><c><v>4</v></c></row>
+</sheetData>""")
+    _assert_same_rows(path)
+
+
+def test_dimension_padding(tmp_path):
+    path = _write_xlsx(tmp_path / "padding.xlsx", """<dimension ref="A1:H4"/><sheetData>
+<row r="1"><c r="A1"><v>1</v></c></row>
+<row r="2"><c r="A2"><v>2</v></c><c r="C2"><v>3</v></c></row>
+</sheetData>""")
+    rows = _assert_same_rows(path)
+    assert all(len(row) == 8 for row in rows)
+
+
+def test_named_sheet_and_sheet_names(tmp_path):
+    path = _write_xlsx(tmp_path / "sheets.xlsx", '<sheetData><row r="1"><c r="A1"><v>1</v></c></row></sheetData>')
+    assert NativeXlsxReader().sheet_names(path) == OpenPyxlExcelReader().sheet_names(path)
+    _assert_same_rows(path, "Пусто")
+    _assert_same_rows(path, "Данные")
+    with pytest.raises(ValueError):
+        list(NativeXlsxReader().iter_rows(path, sheet_name="Нет такого"))
+
+
+def test_projection_switches_mid_stream(tmp_path):
+    path = _write_xlsx(tmp_path / "projection.xlsx", """<dimension ref="A1:D3"/><sheetData>
+<row r="1"><c r="A1" t="s"><v>0</v></c><c r="B1"><v>1</v></c><c r="C1"><v>2</v></c><c r="D1"><v>3</v></c></row>
+<row r="2"><c r="A2"><v>4</v></c><c r="B2"><v>5</v></c><c r="C2"><v>6</v></c><c r="D2"><v>7</v></c></row>
+<row r="3"><c r="B3"><v>9</v></c></row>
+</sheetData>""")
+    projection = ColumnProjection()
+    rows = NativeXlsxReader().iter_rows(path, projection)
+    assert tuple(next(rows)) == ("ФИО", 1, 2, 3)
+    projection.indexes = (3, 1)
+    assert [tuple(r) for r in rows] == [(7, 5), (None, 9)]
+
+
+def test_openpyxl_written_workbook(tmp_path):
+    openpyxl = pytest.importorskip("openpyxl")
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.append(["ФИО", "Дата найма", "Зарплата", "Стаж"])
+    for i in range(200):
+        ws.append([f"Сотрудник {i}", datetime(2020, 1, 1 + i % 28, i % 24), 1000.5 * i, i % 3 == 0])
+    ws["F210"] = "хвост"
+    path = str(tmp_path / "written.xlsx")
+    wb.save(path)
+    _assert_same_rows(path)
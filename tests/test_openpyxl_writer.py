@@ -0,0 +1,89 @@
+import gc
+import os
+import stat
+import sys
+from datetime import datetime
+
+import pytest
+
+from src.application.aggregates import SalaryAggregator
+from src.infrastructure.openpyxl_writer import OpenPyxlExcelWriter
+
+openpyxl = pytest.importorskip("openpyxl")
+
+HEADERS = ["ФИО", "Отдел", "Должность", "Зарплата"]
+ROWS = [["Иванов", "ИТ", "Инженер", 1000.0], ["Петрова", "ИТ", "Инженер", None], ["Сидоров", None, "Менеджер", 2500]]
+
+
+def _umask():
+    mask = os.umask(0o022)
+    os.umask(mask)
+    return mask
+
+
+def _write(path, rows=ROWS, **kwargs):
+    OpenPyxlExcelWriter().write_table(str(path), HEADERS, iter(rows), generated_at_iso="2024-05-01T10:30", **kwargs)
+
+
+def _mode(path):
+    return stat.S_IMODE(os.stat(path).st_mode)
+
+
+def test_writes_preamble_header_rows_and_summary(tmp_path):
+    target = tmp_path / "out.xlsx"
+    aggregator = SalaryAggregator(HEADERS)
+    _write(target, list(aggregator.track(ROWS)), summary=aggregator.sheet())
+
+    wb = openpyxl.load_workbook(target, read_only=True)
+    data, summary = wb.worksheets
+    rows = [list(r) for r in data.iter_rows(max_col=4, values_only=True)]
+    assert rows[1][:2] == ["Дата формирования", "01.05.2024 10:30"]
+    assert rows[3] == HEADERS
+    assert rows[4:] == ROWS
+    assert summary.title == "Сводка"
+    wb.close()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX permissions")
+def test_new_output_follows_umask_and_existing_mode_is_kept(tmp_path):
+    target = tmp_path / "out.xlsx"
+    _write(target)
+    assert _mode(target) == 0o666 & ~_umask()
+
+    os.chmod(target, 0o640)
+    _write(target)
+    assert _mode(target) == 0o640
+
+
+def test_failed_write_keeps_previous_output_and_leaves_no_temp_files(tmp_path):
+    target = tmp_path / "out.xlsx"
+    _write(target)
+    before = target.read_bytes()
+
+    def failing_rows():
+        yield ROWS[0]
+        raise RuntimeError("чтение прервано")
+
+    unraisable = []
+    hook, sys.unraisablehook = sys.unraisablehook, unraisable.append
+    try:
+        with pytest.raises(RuntimeError):
+            _write(target, failing_rows())
+        gc.collect()
+    finally:
+        sys.unraisablehook = hook
+
+    assert unraisable == []
+    assert target.read_bytes() == before
+    assert os.listdir(tmp_path) == ["out.xlsx"]
+
+
+def test_append_table_keeps_existing_rows(tmp_path):
+    target = tmp_path / "out.xlsx"
+    _write(target)
+    OpenPyxlExcelWriter().append_table(str(target), HEADERS, iter([["Новый", "ИТ", "Инженер", datetime(2024, 1, 1)]]),
+                                       generated_at_iso="2024-05-02T09:00")
+    wb = openpyxl.load_workbook(target, read_only=True)
+    rows = [list(r) for r in wb.worksheets[0].iter_rows(max_col=4, values_only=True)]
+    wb.close()
+    assert rows[4:] == ROWS + [["Новый", "ИТ", "Инженер", datetime(2024, 1, 1)]]
@@ -0,0 +1,151 @@
+import os
+import sys
+import threading
+import time
+from datetime import datetime
+
+import pytest
+
+from src.application.dto import Columns, PartitionRequestDTO
+from src.application.indexes import partition_key
+from src.application.interactors.partition_excel_interactor import PARTITION_WRITE_WORKERS, PartitionExcelInteractor
+from tests.fakes import HEADERS, ListReader, StubFileSystem, baseline_matches, employee_rows, parsed_request
+from tests.filter_cases import CELLS, RAW_FILTERS
+
+
+class RecordingWriter:
+    def __init__(self, delay=0.0):
+        self.tables = {}
+        self.delay = delay
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def write_table(self, target_path, headers, rows, **kwargs):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            out = []
+            for row in rows:
+                time.sleep(self.delay)
+                out.append(list(row))
+            with self._lock:
+                self.tables[target_path] = out
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def _rows_with(column, values):
+    i = HEADERS.index(column.value)
+    rows = [HEADERS]
+    for n, value in enumerate(values):
+        row = [n, f"С{n}", "Инженер", "Отдел", datetime(2024, 1, 1), 1000.0, None]
+        row[i] = value
+        rows.append(tuple(row))
+    return rows
+
+
+def _partition(rows, column, writer=None, **kwargs):
+    writer = writer or RecordingWriter()
+    interactor = PartitionExcelInteractor(fs=StubFileSystem(), reader=ListReader(rows), writer=writer, **kwargs)
+    return interactor(PartitionRequestDTO("source.xlsx", "out", column), is_cancelled=kwargs.pop("cancel", None)), writer
+
+
+@pytest.mark.parametrize("column", list(Columns))
+def test_partition_keys_agree_with_the_filter(column):
+    keyed = [(partition_key(column, cell), cell) for cell in CELLS]
+    filters = [req for req in (parsed_request(column, raw) for raw in RAW_FILTERS[column]) if req is not None]
+    for key_a, a in keyed:
+        for key_b, b in keyed:
+            if key_a is None or key_a != key_b:
+                continue
+            for req in filters:
+                assert baseline_matches(req, a) == baseline_matches(req, b), (a, b, req.filter_value_raw)
+
+
+def test_numbers_in_text_columns_share_a_partition():
+    result, writer = _partition(_rows_with(Columns.DEPARTMENT, [1, 1.0, "Отдел", " отдел ", 2, None, ""]), Columns.DEPARTMENT)
+    assert result.success
+    assert sorted(len(rows) for rows in writer.tables.values()) == [1, 2, 2]
+    assert sorted(os.path.basename(p) for p in result.output_paths) == ["1.xlsx", "2.xlsx", "Отдел.xlsx"]
+
+
+def test_spilled_partitions_match_in_memory_ones(tmp_path):
+    rows = employee_rows(200)
+    in_memory, expected = _partition(rows, Columns.HIRE_DATE)
+    spilled, writer = _partition(rows, Columns.HIRE_DATE, partition_memory_rows=3, sort_spill_dir=str(tmp_path))
+    assert in_memory.success and spilled.success
+    assert writer.tables == expected.tables
+    assert os.listdir(tmp_path) == []
+
+
+def test_writers_are_bounded():
+    rows = _rows_with(Columns.FIO, [f"Имя {i}" for i in range(40)])
+    result, writer = _partition(rows, Columns.FIO, RecordingWriter(delay=0.002))
+    assert result.success and len(writer.tables) == 40
+    assert writer.max_active <= PARTITION_WRITE_WORKERS
+
+
+def test_too_many_partitions_writes_nothing(tmp_path):
+    rows = _rows_with(Columns.FIO, [f"Имя {i}" for i in range(10)])
+    result, writer = _partition(rows, Columns.FIO, max_partitions=3, partition_memory_rows=2, sort_spill_dir=str(tmp_path))
+    assert result.error_code == "too_many_partitions"
+    assert writer.tables == {}
+    assert os.listdir(tmp_path) == []
+
+
+class FailingFileWriter:
+    def write_table(self, target_path, headers, rows, **kwargs):
+        rows = list(rows)
+        if os.path.basename(target_path).startswith("Имя 3"):
+            raise OSError("диск заполнен")
+        with open(target_path, "w", encoding="utf-8") as f:
+            f.write(str(rows))
+
+
+def test_failed_partition_removes_the_written_ones(tmp_path):
+    rows = _rows_with(Columns.FIO, [f"Имя {i}" for i in range(6)])
+    interactor = PartitionExcelInteractor(fs=StubFileSystem(), reader=ListReader(rows), writer=FailingFileWriter())
+    result = interactor(PartitionRequestDTO("source.xlsx", str(tmp_path), Columns.FIO))
+    assert result.error_code == "excel_write_failed"
+    assert "Имя 3" in result.message
+    assert os.listdir(tmp_path) == []
+
+
+def test_cancel_while_writing_stops_the_writers():
+    rows = _rows_with(Columns.FIO, [f"Имя {i % 8}" for i in range(400)])
+    writer = RecordingWriter(delay=0.01)
+    started = time.perf_counter()
+    interactor = PartitionExcelInteractor(fs=StubFileSystem(), reader=ListReader(rows), writer=writer)
+    result = interactor(
+        PartitionRequestDTO("source.xlsx", "out", Columns.FIO),
+        is_cancelled=lambda: time.perf_counter() - started > 0.2,
+    )
+    assert result.error_code == "cancelled"
+    assert time.perf_counter() - started < 2
+    assert writer.active == 0 and writer.tables == {}
+
+
+def test_aborted_xlsx_partitions_close_cleanly(tmp_path):
+    pytest.importorskip("openpyxl")
+    from src.infrastructure.openpyxl_writer import OpenPyxlExcelWriter
+
+    rows = _rows_with(Columns.FIO, [f"Имя {i % 5}" for i in range(3000)])
+    started = time.perf_counter()
+    unraisable = []
+    hook, sys.unraisablehook = sys.unraisablehook, unraisable.append
+    try:
+        interactor = PartitionExcelInteractor(fs=StubFileSystem(), reader=ListReader(rows), writer=OpenPyxlExcelWriter())
+        result = interactor(
+            PartitionRequestDTO("source.xlsx", str(tmp_path), Columns.FIO),
+            is_cancelled=lambda: time.perf_counter() - started > 0.05,
+        )
+        import gc
+        gc.collect()
+    finally:
+        sys.unraisablehook = hook
+    assert result.error_code == "cancelled"
+    assert unraisable == []
+    assert os.listdir(tmp_path) == []
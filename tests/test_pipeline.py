@@ -0,0 +1,62 @@
+import pytest
+
+from src.application.dto import Columns
+from src.application.interactors.process_excel_interactor import ProcessExcelInteractor
+from src.application.metrics import STAGE_WAIT, STAGES
+from tests.fakes import HEADERS, ListReader, ListWriter, StubFileSystem, employee_rows, request
+
+
+class BrokenReader(ListReader):
+    def iter_rows(self, source_path, projection=None, sheet_name=None):
+        yield HEADERS
+        raise RuntimeError("битый архив")
+
+
+class BrokenBeforeHeaderReader(ListReader):
+    def iter_rows(self, source_path, projection=None, sheet_name=None):
+        yield ("Отчёт",)
+        raise RuntimeError("битый архив")
+
+
+def _run(reader, req, pipelined):
+    writer = ListWriter()
+    interactor = ProcessExcelInteractor(fs=StubFileSystem(), reader=reader, writer=writer, pipelined=pipelined)
+    return interactor(req), writer
+
+
+@pytest.mark.parametrize("column, value", [(Columns.POSITION, "инженер"), (Columns.SALARY, ">=2000")])
+def test_pipelined_output_matches_streaming(column, value):
+    rows = employee_rows(5000)
+    streamed, expected = _run(ListReader(rows), request(column, value), pipelined=False)
+    piped, writer = _run(ListReader(rows), request(column, value), pipelined=True)
+
+    assert streamed.success and piped.success
+    assert writer.rows == expected.rows
+    assert piped.metrics.rows_read == streamed.metrics.rows_read
+    assert piped.metrics.rows_matched == streamed.metrics.rows_matched
+
+
+def test_pipelined_metrics_report_wait_and_child_memory():
+    result, _ = _run(ListReader(employee_rows(200)), request(), pipelined=True)
+    stages = dict(result.metrics.stage_seconds)
+    assert STAGE_WAIT in STAGES
+    assert list(stages) == list(STAGES)
+    assert result.metrics.peak_child_rss_bytes is not None and result.metrics.peak_child_rss_bytes > 0
+
+
+def test_pipelined_read_errors_and_empty_results():
+    result, _ = _run(BrokenReader([]), request(), pipelined=True)
+    assert result.error_code == "excel_read_failed"
+
+    result, _ = _run(ListReader(employee_rows(5)), request(Columns.POSITION, "директор"), pipelined=True)
+    assert result.error_code == "no_matches"
+
+    result, _ = _run(ListReader([("без заголовка",)]), request(), pipelined=True)
+    assert result.error_code == "header_not_found"
+
+
+@pytest.mark.parametrize("pipelined", [False, True])
+def test_read_error_before_header_is_reported(pipelined):
+    result, _ = _run(BrokenBeforeHeaderReader([]), request(), pipelined=pipelined)
+    assert not result.success
+    assert result.error_code == "excel_read_failed"
@@ -0,0 +1,24 @@
+import pytest
+
+from src.application.dto import Columns
+from src.application.predicates import compile_filter
+from tests.fakes import baseline_matches, parsed_request
+from tests.filter_cases import CELLS, RAW_FILTERS
+
+CASES = [(column, raw) for column, raws in RAW_FILTERS.items() for raw in raws]
+
+
+@pytest.mark.parametrize("column, raw", CASES, ids=[f"{c.name}:{r}" for c, r in CASES])
+def test_compiled_predicate_matches_compare_values(column, raw):
+    req = parsed_request(column, raw)
+    if req is None:
+        pytest.skip("filter value is rejected before matching")
+    matches = compile_filter(req)
+    for cell in CELLS:
+        assert matches(cell) == baseline_matches(req, cell), repr(cell)
+
+
+def test_none_filter_matches_only_empty_cells():
+    req = parsed_request(Columns.FIO, "x").with_parsed_filter_value(None)
+    matches = compile_filter(req)
+    assert [cell for cell in CELLS if matches(cell)] == [None]
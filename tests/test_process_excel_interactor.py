@@ -0,0 +1,92 @@
+import pytest
+
+from src.application.dto import Columns
+from src.application.interactors.process_excel_interactor import ProcessExcelInteractor
+from tests.fakes import HEADERS, ListReader, ListWriter, StubFileSystem, employee_rows, request
+
+
+def _run(rows, req, **kwargs):
+    writer = ListWriter()
+    interactor = ProcessExcelInteractor(fs=StubFileSystem(), reader=ListReader(rows), writer=writer, **kwargs)
+    return interactor(req), writer
+
+
+def _expected(rows, column, value):
+    header_at = rows.index(HEADERS)
+    i = HEADERS.index(column.value)
+    return [r for r in rows[header_at + 1:] if value(r[i])]
+
+
+@pytest.mark.parametrize("vectorized", [False, True])
+def test_streams_matching_rows_after_the_header(vectorized):
+    rows = employee_rows(50)
+    result, writer = _run(rows, request(Columns.POSITION, "  ИНЖЕНЕР "), vectorized=vectorized)
+
+    assert result.success
+    expected = _expected(rows, Columns.POSITION, lambda v: v == "Инженер")
+    required = ProcessExcelInteractor(fs=None, reader=None, writer=None)._required_headers()
+    assert writer.headers == list(required)
+    assert [r[required.index("ФИО")] for r in writer.rows] == [r[1] for r in expected]
+    assert result.metrics.rows_matched == len(expected)
+    assert result.metrics.rows_read == len(rows)
+
+
+def test_salary_and_hire_date_filters():
+    rows = employee_rows(20)
+    result, writer = _run(rows, request(Columns.SALARY, "2000"))
+    assert result.success and len(writer.rows) == len(_expected(rows, Columns.SALARY, lambda v: v == 2000.0))
+
+    result, writer = _run(rows, request(Columns.HIRE_DATE, "02.01.2024"))
+    assert result.success and len(writer.rows) == len(_expected(rows, Columns.HIRE_DATE, lambda v: v.day == 2))
+
+
+@pytest.mark.parametrize("rows, code", [
+    ([], "empty_file"),
+    ([("Отчёт",), ("ФИО",)], "header_not_found"),
+])
+def test_missing_header(rows, code):
+    result, writer = _run(rows, request())
+    assert not result.success and result.error_code == code
+    assert writer.rows is None
+
+
+def test_no_matches_is_reported():
+    result, _ = _run(employee_rows(5), request(Columns.POSITION, "директор"))
+    assert not result.success and result.error_code == "no_matches"
+
+
+def test_read_error_mid_stream():
+    class FailingReader(ListReader):
+        def iter_rows(self, source_path, projection=None, sheet_name=None):
+            yield HEADERS
+            raise RuntimeError("битый архив")
+
+    result = ProcessExcelInteractor(fs=StubFileSystem(), reader=FailingReader([]), writer=ListWriter())(request())
+    assert not result.success and result.error_code == "excel_read_failed"
+
+
+def test_rejects_too_large_source():
+    result, _ = _run(employee_rows(5), request(), max_size_bytes=10)
+    assert not result.success and result.error_code == "too_large"
+
+
+def test_cli_size_limit_rejects_large_sources(tmp_path, capsys):
+    from src.presentation import cli
+
+    source = tmp_path / "big.xlsx"
+    source.write_bytes(b"\0" * (2 * 1024 * 1024))
+    manifest = tmp_path / "jobs.json"
+    manifest.write_text(
+        f'[{{"source": "{source}", "column": "Должность", "value": "x", "target": "{tmp_path / "out.xlsx"}"}}]',
+        encoding="utf-8",
+    )
+    assert cli.main([str(manifest), "--max-size-mb", "1", "--workers", "1", "--json"]) == cli.EXIT_JOB_FAILED
+    assert '"error_code": "too_large"' in capsys.readouterr().out
+    assert cli.run_partition(str(source), Columns.FIO, str(tmp_path / "parts"), max_size_bytes=1024).error_code == "too_large"
+
+
+def test_cancellation():
+    writer = ListWriter()
+    interactor = ProcessExcelInteractor(fs=StubFileSystem(), reader=ListReader(employee_rows(10)), writer=writer)
+    result = interactor(request(), is_cancelled=lambda: True)
+    assert not result.success and result.error_code == "cancelled"
@@ -0,0 +1,83 @@
+from datetime import date, datetime
+
+import pytest
+
+from src.application.dto import Columns
+from src.application.filters import InFilter, RangeFilter, range_key, split_filter_expression
+from src.application.indexes import SortedIndex
+from src.application.interactors.process_excel_interactor import ProcessExcelInteractor
+from tests.fakes import HEADERS, ListReader, ListWriter, StubFileSystem, request
+from tests.filter_cases import CELLS
+
+
+def _parse(column, raw):
+    return ProcessExcelInteractor(fs=None, reader=None, writer=None)._parse_filter_value(column, raw)
+
+
+@pytest.mark.parametrize("raw, expected", [
+    (">0", RangeFilter(low=0.0, include_low=False)),
+    (">=0", RangeFilter(low=0.0)),
+    ("<0", RangeFilter(high=0.0, include_high=False)),
+    ("0..100000", RangeFilter(low=0.0, high=100000.0)),
+    ("..50000,5", RangeFilter(high=50000.5)),
+    ("1000..", RangeFilter(low=1000.0)),
+    ("1000; 2000 ;1000", InFilter((1000.0, 2000.0))),
+])
+def test_salary_expressions(raw, expected):
+    assert _parse(Columns.SALARY, raw) == expected
+
+
+@pytest.mark.parametrize("raw, code", [
+    ("0", "salary_not_positive"),
+    ("-5", "salary_not_positive"),
+    ("100..1", "range_bad_bounds"),
+    ("..", "range_bad_bounds"),
+    (">", "filter_value_missing"),
+    ("1..abc", "salary_not_number"),
+    ("0;1", "salary_not_positive"),
+])
+def test_salary_expression_errors(raw, code):
+    assert _parse(Columns.SALARY, raw).error_code == code
+
+
+def test_hire_date_range_and_text_columns():
+    assert _parse(Columns.HIRE_DATE, "01.01.2024..31.01.2024") == RangeFilter(low=date(2024, 1, 1), high=date(2024, 1, 31))
+    assert _parse(Columns.HIRE_DATE, "31.01.2024..01.01.2024").error_code == "range_bad_bounds"
+    assert _parse(Columns.POSITION, ">0") == ">0"
+    assert split_filter_expression("инженер") is None
+
+
+@pytest.mark.parametrize("column", [Columns.SALARY, Columns.HIRE_DATE])
+@pytest.mark.parametrize("include_low", [True, False])
+@pytest.mark.parametrize("include_high", [True, False])
+def test_sorted_index_matches_range_contains(column, include_low, include_high):
+    cells = list(CELLS) + [datetime(2024, 1, d) for d in (1, 5, 9)] + [0.0, 1000.0, 50000.0]
+    keys = sorted({k for k in (range_key(column, c) for c in cells) if k is not None})
+    index = SortedIndex.build(column, cells)
+    for low in [None, *keys]:
+        for high in [None, *keys]:
+            if low is None and high is None:
+                continue
+            range_filter = RangeFilter(low, high, include_low, include_high)
+            expected = [
+                pos for pos, cell in enumerate(cells)
+                if (key := range_key(column, cell)) is not None and range_filter.contains(key)
+            ]
+            assert index.lookup_range(range_filter) == expected
+
+
+def test_zero_bound_end_to_end():
+    rows = [HEADERS] + [(i, f"С{i}", "Инженер", "Отдел", datetime(2024, 1, 1), salary, None)
+                        for i, salary in enumerate([0, 0.0, 1, 500.5, -3, None, "нет"])]
+    writer = ListWriter()
+    interactor = ProcessExcelInteractor(fs=StubFileSystem(), reader=ListReader(rows), writer=writer)
+    salary_at = interactor._required_headers().index(Columns.SALARY.value)
+
+    assert interactor(request(Columns.SALARY, ">0")).success
+    assert [r[salary_at] for r in writer.rows] == [1, 500.5]
+
+    assert interactor(request(Columns.SALARY, ">=0")).success
+    assert [r[salary_at] for r in writer.rows] == [0, 0.0, 1, 500.5]
+
+    assert interactor(request(Columns.SALARY, "0..1")).success
+    assert [r[salary_at] for r in writer.rows] == [0, 0.0, 1]
@@ -0,0 +1,63 @@
+from datetime import date, datetime
+
+import pytest
+
+from src.application import row_store
+from src.application.row_store import CompactTable
+
+MIXED = [1, 1.0, True, "1", None, datetime(2024, 1, 1), date(2024, 1, 1), 0, False, 0.0, float("nan"), 10**30]
+
+
+def _same(a, b):
+    if isinstance(a, float) and a != a:
+        return isinstance(b, float) and b != b
+    return type(a) is type(b) and a == b
+
+
+def _assert_round_trip(rows, table):
+    assert len(table) == len(rows)
+    for row, view in zip(rows, table):
+        assert len(view) == table.width
+        assert all(_same(a, b) for a, b in zip(row, view))
+    for row, out in zip(rows, table.lists()):
+        assert all(_same(a, b) for a, b in zip(row, out))
+
+
+@pytest.mark.parametrize("chunk_rows", [1, 3, 4096])
+def test_round_trip_keeps_equal_values_of_different_types(monkeypatch, chunk_rows):
+    monkeypatch.setattr(row_store, "BUILD_CHUNK_ROWS", chunk_rows)
+    rows = [(value, i, str(i % 3)) for i, value in enumerate(MIXED * 3)]
+    _assert_round_trip(rows, CompactTable.build(rows, 3))
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        [float(i) for i in range(50)],
+        list(range(50)),
+        [10**30 + i for i in range(50)],
+        ["a", "b"] * 300,
+        [str(i) for i in range(70_000)],
+        [[i] for i in range(5)],
+    ],
+)
+def test_round_trip_for_each_column_encoding(values):
+    rows = [(v,) for v in values]
+    table = CompactTable.build(rows, 1)
+    assert list(table.column(0)) == values
+
+
+def test_short_rows_are_padded_and_long_rows_trimmed():
+    table = CompactTable.build([(1,), (1, 2, 3), ()], 2)
+    assert [list(r) for r in table] == [[1, None], [1, 2], [None, None]]
+
+
+def test_indexing_and_projection():
+    table = CompactTable.build([(i, f"r{i}") for i in range(5)], 2)
+    assert tuple(table[-1]) == (4, "r4")
+    assert table[2][1] == "r2"
+    assert table[1][0:1] == (1,)
+    with pytest.raises(IndexError):
+        table[5]
+    assert list(table.project([4, 0], [1])) == [["r4"], ["r0"]]
+    assert len(CompactTable.build([], 3)) == 0
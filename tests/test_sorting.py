@@ -0,0 +1,101 @@
+import json
+import os
+import random
+from datetime import datetime
+
+import pytest
+
+from src.application import sorting
+from src.application.dto import Columns, ProcessingResultDTO
+from src.application.sorting import ExternalSorter, row_sort_key
+from src.presentation import cli
+
+_RANDOM = random.Random(3)
+ROWS = [
+    (
+        i,
+        _RANDOM.choice([None, 100, 100.0, 2500.5, "нет", 0, -1, "50000"]),
+        _RANDOM.choice([None, datetime(2024, 1, 1 + i % 9), "вчера"]),
+        _RANDOM.choice([None, "б", "А", " а ", "Ё", "в"]),
+    )
+    for i in range(500)
+]
+
+
+def _reference(position, column, descending):
+    key = row_sort_key(column, position, descending)
+    return sorted(ROWS, key=key, reverse=descending)
+
+
+@pytest.mark.parametrize("column, position", [(Columns.SALARY, 1), (Columns.HIRE_DATE, 2), (Columns.FIO, 3)])
+@pytest.mark.parametrize("descending", [False, True])
+@pytest.mark.parametrize("memory_rows", [1000, 7])
+def test_external_sort_matches_stable_sort(tmp_path, column, position, descending, memory_rows):
+    sorter = ExternalSorter(row_sort_key(column, position, descending), descending, memory_rows, str(tmp_path))
+    assert list(sorter.sort(iter(ROWS))) == _reference(position, column, descending)
+    assert (sorter.runs_spilled > 0) == (memory_rows < len(ROWS))
+    assert os.listdir(tmp_path) == []
+
+
+def test_missing_values_sort_last_in_both_directions():
+    for descending in (False, True):
+        key = row_sort_key(Columns.SALARY, 1, descending)
+        ordered = list(ExternalSorter(key, descending, memory_rows=3).sort(iter(ROWS)))
+        salaries = [sorting.range_key(Columns.SALARY, r[1]) for r in ordered]
+        first_missing = salaries.index(None)
+        assert all(s is None for s in salaries[first_missing:])
+
+
+def test_cascaded_merge_bounds_open_files(tmp_path, monkeypatch):
+    monkeypatch.setattr(sorting, "MERGE_FAN_IN", 4)
+    opened = []
+    real_merge = ExternalSorter._merge
+
+    def counting_merge(self, paths):
+        opened.append(len(paths))
+        return real_merge(self, paths)
+
+    monkeypatch.setattr(ExternalSorter, "_merge", counting_merge)
+    sorter = ExternalSorter(row_sort_key(Columns.SALARY, 1), False, memory_rows=5, spill_dir=str(tmp_path))
+    assert list(sorter.sort(iter(ROWS))) == _reference(1, Columns.SALARY, False)
+    assert max(opened) <= 4
+    assert sorter.runs_spilled > len(ROWS) // 5
+    assert os.listdir(tmp_path) == []
+
+
+def test_abandoned_sort_removes_spill_files(tmp_path):
+    sorter = ExternalSorter(row_sort_key(Columns.FIO, 3), False, memory_rows=10, spill_dir=str(tmp_path))
+    rows = sorter.sort(iter(ROWS))
+    next(rows)
+    assert os.listdir(tmp_path)
+    rows.close()
+    assert os.listdir(tmp_path) == []
+
+
+def test_json_summary_serializes_order_by(capsys):
+    job = cli.BatchJob("a.xlsx", Columns.POSITION, "инженер", "b.xlsx", order_by=Columns.SALARY, descending=True)
+    cli._print_summary([job, cli.BatchJob("c.xlsx", Columns.FIO, "x", "d.csv")], [
+        ProcessingResultDTO(True, "ok", output_path="b.xlsx"),
+        ProcessingResultDTO(False, "нет совпадений", error_code="no_matches"),
+    ], as_json=True)
+    payload = json.loads(capsys.readouterr().out)
+    assert [p["order_by"] for p in payload] == [Columns.SALARY.value, None]
+    assert payload[0]["descending"] is True
+
+
+def test_interactor_orders_output_through_spill_files(tmp_path):
+    from src.application.interactors.process_excel_interactor import ProcessExcelInteractor
+    from tests.fakes import ListReader, ListWriter, StubFileSystem, employee_rows, request
+
+    writer = ListWriter()
+    interactor = ProcessExcelInteractor(
+        fs=StubFileSystem(), reader=ListReader(employee_rows(60)), writer=writer,
+        sort_memory_rows=4, sort_spill_dir=str(tmp_path),
+    )
+    result = interactor(request(Columns.POSITION, "инженер", order_by=Columns.SALARY, order_descending=True))
+    salary_at = interactor._required_headers().index(Columns.SALARY.value)
+    salaries = [r[salary_at] for r in writer.rows]
+
+    assert result.success and len(salaries) == 30
+    assert salaries == sorted(salaries, reverse=True)
+    assert os.listdir(tmp_path) == []
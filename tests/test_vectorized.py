@@ -0,0 +1,33 @@
+import random
+
+import pytest
+
+from src.application.vectorized import compile_vectorized_filter
+from tests.fakes import baseline_matches, parsed_request
+from tests.filter_cases import CELLS, RAW_FILTERS
+
+pytest.importorskip("numpy")
+
+CASES = [(column, raw) for column, raws in RAW_FILTERS.items() for raw in raws]
+
+
+def _batches():
+    shuffled = list(CELLS) * 3
+    random.Random(7).shuffle(shuffled)
+    yield list(CELLS)
+    yield shuffled
+    yield [c for c in CELLS if isinstance(c, str)]
+    yield [c for c in CELLS if type(c) in (int, float)]
+    yield [None] * 5
+    yield []
+
+
+@pytest.mark.parametrize("column, raw", CASES, ids=[f"{c.name}:{r}" for c, r in CASES])
+def test_vectorized_positions_match_compare_values(column, raw):
+    req = parsed_request(column, raw)
+    if req is None:
+        pytest.skip("filter value is rejected before matching")
+    engine = compile_vectorized_filter(req)
+    for cells in _batches():
+        expected = [pos for pos, cell in enumerate(cells) if baseline_matches(req, cell)]
+        assert engine.positions(cells) == expected